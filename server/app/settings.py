@@ -22,6 +22,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     "rest_framework",
     "corsheaders",
     "drf_spectacular",
@@ -38,6 +39,7 @@ INSTALLED_APPS = [
     "reward",
     "dao",
     "metrics",
+    "search",
 ]
 
 MIDDLEWARE = [
@@ -157,6 +159,9 @@ CACHES = {
     },
 }
 
+# Application state kept directly in Redis (dirty sets, counters, leaderboards)
+REDIS_URL = f"redis://{ACTUAL_REDIS_HOST}:{ACTUAL_REDIS_PORT}/2"
+
 # Production Security Settings (activated when DEBUG is False)
 if not DEBUG:
     SESSION_COOKIE_SECURE = True
@@ -213,6 +218,23 @@ CELERY_TIMEZONE = TIME_ZONE
 # Celery Beat Settings
 CELERY_BEAT_SCHEDULER = "django_celery_beat.schedulers:DatabaseScheduler"
 
+# Campaign progress is recomputed at most once per window per campaign
+CAMPAIGN_PROGRESS_DEBOUNCE_SECONDS = int(
+    os.environ.get("CAMPAIGN_PROGRESS_DEBOUNCE_SECONDS", "5")
+)
+
+# How long a moderator keeps claimed submissions before they return to the queue
+SUBMISSION_CLAIM_LEASE_SECONDS = int(
+    os.environ.get("SUBMISSION_CLAIM_LEASE_SECONDS", "600")
+)
+
+# Local nginx endpoint that refreshes api_cache entries (e.g. http://nginx:8081);
+# edge purging is disabled when unset
+EDGE_CACHE_PURGE_URL = os.environ.get("EDGE_CACHE_PURGE_URL", "").rstrip("/")
+EDGE_CACHE_PURGE_DELAY_SECONDS = int(
+    os.environ.get("EDGE_CACHE_PURGE_DELAY_SECONDS", "2")
+)
+
 # Web3 Configuration
 INFURA_PROJECT_ID = os.environ.get("INFURA_PROJECT_ID", None)
 WEB3_PROVIDER_URL = f"https://sepolia.infura.io/v3/{INFURA_PROJECT_ID}"
@@ -0,0 +1,18 @@
+"""
+Settings for the test suite. `manage.py test` picks them up on its own and
+pytest through pytest.ini; anything else can opt in with
+DJANGO_SETTINGS_MODULE=app.test_settings.
+"""
+
+import os
+import tempfile
+from .settings import *  # noqa: F401,F403
+from .settings import ACTUAL_REDIS_HOST, ACTUAL_REDIS_PORT, CACHES
+
+# The tests flush the cache and the application state between cases, so they
+# get Redis databases of their own instead of wiping the ones in use
+CACHES["default"]["LOCATION"] = f"redis://{ACTUAL_REDIS_HOST}:{ACTUAL_REDIS_PORT}/3"
+REDIS_URL = f"redis://{ACTUAL_REDIS_HOST}:{ACTUAL_REDIS_PORT}/4"
+
+# Uploaded proofs and images are written outside the repository
+MEDIA_ROOT = os.path.join(tempfile.gettempdir(), "shilldao-test-media")
@@ -16,6 +16,7 @@ draft_urls = [
     path("", include("task.urls")),
     path("", include("submission.urls")),
     path("", include("dao.urls")),
+    path("", include("search.urls")),
 ]
 
 urlpatterns = [
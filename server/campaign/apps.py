@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class CampaignConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "campaign"
+
+    def ready(self):
+        import campaign.signals  # noqa: F401
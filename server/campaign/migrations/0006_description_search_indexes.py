@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-16 23:47
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("campaign", "0005_alter_campaign_progress"),
+        ("dao", "0014_name_search_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="campaign",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass("name", name="gin_trgm_ops"),
+                name="campaign_name_trgm_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="campaign",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.search.SearchVector(
+                    "description", config="english"
+                ),
+                name="campaign_description_fts_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 5.2.18 on 2026-10-16 23:55
+
+from decimal import Decimal
+from django.db import migrations, models
+from django.db.models import F, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+
+
+def backfill_budgets(apps, schema_editor):
+    Campaign = apps.get_model("campaign", "Campaign")
+    Task = apps.get_model("task", "Task")
+    Reward = apps.get_model("reward", "Reward")
+    allocated = (
+        Task.objects.filter(campaign=OuterRef("pk"))
+        .values("campaign")
+        .annotate(total=Sum(F("reward") * F("quantity")))
+        .values("total")
+    )
+    spent = (
+        Reward.objects.filter(submission__task__campaign=OuterRef("pk"))
+        .values("submission__task__campaign")
+        .annotate(total=Sum("reward"))
+        .values("total")
+    )
+    Campaign.objects.update(
+        allocated_budget=Coalesce(Subquery(allocated), Decimal(0)),
+        spent_budget=Coalesce(Subquery(spent), Decimal(0)),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("campaign", "0006_description_search_indexes"),
+        ("task", "0005_description_search_indexes"),
+        ("reward", "0008_reward_unique_reward_per_submission"),
+        ("submission", "0008_submission_status_updated_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="campaign",
+            name="allocated_budget",
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=32),
+        ),
+        migrations.AddField(
+            model_name="campaign",
+            name="spent_budget",
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=32),
+        ),
+        migrations.RunPython(backfill_budgets, migrations.RunPython.noop),
+    ]
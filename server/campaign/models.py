@@ -1,9 +1,55 @@
 import logging
-from django.db import models
+from decimal import Decimal
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVector
+from django.db import connections, models, router
+from django.db.models import (
+    Case,
+    Count,
+    ExpressionWrapper,
+    F,
+    OuterRef,
+    Subquery,
+    Sum,
+    Value,
+    When,
+)
+from django.db.models.functions import Cast, Coalesce, Least, NullIf, Round
+from django.db.models.lookups import Exact
+from django.db.models.sql import UpdateQuery
+from reward.models import Reward
 
 logger = logging.getLogger(__name__)
 
 
+class CampaignManager(models.Manager):
+    def adjust_budgets(self, field, deltas):
+        """Applies {campaign_id: amount} to allocated_budget or spent_budget."""
+        for campaign_id, delta in deltas.items():
+            if campaign_id is not None and delta:
+                self.filter(pk=campaign_id).update(**{field: F(field) + delta})
+
+    def recount_budgets(self) -> int:
+        """Rebuilds the allocated and spent budgets of every campaign from scratch."""
+        Task = self.model._meta.get_field("tasks").related_model
+        allocated = (
+            Task.objects.filter(campaign=OuterRef("pk"))
+            .values("campaign")
+            .annotate(total=Sum(F("reward") * F("quantity")))
+            .values("total")
+        )
+        spent = (
+            Reward.objects.filter(submission__task__campaign=OuterRef("pk"))
+            .values("submission__task__campaign")
+            .annotate(total=Sum("reward"))
+            .values("total")
+        )
+        return self.update(
+            allocated_budget=Coalesce(Subquery(allocated), Decimal(0)),
+            spent_budget=Coalesce(Subquery(spent), Decimal(0)),
+        )
+
+
 class Campaign(models.Model):
     STATUS_CHOICES = [
         (1, "Active"),
@@ -27,39 +73,135 @@ class Campaign(models.Model):
         blank=True,
         related_name="campaigns",
     )
+    # Denormalized so the task budget check is a single locked row read; kept
+    # in sync by the task signals and the reward-issuing grading paths
+    allocated_budget = models.DecimalField(
+        max_digits=32, decimal_places=2, default=0
+    )  # sum of reward * quantity over the campaign's tasks
+    spent_budget = models.DecimalField(
+        max_digits=32, decimal_places=2, default=0
+    )  # sum of rewards issued for the campaign's submissions
     created_at = models.DateTimeField(auto_now_add=True, db_index=True)
 
-    def __str__(self):
-        return f"{self.name}"  # Changed from self.dao_name to self.name
+    BUDGET_COUNTER_FIELDS = ("allocated_budget", "spent_budget")
 
-    def update_progress(self):
-        logger.info(f"Updating progress for Campaign ID: {self.id}, Name: {self.name}")
-        total_tasks_quantity = 0
-        completed_tasks_quantity = 0
+    objects = CampaignManager()
+
+    class Meta:
+        indexes = [
+            # Used by the search endpoint (search.views)
+            GinIndex(
+                OpClass("name", name="gin_trgm_ops"),
+                name="campaign_name_trgm_idx",
+            ),
+            GinIndex(
+                SearchVector("description", config="english"),
+                name="campaign_description_fts_idx",
+            ),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Lets the DAO counter signals tell which DAO a campaign moved away from
+        instance._loaded_dao_id = instance.__dict__.get("dao_id")
+        return instance
 
-        for task in self.tasks.all():
-            total_tasks_quantity += task.quantity
-            # Assuming Submission model has a status field where 2 means 'Approved'
-            approved_submissions_count = task.submissions.filter(status=2).count()
-            completed_tasks_quantity += min(approved_submissions_count, task.quantity)
+    def save(self, *args, **kwargs):
+        if (
+            not self._state.adding
+            and kwargs.get("update_fields") is None
+            and not kwargs.get("force_insert")
+        ):
+            # The budgets are only ever written with F() updates (see
+            # CampaignManager), so a full save must not overwrite them with
+            # stale in-memory values.
+            deferred_fields = self.get_deferred_fields()
+            kwargs["update_fields"] = [
+                field.attname
+                for field in self._meta.concrete_fields
+                if not field.primary_key
+                and field.attname not in deferred_fields
+                and field.name not in self.BUDGET_COUNTER_FIELDS
+            ]
+        super().save(*args, **kwargs)
 
-        if total_tasks_quantity > 0:
-            progress = (completed_tasks_quantity / total_tasks_quantity) * 100
-            self.progress = round(progress, 1)
-        else:
-            self.progress = 0
+    def __str__(self):
+        return f"{self.name}"  # Changed from self.dao_name to self.name
 
+    def update_progress(self):
+        """
+        Recomputes progress from the approved submissions of the campaign's
+        tasks, each capped at its task's quantity, and completes the campaign
+        at 100%. Both are computed and written by a single UPDATE.
+        """
         logger.info(
-            f"Campaign ID: {self.id} - Calculated Progress: {self.progress}, Current Status: {self.status}"
+            "Updating progress for Campaign ID: %s, Name: %s", self.id, self.name
         )
+        Task = self._meta.get_field("tasks").related_model
+        Submission = Task._meta.get_field("submissions").related_model
+        approved = (
+            Submission.objects.filter(task=OuterRef("pk"), status=2)
+            .values("task")
+            .annotate(count=Count("id"))
+            .values("count")
+        )
+        completed = Least(
+            Coalesce(Subquery(approved), 0),
+            F("quantity"),
+            output_field=models.IntegerField(),
+        )
+        task_progress = (
+            Task.objects.filter(campaign=OuterRef("pk"))
+            .values("campaign")
+            .annotate(
+                progress=Round(
+                    ExpressionWrapper(
+                        Cast(
+                            Sum(completed),
+                            models.DecimalField(max_digits=20, decimal_places=4),
+                        )
+                        * 100
+                        / NullIf(Sum("quantity"), 0),
+                        output_field=models.DecimalField(),
+                    ),
+                    1,
+                )
+            )
+            .values("progress")
+        )
+        progress = Coalesce(
+            Subquery(task_progress, output_field=models.DecimalField()), Decimal(0)
+        )
+        query = Campaign.objects.filter(pk=self.pk).query.chain(UpdateQuery)
+        query.add_update_values(
+            {
+                "progress": progress,
+                # Set to 'Completed' once every task is done
+                "status": Case(
+                    When(Exact(progress, 100), then=Value(3)),
+                    default=F("status"),
+                    output_field=self._meta.get_field("status"),
+                ),
+            }
+        )
+        using = self._state.db or router.db_for_write(Campaign, instance=self)
+        connection = connections[using]
+        sql, params = query.get_compiler(using).as_sql()
+        # RETURNING keeps the instance in sync without a second round trip
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"{sql} RETURNING {connection.ops.quote_name('progress')}, "
+                f"{connection.ops.quote_name('status')}",
+                params,
+            )
+            row = cursor.fetchone()
+        if row:
+            self.progress, self.status = row
 
-        if (
-            self.progress == 100 and self.status != 3
-        ):  # Only change if not already completed
-            self.status = 3  # Set status to 'Completed'
-            logger.info(f"Campaign ID: {self.id} - Status changed to Completed (3)")
-
-        self.save(update_fields=["progress", "status"])
         logger.info(
-            f"Campaign ID: {self.id} - Saved. New Progress: {self.progress}, New Status: {self.status}"
+            "Campaign ID: %s - Saved. New Progress: %s, New Status: %s",
+            self.id,
+            self.progress,
+            self.status,
         )
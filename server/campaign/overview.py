@@ -0,0 +1,44 @@
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, OuterRef, Q, Subquery, Sum
+from task.models import Task
+from .models import Campaign
+
+OVERVIEW_CACHE_KEY = "campaign_overview"
+# Writes invalidate the entry; the timeout only bounds a missed invalidation
+OVERVIEW_CACHE_TIMEOUT = 60 * 60
+
+
+def get_campaign_overview():
+    """
+    Campaign counts, total budget and open task count for the campaigns
+    overview, computed in one statement and cached until a campaign or task
+    changes.
+    """
+    overview = cache.get(OVERVIEW_CACHE_KEY)
+    if overview is not None:
+        return overview
+
+    # Summed per campaign rather than joined, which would repeat each budget
+    open_tasks = (
+        Task.objects.filter(campaign=OuterRef("pk"), status=1)
+        .values("campaign")
+        .annotate(count=Count("id"))
+        .values("count")
+    )
+    overview = Campaign.objects.aggregate(
+        active_campaigns=Count("id", filter=Q(status=2)),
+        completed_campaigns=Count("id", filter=Q(status=3)),
+        total_budget=Sum("budget"),
+        total_tasks=Sum(Subquery(open_tasks)),
+    )
+    overview["total_budget"] = overview["total_budget"] or 0
+    overview["total_tasks"] = overview["total_tasks"] or 0
+
+    cache.set(OVERVIEW_CACHE_KEY, overview, timeout=OVERVIEW_CACHE_TIMEOUT)
+    return overview
+
+
+def invalidate_campaign_overview():
+    """Drops the cached overview once the current transaction commits."""
+    transaction.on_commit(lambda: cache.delete(OVERVIEW_CACHE_KEY))
@@ -0,0 +1,66 @@
+import logging
+from django.conf import settings
+from django.db import transaction
+from kombu.exceptions import OperationalError
+from redis.exceptions import RedisError
+from utils.redis_client import get_redis_client
+from .models import Campaign
+
+logger = logging.getLogger(__name__)
+
+DIRTY_CAMPAIGNS_KEY = "campaign_progress:dirty"
+FLUSH_SCHEDULED_KEY = "campaign_progress:flush_scheduled"
+
+
+def schedule_progress_update(campaign_id):
+    """
+    Marks a campaign's progress as stale once the current transaction commits.
+    The actual recomputation runs in a Celery task, at most once per debounce
+    window for any number of writes to the same campaign.
+    """
+    if campaign_id is None:
+        return
+    transaction.on_commit(lambda: _mark_dirty(campaign_id))
+
+
+def _mark_dirty(campaign_id):
+    debounce = settings.CAMPAIGN_PROGRESS_DEBOUNCE_SECONDS
+    try:
+        client = get_redis_client()
+        client.sadd(DIRTY_CAMPAIGNS_KEY, campaign_id)
+        # The flag outlives the window so a lost task cannot block updates forever
+        if client.set(FLUSH_SCHEDULED_KEY, 1, nx=True, ex=debounce * 6):
+            from celery_tasks.tasks import flush_campaign_progress
+
+            try:
+                flush_campaign_progress.apply_async(countdown=debounce)
+            except OperationalError:
+                client.delete(FLUSH_SCHEDULED_KEY)
+                raise
+    except (RedisError, OperationalError) as e:
+        logger.warning(
+            "Could not queue progress update for Campaign ID: %s (%s), updating inline",
+            campaign_id,
+            e,
+        )
+        campaign = Campaign.objects.filter(pk=campaign_id).first()
+        if campaign:
+            campaign.update_progress()
+
+
+def flush_dirty_campaigns(batch_size=500) -> int:
+    """Recomputes progress for every campaign marked dirty. Returns the count."""
+    client = get_redis_client()
+    # Clear the flag first: campaigns marked from now on schedule a new flush,
+    # and anything marked before this point is popped below.
+    client.delete(FLUSH_SCHEDULED_KEY)
+
+    updated = 0
+    while True:
+        campaign_ids = client.spop(DIRTY_CAMPAIGNS_KEY, batch_size)
+        if not campaign_ids:
+            break
+        for campaign in Campaign.objects.filter(pk__in=campaign_ids):
+            campaign.update_progress()
+            updated += 1
+    return updated
@@ -1,7 +1,6 @@
 from rest_framework import serializers
 from .models import Campaign
 from dao.models import DAO
-from django.db.models import Sum
 from task.models import Task
 
 # TODO: ADD FILEVALIDATOR TO USER IMAGE TOO
@@ -17,22 +16,14 @@ class DAOSimpleSerializer(serializers.ModelSerializer):
 
 
 class CampaignOverviewSerializer(serializers.Serializer):
-    active_campaigns = serializers.SerializerMethodField()
-    completed_campaigns = serializers.SerializerMethodField()
-    total_budget = serializers.SerializerMethodField()
-    total_tasks = serializers.SerializerMethodField()
+    """Renders campaign.overview.get_campaign_overview()."""
 
-    def get_active_campaigns(self, obj):
-        return Campaign.objects.filter(status=2).count()
-
-    def get_completed_campaigns(self, obj):
-        return Campaign.objects.filter(status=3).count()
-
-    def get_total_budget(self, obj):
-        return Campaign.objects.aggregate(total=Sum("budget"))["total"] or 0
-
-    def get_total_tasks(self, obj):
-        return Task.objects.filter(status=1).count()
+    active_campaigns = serializers.IntegerField(read_only=True)
+    completed_campaigns = serializers.IntegerField(read_only=True)
+    total_budget = serializers.DecimalField(
+        max_digits=32, decimal_places=2, coerce_to_string=False, read_only=True
+    )
+    total_tasks = serializers.IntegerField(read_only=True)
 
 
 class CampaignSerializer(serializers.ModelSerializer):
@@ -96,6 +87,9 @@ class TaskSimpleSerializer(serializers.ModelSerializer):
         ]
 
     def get_submissions(self, obj):
+        # Annotated by MyCampaignsView's task prefetch
+        if hasattr(obj, "submissions_count"):
+            return obj.submissions_count
         return obj.submissions.count()
 
 
@@ -105,11 +99,11 @@ class MyCampaignsSerializer(CampaignSerializer):
 
     class Meta:
         model = Campaign
-        fields = CampaignSerializer.Meta.fields + ("tasks",)
+        fields = CampaignSerializer.Meta.fields + ("tasks", "spent_budget")
 
     def get_budget(self, obj):
-        total_tasks_cost = sum(task.reward * task.quantity for task in obj.tasks.all())
-        return obj.budget - total_tasks_cost
+        # What is left to allocate to new tasks
+        return obj.budget - obj.allocated_budget
 
     def to_representation(self, instance):
         representation = super().to_representation(instance)
@@ -0,0 +1,33 @@
+from collections import Counter
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from dao.models import DAO
+from utils.conditional import bump_data_version
+from .models import Campaign
+from .overview import invalidate_campaign_overview
+
+
+@receiver(post_save, sender=Campaign)
+@receiver(post_delete, sender=Campaign)
+def bump_campaign_version(sender, instance, **kwargs):
+    bump_data_version("campaign")
+    invalidate_campaign_overview()
+
+
+@receiver(post_save, sender=Campaign)
+def update_dao_campaign_count_on_save(sender, instance, created, **kwargs):
+    """Keeps DAO.campaign_count in sync when a campaign is created or moved."""
+    old_dao_id = None if created else getattr(instance, "_loaded_dao_id", None)
+    if created or (
+        hasattr(instance, "_loaded_dao_id") and old_dao_id != instance.dao_id
+    ):
+        deltas = Counter({instance.dao_id: 1})
+        deltas[old_dao_id] -= 1
+        DAO.objects.adjust_counter("campaign_count", deltas)
+    instance._loaded_dao_id = instance.dao_id
+
+
+@receiver(post_delete, sender=Campaign)
+def update_dao_campaign_count_on_delete(sender, instance, **kwargs):
+    dao_id = getattr(instance, "_loaded_dao_id", instance.dao_id)
+    DAO.objects.adjust_counter("campaign_count", {dao_id: -1})
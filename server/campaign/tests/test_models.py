@@ -7,6 +7,7 @@ from dao.models import DAO
 from task.models import Task
 from submission.models import Submission
 from core.models import User
+from reward.models import Reward
 
 
 class CampaignModelTests(TestCase):
@@ -222,6 +223,23 @@ class CampaignModelTests(TestCase):
         # Rounded to 1 decimal place: 55.6
         self.assertEqual(campaign.progress, Decimal("55.6"))
 
+    def test_update_progress_query_count_independent_of_task_count(self):
+        campaign = Campaign.objects.create(
+            name="Many Tasks", description="D", budget=Decimal("100.00"), dao=self.dao
+        )
+        for i in range(10):
+            task = Task.objects.create(
+                campaign=campaign, description=f"T{i}", type=1, reward=1, quantity=2
+            )
+            Submission.objects.create(
+                task=task, user=self.user, link=f"http://example.com/mt{i}", status=2
+            )
+
+        # Computed and saved by one UPDATE
+        with self.assertNumQueries(1):
+            campaign.update_progress()
+        self.assertEqual(campaign.progress, Decimal("50.0"))
+
     # Add a test to check the field type after the model change
     # def test_budget_field_is_decimal(self):
     #     # This test assumes the budget field in Campaign model has been changed to DecimalField
@@ -240,3 +258,73 @@ class CampaignModelTests(TestCase):
     #         field.decimal_places, 18
     #     )  # Assuming decimal_places based on DAO balance
     #     self.assertEqual(campaign.budget, Decimal("12345.67"))
+
+
+class CampaignBudgetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            eth_address="0x2234567890123456789012345678901234567890"
+        )
+
+    def setUp(self):
+        self.campaign = Campaign.objects.create(
+            name="Budgeted", description="D", budget=Decimal("1000.00")
+        )
+        self.other = Campaign.objects.create(
+            name="Other", description="D", budget=Decimal("1000.00")
+        )
+
+    def allocated(self, campaign):
+        campaign.refresh_from_db()
+        return campaign.allocated_budget
+
+    def test_allocated_budget_follows_task_writes(self):
+        task = Task.objects.create(
+            campaign=self.campaign, description="T", reward=Decimal("10.50"), quantity=4
+        )
+        self.assertEqual(self.allocated(self.campaign), Decimal("42.00"))
+
+        task.quantity = 2
+        task.save()
+        self.assertEqual(self.allocated(self.campaign), Decimal("21.00"))
+
+        # Edited through a fresh instance, and moved to another campaign
+        task = Task.objects.get(pk=task.pk)
+        task.campaign = self.other
+        task.reward = 5
+        task.save()
+        self.assertEqual(self.allocated(self.campaign), Decimal("0.00"))
+        self.assertEqual(self.allocated(self.other), Decimal("10.00"))
+
+        Task.objects.get(pk=task.pk).delete()
+        self.assertEqual(self.allocated(self.other), Decimal("0.00"))
+
+    def test_full_save_keeps_budgets(self):
+        stale = Campaign.objects.get(pk=self.campaign.pk)
+        Task.objects.create(
+            campaign=self.campaign, description="T", reward=10, quantity=3
+        )
+
+        stale.name = "Renamed"
+        stale.save()
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.name, "Renamed")
+        self.assertEqual(self.campaign.allocated_budget, Decimal("30.00"))
+
+    def test_recount_budgets(self):
+        task = Task.objects.create(
+            campaign=self.campaign, description="T", reward=10, quantity=3
+        )
+        submission = Submission.objects.create(
+            task=task, user=self.user, link="http://example.com/s", status=2
+        )
+        Reward.objects.create(reward=10, user=self.user, submission=submission)
+        Campaign.objects.update(allocated_budget=0, spent_budget=5)
+
+        self.assertEqual(Campaign.objects.recount_budgets(), 2)
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.allocated_budget, Decimal("30.00"))
+        self.assertEqual(self.campaign.spent_budget, Decimal("10.00"))
+        self.other.refresh_from_db()
+        self.assertEqual(self.other.spent_budget, Decimal("0.00"))
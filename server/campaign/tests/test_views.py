@@ -3,11 +3,17 @@ from rest_framework import status
 from rest_framework.test import APITestCase
 from decimal import Decimal
 from django.db.models import Sum
+from django.test import override_settings
+from django.core.cache import cache
+from unittest.mock import patch
 
 from campaign.models import Campaign
 from dao.models import DAO
 from task.models import Task
 from core.models import User
+from submission.models import Submission
+from utils.edge_cache import flush_edge_purges
+from utils.redis_client import get_redis_client
 
 
 class CampaignViewTests(APITestCase):
@@ -31,6 +37,8 @@ class CampaignViewTests(APITestCase):
         Task.objects.create(
             campaign=cls.campaign1, description="SIT2", type=1, reward=5, quantity=3
         )
+        # Task signals only queue the recomputation; run it here as the worker would
+        cls.campaign1.update_progress()
 
         cls.campaign2 = Campaign.objects.create(
             name="Summer Drive",
@@ -115,6 +123,10 @@ class CampaignViewTests(APITestCase):
         self.assertEqual(campaign3_data["total_tasks"], 0)
         self.assertEqual(campaign3_data["dao"]["name"], self.dao1.name)
 
+    def setUp(self):
+        # Favorite DAO sets are cached per user id, which repeats across runs
+        cache.clear()
+
     def test_list_campaigns_authenticated_favorite_dao_annotation(self):
         self.client.force_authenticate(user=self.favorite_dao_user)
         response = self.client.get(self.list_url)
@@ -247,6 +259,10 @@ class CampaignOverviewViewTests(APITestCase):
 
         cls.overview_url = reverse("campaigns-overview")  # Corrected URL name
 
+    def setUp(self):
+        # The overview is cached under a fixed key that outlives test runs
+        cache.clear()
+
     def test_get_campaign_overview_statistics(self):
         response = self.client.get(self.overview_url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -264,3 +280,161 @@ class CampaignOverviewViewTests(APITestCase):
         )
         self.assertEqual(Decimal(response.data["total_budget"]), expected_total_budget)
         self.assertEqual(response.data["total_tasks"], expected_total_tasks)
+
+    def test_campaign_overview_is_one_cached_query(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(self.overview_url)
+        self.assertEqual(response.data["total_tasks"], 3)
+
+        with self.assertNumQueries(0):
+            response = self.client.get(self.overview_url)
+        self.assertEqual(response.data["total_budget"], Decimal("5000.00"))
+
+    def test_campaign_overview_invalidated_by_writes(self):
+        self.client.get(self.overview_url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Task.objects.create(
+                campaign=self.campaign_planning1,
+                description="Task Active 3",
+                reward=10,
+                quantity=1,
+            )
+        response = self.client.get(self.overview_url)
+        self.assertEqual(response.data["total_tasks"], 4)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.campaign_active2.status = 3
+            self.campaign_active2.save()
+        response = self.client.get(self.overview_url)
+        self.assertEqual(response.data["active_campaigns"], 1)
+        self.assertEqual(response.data["completed_campaigns"], 2)
+
+        # Taking the last slot closes the task without a save signal
+        with self.captureOnCommitCallbacks(execute=True):
+            task = Task.objects.filter(quantity=1).get()
+            Task.objects.reserve_slot(task.pk)
+        response = self.client.get(self.overview_url)
+        self.assertEqual(response.data["total_tasks"], 3)
+
+    def test_campaign_overview_conditional_get(self):
+        etag = self.client.get(self.overview_url)["ETag"]
+
+        # A matching validator is answered without touching the database
+        with self.assertNumQueries(0):
+            response = self.client.get(self.overview_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Campaign.objects.create(
+                name="New", description="D", budget=Decimal("1.00"), status=2
+            )
+        response = self.client.get(self.overview_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_campaign_overview_edge_cache_headers(self):
+        response = self.client.get(self.overview_url)
+        self.assertIn("public", response["Cache-Control"])
+        self.assertIn("s-maxage=60", response["Cache-Control"])
+        self.assertEqual(response["Surrogate-Key"], "campaign task")
+
+        # Browsable API renderings share the URL but never go to the edge
+        response = self.client.get(self.overview_url, HTTP_ACCEPT="text/html")
+        self.assertIn("private", response["Cache-Control"])
+        self.assertFalse(response.has_header("Surrogate-Key"))
+
+    @override_settings(EDGE_CACHE_PURGE_URL="http://nginx:8081")
+    @patch("utils.edge_cache.requests.get")
+    @patch("celery_tasks.tasks.purge_edge_cache.apply_async")
+    def test_campaign_write_purges_tagged_urls(self, mock_schedule, mock_get):
+        get_redis_client().flushdb()
+        self.client.get(self.overview_url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Campaign.objects.create(
+                name="New", description="D", budget=Decimal("1.00"), status=2
+            )
+        mock_schedule.assert_called_once()
+
+        self.assertEqual(flush_edge_purges(), 1)
+        mock_get.assert_called_once_with(
+            f"http://nginx:8081{self.overview_url}",
+            headers={"Accept": "application/json"},
+            timeout=5,
+        )
+        # Purged URLs are forgotten until they are cached again
+        self.assertEqual(flush_edge_purges(), 0)
+
+    @override_settings(EDGE_CACHE_PURGE_URL="http://nginx:8081")
+    @patch("utils.edge_cache.SURROGATE_KEY_MAX_URLS", 2)
+    @patch("utils.edge_cache.requests.get")
+    @patch("celery_tasks.tasks.purge_edge_cache.apply_async")
+    def test_only_recent_url_variants_are_purged(self, mock_schedule, mock_get):
+        get_redis_client().flushdb()
+        for page_size in (1, 2, 3):
+            self.client.get(self.overview_url, {"page_size": page_size})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Campaign.objects.create(
+                name="New", description="D", budget=Decimal("1.00"), status=2
+            )
+        self.assertEqual(flush_edge_purges(), 2)
+        purged = {call.args[0] for call in mock_get.call_args_list}
+        self.assertEqual(
+            purged,
+            {
+                f"http://nginx:8081{self.overview_url}?page_size=2",
+                f"http://nginx:8081{self.overview_url}?page_size=3",
+            },
+        )
+
+
+class MyCampaignsViewTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user(
+            eth_address="0x1111111111111111111111111111111111111111"
+        )
+        cls.dao = DAO.objects.create(name="Owned DAO", created_by=cls.owner)
+        DAO.objects.create(name="Someone Else's DAO")
+        cls.url = reverse("my-campaigns")
+
+    def add_campaign(self, budget=1000):
+        campaign = Campaign.objects.create(
+            name="Owned", description="D", budget=budget, dao=self.dao
+        )
+        for reward in (10, 20):
+            task = Task.objects.create(
+                campaign=campaign, description="T", reward=reward, quantity=5
+            )
+            Submission.objects.create(
+                task=task, user=self.owner, link="http://example.com/s"
+            )
+        return campaign
+
+    def test_budget_and_submission_counts(self):
+        self.add_campaign()
+        Campaign.objects.create(name="Empty", description="D", budget=300, dao=self.dao)
+        self.client.force_authenticate(self.owner)
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        budgets = {campaign["name"]: campaign["budget"] for campaign in response.data}
+        # 1000 - (10 * 5 + 20 * 5); campaigns without tasks keep their budget
+        self.assertEqual(budgets, {"Owned": Decimal("850"), "Empty": Decimal("300")})
+        owned = next(c for c in response.data if c["name"] == "Owned")
+        self.assertEqual([task["submissions"] for task in owned["tasks"]], [1, 1])
+
+    def test_query_count_does_not_grow_with_campaigns(self):
+        self.client.force_authenticate(self.owner)
+        self.add_campaign()
+        # campaigns with their DAO and allocated budget, then the tasks
+        with self.assertNumQueries(2):
+            self.client.get(self.url)
+
+        for _ in range(3):
+            self.add_campaign()
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url)
+        self.assertEqual(len(response.data), 4)
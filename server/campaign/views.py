@@ -3,6 +3,8 @@ from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
 from rest_framework.views import APIView
 from utils.exception_handler import ErrorHandlingMixin
+from utils.conditional import ConditionalGetMixin
+from utils.edge_cache import EdgeCacheMixin
 from utils.pagination import StandardResultsSetPagination
 from .serializers import (
     CampaignSerializer,
@@ -16,11 +18,14 @@ from drf_spectacular.utils import (
 )
 from drf_spectacular.types import OpenApiTypes
 from .models import Campaign
+from .overview import get_campaign_overview
 from task.models import Task
 from task.serializers import TaskSerializer
+from dao.favorites import get_favorite_dao_ids
 from django.db.models import (
     Count,
     Case,
+    Prefetch,
     When,
     Value,
     BooleanField,
@@ -56,8 +61,12 @@ from rest_framework.permissions import IsAuthenticated
         )
     },
 )
-class CampaignView(ErrorHandlingMixin, generics.ListAPIView):
+class CampaignView(
+    ConditionalGetMixin, EdgeCacheMixin, ErrorHandlingMixin, generics.ListAPIView
+):
     serializer_class = CampaignSerializer
+    etag_versions = ("campaign", "task", "dao", "favorite")
+    surrogate_keys = ("campaign", "task", "dao")
     permission_classes = [AllowAny]
     pagination_class = StandardResultsSetPagination
 
@@ -88,7 +97,7 @@ class CampaignView(ErrorHandlingMixin, generics.ListAPIView):
         user = self.request.user
 
         if user.is_authenticated and hasattr(user, "favorite_daos"):
-            favorite_dao_ids = list(user.favorite_daos.values_list("id", flat=True))
+            favorite_dao_ids = list(get_favorite_dao_ids(self.request))
             queryset = queryset.annotate(
                 is_from_favorite_dao=Case(
                     When(dao_id__in=favorite_dao_ids, then=Value(True)),
@@ -116,12 +125,16 @@ class CampaignView(ErrorHandlingMixin, generics.ListAPIView):
         )
     },
 )
-class CampaignOverviewView(ErrorHandlingMixin, APIView):
+class CampaignOverviewView(
+    ConditionalGetMixin, EdgeCacheMixin, ErrorHandlingMixin, APIView
+):
     permission_classes = [AllowAny]
+    etag_versions = ("campaign", "task")
+    edge_cache_seconds = 60
+    surrogate_keys = ("campaign", "task")
 
     def get(self, request, *args, **kwargs):
-        # The serializer will handle the aggregation
-        serializer = CampaignOverviewSerializer({})  # Pass an empty dictionary as data
+        serializer = CampaignOverviewSerializer(get_campaign_overview())
         return Response(serializer.data, status=status.HTTP_200_OK)
 
 
@@ -146,9 +159,10 @@ class CampaignOverviewView(ErrorHandlingMixin, APIView):
         404: OpenApiResponse(description="Campaign not found."),
     },
 )
-class CampaignTasksView(ErrorHandlingMixin, generics.ListAPIView):
+class CampaignTasksView(EdgeCacheMixin, ErrorHandlingMixin, generics.ListAPIView):
     serializer_class = TaskSerializer
     permission_classes = [AllowAny]
+    surrogate_keys = ("task", "submission", "campaign", "dao")
 
     def get_queryset(self):
         campaign_id = self.kwargs.get("campaign_id")
@@ -167,4 +181,10 @@ class MyCampaignsView(ErrorHandlingMixin, generics.ListAPIView):
     permission_classes = [IsAuthenticated]
 
     def get_queryset(self):
-        return Campaign.objects.filter(dao__created_by=self.request.user)
+        # A fixed number of queries however many campaigns and tasks there are
+        tasks = Task.objects.annotate(submissions_count=Count("submissions"))
+        return (
+            Campaign.objects.filter(dao__created_by=self.request.user)
+            .select_related("dao")
+            .prefetch_related(Prefetch("tasks", queryset=tasks))
+        )
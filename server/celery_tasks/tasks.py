@@ -6,6 +6,12 @@ from decimal import Decimal
 from web3 import Web3
 from dotenv import load_dotenv
 from logging_config import logger
+from core.models import User
+from campaign.progress import flush_dirty_campaigns
+from submission.totals import reconcile_status_totals
+from metrics.leaderboard import rebuild_leaderboard
+from metrics.rollups import rollup_daily_activity, rollup_user_daily_stats
+from utils.edge_cache import flush_edge_purges
 
 load_dotenv()
 
@@ -105,3 +111,51 @@ def fetch_shill_price():
     except Exception as e:
         print(f"❌ Error calculating Shill token price: {e}")
         return
+
+
+@shared_task
+def recompute_user_tiers():
+    """Periodic reconciliation of user submission counters, tiers and the leaderboard."""
+    updated = User.objects.recompute_tiers()
+    logger.info("Recomputed user tiers, %s users updated", updated)
+    # The leaderboard is derived from the counters that were just reconciled
+    ranked = rebuild_leaderboard()
+    logger.info("Rebuilt leaderboard with %s ranked users", ranked)
+    return updated
+
+
+@shared_task
+def flush_campaign_progress():
+    """Debounced recomputation of campaigns marked dirty by submission/task writes."""
+    updated = flush_dirty_campaigns()
+    logger.info("Recomputed progress for %s campaigns", updated)
+    return updated
+
+
+@shared_task
+def purge_edge_cache():
+    """Debounced refresh of nginx cache entries tagged with changed surrogate keys."""
+    purged = flush_edge_purges()
+    logger.info("Purged %s edge cache entries", purged)
+    return purged
+
+
+@shared_task
+def reconcile_submission_totals():
+    """Periodic correction of drift in the Redis submission status totals."""
+    totals = reconcile_status_totals()
+    logger.info("Reconciled submission totals: %s", totals)
+    return totals
+
+
+@shared_task
+def rollup_daily_stats():
+    """Refreshes the recent days of the per-user and platform-wide daily rollups."""
+    written = rollup_user_daily_stats()
+    days = rollup_daily_activity()
+    logger.info(
+        "Rolled up daily stats, %s user rows and %s activity rows written",
+        written,
+        days,
+    )
+    return written
@@ -1,33 +1,56 @@
 from django.core.management.base import BaseCommand
 from django_celery_beat.models import PeriodicTask, IntervalSchedule
 
+# (name, task path, every, period)
+PERIODIC_TASKS = [
+    (
+        "Fetch Shill Price",
+        "celery_tasks.tasks.fetch_shill_price",
+        1,
+        IntervalSchedule.MINUTES,
+    ),
+    (
+        "Recompute User Tiers",
+        "celery_tasks.tasks.recompute_user_tiers",
+        1,
+        IntervalSchedule.HOURS,
+    ),
+    (
+        "Reconcile Submission Totals",
+        "celery_tasks.tasks.reconcile_submission_totals",
+        10,
+        IntervalSchedule.MINUTES,
+    ),
+    (
+        "Roll Up Daily Stats",
+        "celery_tasks.tasks.rollup_daily_stats",
+        15,
+        IntervalSchedule.MINUTES,
+    ),
+]
+
 
 class Command(BaseCommand):
-    help = "Creates a periodic task to fetch the SHILL price every minute"
+    help = (
+        "Creates the periodic tasks that fetch the SHILL price, recompute user "
+        "tiers, reconcile submission totals and roll up daily stats"
+    )
 
     def handle(self, *args, **options):
-        # Create or get the interval schedule (1 minute)
-        schedule, created = IntervalSchedule.objects.get_or_create(
-            every=1,
-            period=IntervalSchedule.MINUTES,
-        )
-
-        # Create the periodic task if it doesn't exist
-        task, created = PeriodicTask.objects.get_or_create(
-            interval=schedule,
-            name="Fetch Shill Price",  # Updated name
-            task="celery_tasks.tasks.fetch_shill_price",  # Updated task path
-        )
-
-        if created:
-            self.stdout.write(
-                self.style.SUCCESS(
-                    "Successfully created periodic task to fetch Shill price every minute."  # Updated message
-                )
+        for name, task, every, period in PERIODIC_TASKS:
+            schedule, _ = IntervalSchedule.objects.get_or_create(
+                every=every, period=period
             )
-        else:
-            self.stdout.write(
-                self.style.SUCCESS(
-                    "Periodic task to fetch Shill price already exists."
-                )  # Updated message
+            _, created = PeriodicTask.objects.get_or_create(
+                interval=schedule, name=name, task=task
             )
+            if created:
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        f"Created periodic task '{name}' (every {every} {period})."
+                    )
+                )
+            else:
+                self.stdout.write(
+                    self.style.SUCCESS(f"Periodic task '{name}' already exists.")
+                )
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+from metrics.leaderboard import rebuild_leaderboard
+
+
+class Command(BaseCommand):
+    help = "Rebuilds the Redis top shillers leaderboard from user approval counters"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="Number of users written to Redis per ZADD.",
+        )
+
+    def handle(self, *args, **options):
+        ranked = rebuild_leaderboard(batch_size=options["batch_size"])
+        self.stdout.write(
+            self.style.SUCCESS(f"Rebuilt leaderboard with {ranked} ranked users.")
+        )
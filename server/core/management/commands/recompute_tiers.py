@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+from core.models import User
+
+
+class Command(BaseCommand):
+    help = "Recomputes submission counters and tiers for all users in bulk"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of users written per bulk update.",
+        )
+
+    def handle(self, *args, **options):
+        updated = User.objects.recompute_tiers(batch_size=options["batch_size"])
+        self.stdout.write(
+            self.style.SUCCESS(f"Recomputed tiers, {updated} users updated.")
+        )
@@ -0,0 +1,10 @@
+from django.core.management.base import BaseCommand
+from campaign.models import Campaign
+
+
+class Command(BaseCommand):
+    help = "Recomputes the denormalized allocated and spent budgets of every campaign"
+
+    def handle(self, *args, **options):
+        updated = Campaign.objects.recount_budgets()
+        self.stdout.write(self.style.SUCCESS(f"Recounted {updated} campaigns."))
@@ -0,0 +1,10 @@
+from django.core.management.base import BaseCommand
+from dao.models import DAO
+
+
+class Command(BaseCommand):
+    help = "Recomputes the denormalized campaign and favorite counters of every DAO"
+
+    def handle(self, *args, **options):
+        updated = DAO.objects.recount()
+        self.stdout.write(self.style.SUCCESS(f"Recounted {updated} DAOs."))
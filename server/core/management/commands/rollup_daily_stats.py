@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+from metrics.rollups import rollup_daily_activity, rollup_user_daily_stats
+
+
+class Command(BaseCommand):
+    help = "Rebuilds the daily metrics rollups for the trailing number of days"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=2,
+            help="Number of trailing days (including today) to rebuild; use a large value to backfill.",
+        )
+
+    def handle(self, *args, **options):
+        written = rollup_user_daily_stats(days=options["days"])
+        days = rollup_daily_activity(days=options["days"])
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Rolled up daily stats, {written} user rows and {days} activity rows written."
+            )
+        )
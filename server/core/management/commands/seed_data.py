@@ -554,22 +554,17 @@ class Command(BaseCommand):
         self.stdout.write(
             self.style.SUCCESS(f"Successfully seeded {len(rewards_list)} Rewards.")
         )
+        # Rewards above are created directly, not through grading
+        Campaign.objects.recount_budgets()
 
         # --- Update User Tiers ---
         self.stdout.write("Updating User Tiers based on new submissions...")
-        updated_user_tier_count = 0
         if users:  # Ensure users list is not empty
-            for user_obj in users:
-                try:
-                    # The User model's save() method should call determine_actual_tier_id
-                    user_obj.save()
-                    updated_user_tier_count += 1
-                except Exception as e:
-                    self.stderr.write(
-                        self.style.ERROR(
-                            f"Error updating tier for user {user_obj.id}: {e}"
-                        )
-                    )
+            # Submission counters were kept up to date by the submission signals,
+            # so tiers can be re-evaluated without scanning submissions again.
+            updated_user_tier_count = User.objects.refresh_tiers(
+                [user_obj.id for user_obj in users]
+            )
             self.stdout.write(
                 self.style.SUCCESS(
                     f"Successfully updated tiers for {updated_user_tier_count} Users."
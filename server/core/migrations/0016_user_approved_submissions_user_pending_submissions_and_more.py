@@ -0,0 +1,63 @@
+# Generated by Django 5.2.18 on 2026-10-16 23:06
+
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+
+def backfill_submission_counters(apps, schema_editor):
+    User = apps.get_model("core", "User")
+    Submission = apps.get_model("submission", "Submission")
+
+    counts = (
+        Submission.objects.filter(user__isnull=False)
+        .values("user_id")
+        .annotate(
+            total=Count("id"),
+            pending=Count("id", filter=Q(status=1)),
+            approved=Count("id", filter=Q(status=2)),
+            rejected=Count("id", filter=Q(status=3)),
+        )
+        .order_by()
+    )
+    for row in counts.iterator():
+        User.objects.filter(pk=row["user_id"]).update(
+            total_submissions=row["total"],
+            pending_submissions=row["pending"],
+            approved_submissions=row["approved"],
+            rejected_submissions=row["rejected"],
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0015_alter_user_username"),
+        (
+            "submission",
+            "0005_alter_submission_created_at_alter_submission_link_and_more",
+        ),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="user",
+            name="approved_submissions",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="user",
+            name="pending_submissions",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="user",
+            name="rejected_submissions",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="user",
+            name="total_submissions",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_submission_counters, migrations.RunPython.noop),
+    ]
@@ -1,14 +1,98 @@
-from django.db import models
+from django.db import models, transaction
 from django.contrib.auth.models import (
     AbstractBaseUser,
     BaseUserManager,
     PermissionsMixin,
 )
 from django.core.validators import FileExtensionValidator
-from django.db.models import Sum
+from django.db.models import Count, Q, Sum
+from utils.conditional import bump_data_version
 
 
 class UserManager(BaseUserManager):
+    def refresh_tiers(self, user_ids) -> int:
+        """Re-evaluates tiers from the stored submission counters.
+
+        Only rows whose tier actually changed are written. Returns the number of
+        users whose tier was updated.
+        """
+        users = list(
+            self.filter(pk__in=list(user_ids)).only(
+                "tier", *self.model.SUBMISSION_COUNTER_FIELDS
+            )
+        )
+        changed = []
+        for user in users:
+            tier = user.determine_actual_tier_id()
+            if tier != user.tier:
+                user.tier = tier
+                changed.append(user)
+
+        if changed:
+            self.bulk_update(changed, ["tier"])
+            bump_data_version("user")
+        return len(changed)
+
+    def recompute_tiers(self, batch_size: int = 1000) -> int:
+        """Rebuilds submission counters and tiers for every user in bulk.
+
+        Users are processed in batches of `batch_size`. Each batch is locked with
+        SELECT ... FOR UPDATE and counted with one grouped aggregate inside the
+        same transaction, so F() increments committed meanwhile are either
+        counted or wait for the batch to be written. Only users whose counters or
+        tier differ from the stored values are written. Returns the number of
+        users updated.
+        """
+        Submission = self.model._meta.get_field("submissions").related_model
+        fields = ["tier", *self.model.SUBMISSION_COUNTER_FIELDS]
+
+        updated = 0
+        last_pk = None
+        while True:
+            batch = self.order_by("pk")
+            if last_pk is not None:
+                batch = batch.filter(pk__gt=last_pk)
+            pks = list(batch.values_list("pk", flat=True)[:batch_size])
+            if not pks:
+                break
+            last_pk = pks[-1]
+
+            with transaction.atomic():
+                users = list(
+                    self.select_for_update()
+                    .filter(pk__in=pks)
+                    .only(*fields)
+                    .order_by("pk")
+                )
+                counts = {
+                    row["user_id"]: row
+                    for row in Submission.objects.filter(user_id__in=pks)
+                    .values("user_id")
+                    .annotate(
+                        total_submissions=Count("id"),
+                        pending_submissions=Count("id", filter=Q(status=1)),
+                        approved_submissions=Count("id", filter=Q(status=2)),
+                        rejected_submissions=Count("id", filter=Q(status=3)),
+                    )
+                    .order_by()
+                }
+                changed = []
+                for user in users:
+                    row = counts.get(user.pk, {})
+                    stored = [getattr(user, field) for field in fields]
+                    for field in self.model.SUBMISSION_COUNTER_FIELDS:
+                        setattr(user, field, row.get(field, 0))
+                    user.tier = user.determine_actual_tier_id()
+                    if [getattr(user, field) for field in fields] != stored:
+                        changed.append(user)
+                if changed:
+                    self.bulk_update(changed, fields)
+                    updated += len(changed)
+
+        if updated:
+            bump_data_version("user")
+        return updated
+
     def create_user(
         self,
         username: str = None,
@@ -90,6 +174,19 @@ class User(AbstractBaseUser, PermissionsMixin):
         "dao.DAO", related_name="favorited_by_users", blank=True
     )
 
+    # Denormalized submission counters, maintained by submission.counters
+    total_submissions = models.PositiveIntegerField(default=0)
+    pending_submissions = models.PositiveIntegerField(default=0)
+    approved_submissions = models.PositiveIntegerField(default=0)
+    rejected_submissions = models.PositiveIntegerField(default=0)
+
+    SUBMISSION_COUNTER_FIELDS = (
+        "total_submissions",
+        "pending_submissions",
+        "approved_submissions",
+        "rejected_submissions",
+    )
+
     USERNAME_FIELD = "username"
     REQUIRED_FIELDS = []
 
@@ -98,29 +195,34 @@ class User(AbstractBaseUser, PermissionsMixin):
     def save(self, *args, **kwargs):
         if self.username:
             self.username = self.username.lower()
-        # Calculate tier only if the instance is already saved (has a pk)
-        # or if it's being updated. For new instances, tier will be default.
-        if self.pk:  # Only calculate for existing users being updated
-            self.tier = self.determine_actual_tier_id()
+        if self.pk:
+            if kwargs.get("update_fields") is None and not kwargs.get("force_insert"):
+                # The submission counters are only ever written with F() updates,
+                # and the tier derived from them by UserManager.refresh_tiers, so
+                # a full save must not overwrite them with stale in-memory values.
+                deferred_fields = self.get_deferred_fields()
+                kwargs["update_fields"] = [
+                    field.attname
+                    for field in self._meta.concrete_fields
+                    if not field.primary_key
+                    and field.attname not in deferred_fields
+                    and field.name not in self.SUBMISSION_COUNTER_FIELDS
+                    and field.name != "tier"
+                ]
         super().save(*args, **kwargs)
 
     def __str__(self) -> str:
         return self.username if self.username else self.eth_address
 
     def determine_actual_tier_id(self) -> int:
-        """Determines the user's current tier ID based on submissions."""
-        try:
-            # Use .all() to ensure the QuerySet is evaluated if submissions is a reverse manager
-            submissions_qs = self.submissions.all()
-            approved_submissions_count = sum(
-                1 for s in submissions_qs if s.status == 2
-            )  # Approved status is 2
-            total_submissions_count = len(submissions_qs)
-        except AttributeError:
-            # This might happen if 'submissions' related_name is not set up or accessible
-            # Or if self is a new instance not yet saved (though self.pk check should prevent this)
-            return 1  # Default to Bronze
-
+        """Determines the user's current tier ID from the stored submission counters."""
+        return self.tier_for_counts(self.approved_submissions, self.total_submissions)
+
+    @staticmethod
+    def tier_for_counts(
+        approved_submissions_count: int, total_submissions_count: int
+    ) -> int:
+        """Maps approved/total submission counts to a tier ID."""
         if total_submissions_count == 0:
             return 1  # Bronze if no submissions
 
@@ -140,12 +242,8 @@ class User(AbstractBaseUser, PermissionsMixin):
 
     def get_progress_to_next_tier_percentage(self) -> int:
         """Calculates percentage progress toward the next tier."""
-        try:
-            submissions_qs = self.submissions.all()
-            approved = sum(1 for s in submissions_qs if s.status == 2)
-            total = len(submissions_qs)
-        except AttributeError:
-            return 0  # Default to 0% progress if submissions cannot be accessed
+        approved = self.approved_submissions
+        total = self.total_submissions
 
         current_tier_id = (
             self.tier
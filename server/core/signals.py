@@ -0,0 +1,19 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from utils.conditional import bump_data_version
+from .models import User
+
+# The "user" data version covers tiers and submission counters, not profile data
+VERSIONED_FIELDS = frozenset(("tier", *User.SUBMISSION_COUNTER_FIELDS))
+
+
+@receiver(post_save, sender=User)
+def bump_user_version(sender, instance, created, update_fields, **kwargs):
+    # Full saves of existing users leave tier and counters out (see User.save)
+    if created or (update_fields and not VERSIONED_FIELDS.isdisjoint(update_fields)):
+        bump_data_version("user")
+
+
+@receiver(post_delete, sender=User)
+def bump_user_version_on_delete(sender, instance, **kwargs):
+    bump_data_version("user")
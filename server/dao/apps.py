@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class DaoConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'dao'
+
+    def ready(self):
+        import dao.signals  # noqa: F401
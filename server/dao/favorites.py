@@ -0,0 +1,52 @@
+from django.core.cache import cache
+from django.db import transaction
+from core.models import User
+
+FAVORITES_KEY = "favorite_daos:{user_id}"
+FAVORITES_VERSION_KEY = "favorite_daos_version:{user_id}"
+FAVORITES_TIMEOUT = 60 * 60
+
+
+def get_favorite_dao_ids(request) -> frozenset:
+    """
+    Ids of the DAOs the requesting user has favorited.
+
+    Loaded at most once per request and cached under the user's favorites
+    version, so a stale set can never be read back after a toggle.
+    """
+    ids = getattr(request, "_favorite_dao_ids", None)
+    if ids is not None:
+        return ids
+
+    user = getattr(request, "user", None)
+    if user is None or not user.is_authenticated:
+        ids = frozenset()
+    else:
+        key = FAVORITES_KEY.format(user_id=user.pk)
+        version = cache.get(FAVORITES_VERSION_KEY.format(user_id=user.pk), 1)
+        ids = cache.get(key, version=version)
+        if ids is None:
+            ids = frozenset(
+                User.favorite_daos.through.objects.filter(user_id=user.pk).values_list(
+                    "dao_id", flat=True
+                )
+            )
+            cache.set(key, ids, FAVORITES_TIMEOUT, version=version)
+
+    request._favorite_dao_ids = ids
+    return ids
+
+
+def bump_favorites_version(user_ids):
+    """Invalidates the cached favorite sets of `user_ids` once the transaction commits."""
+    transaction.on_commit(lambda: _incr_versions(user_ids))
+
+
+def _incr_versions(user_ids):
+    for user_id in user_ids:
+        key = FAVORITES_VERSION_KEY.format(user_id=user_id)
+        try:
+            cache.incr(key)
+        except ValueError:
+            # First bump; readers have been using the default version 1
+            cache.set(key, 2, None)
@@ -0,0 +1,75 @@
+# Generated by Django 5.2.18 on 2026-10-16 23:42
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_counters(apps, schema_editor):
+    DAO = apps.get_model("dao", "DAO")
+    Campaign = apps.get_model("campaign", "Campaign")
+    User = apps.get_model(*settings.AUTH_USER_MODEL.split("."))
+    Favorite = User.favorite_daos.through
+    campaign_count = (
+        Campaign.objects.filter(dao=OuterRef("pk"))
+        .values("dao")
+        .annotate(count=Count("id"))
+        .values("count")
+    )
+    favorites_count = (
+        Favorite.objects.filter(dao=OuterRef("pk"))
+        .values("dao")
+        .annotate(count=Count("id"))
+        .values("count")
+    )
+    DAO.objects.update(
+        campaign_count=Coalesce(Subquery(campaign_count), 0),
+        favorites_count=Coalesce(Subquery(favorites_count), 0),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("dao", "0012_remove_dao_token"),
+        ("campaign", "0005_alter_campaign_progress"),
+        ("core", "0014_user_favorite_daos"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="dao",
+            name="campaign_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="dao",
+            name="favorites_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="dao",
+            index=models.Index(
+                condition=models.Q(("campaign_count__gt", 0)),
+                fields=["-created_at"],
+                name="dao_listed_created_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="dao",
+            index=models.Index(
+                condition=models.Q(("campaign_count__gt", 0)),
+                fields=["-favorites_count", "-created_at"],
+                name="dao_listed_popular_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="dao",
+            index=models.Index(
+                fields=["-campaign_count", "-created_at"], name="dao_most_active_idx"
+            ),
+        ),
+    ]
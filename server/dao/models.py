@@ -1,8 +1,40 @@
 from django.db import models
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.core.validators import FileExtensionValidator
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce, Greatest, Upper
 from submission.models import validate_image_size
 
 
+class DAOManager(models.Manager):
+    def adjust_counter(self, field, deltas):
+        """Applies {dao_id: delta} to a counter column without going below zero."""
+        for dao_id, delta in deltas.items():
+            if dao_id is not None and delta:
+                self.filter(pk=dao_id).update(**{field: Greatest(F(field) + delta, 0)})
+
+    def recount(self) -> int:
+        """Rebuilds the campaign and favorite counters of every DAO from scratch."""
+        Campaign = self.model._meta.get_field("campaigns").related_model
+        Favorite = self.model._meta.get_field("favorited_by_users").through
+        campaign_count = (
+            Campaign.objects.filter(dao=OuterRef("pk"))
+            .values("dao")
+            .annotate(count=Count("id"))
+            .values("count")
+        )
+        favorites_count = (
+            Favorite.objects.filter(dao=OuterRef("pk"))
+            .values("dao")
+            .annotate(count=Count("id"))
+            .values("count")
+        )
+        return self.update(
+            campaign_count=Coalesce(Subquery(campaign_count), 0),
+            favorites_count=Coalesce(Subquery(favorites_count), 0),
+        )
+
+
 class DAO(models.Model):
     NETWORK_CHOICES = [
         (0, "ethereum"),
@@ -39,4 +71,40 @@ class DAO(models.Model):
     balance = models.DecimalField(max_digits=40, decimal_places=18, null=True)
     social_links = models.JSONField(blank=True, default=dict)
 
+    # Denormalized for explorer filtering and ordering; kept in sync by the
+    # campaign signals and the favorites m2m signal
+    campaign_count = models.PositiveIntegerField(default=0)
+    favorites_count = models.PositiveIntegerField(default=0)
+
     created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    objects = DAOManager()
+
+    class Meta:
+        indexes = [
+            # Explorer listings only show DAOs with campaigns
+            models.Index(
+                fields=["-created_at"],
+                condition=models.Q(campaign_count__gt=0),
+                name="dao_listed_created_idx",
+            ),
+            models.Index(
+                fields=["-favorites_count", "-created_at"],
+                condition=models.Q(campaign_count__gt=0),
+                name="dao_listed_popular_idx",
+            ),
+            models.Index(
+                fields=["-campaign_count", "-created_at"],
+                name="dao_most_active_idx",
+            ),
+            # Trigram indexes: word similarity for the search endpoint, and the
+            # explorer's `name__icontains` filter, which compiles to UPPER(name) LIKE
+            GinIndex(
+                OpClass("name", name="gin_trgm_ops"),
+                name="dao_name_trgm_idx",
+            ),
+            GinIndex(
+                OpClass(Upper("name"), name="gin_trgm_ops"),
+                name="dao_name_upper_trgm_idx",
+            ),
+        ]
@@ -2,6 +2,7 @@ from rest_framework import serializers
 from .models import DAO
 from campaign.models import Campaign
 from .network_validator import validate_network
+from .favorites import get_favorite_dao_ids
 
 
 class CampaignSimpleSerializer(serializers.ModelSerializer):
@@ -58,14 +59,9 @@ class DAOExplorerSerializer(serializers.ModelSerializer):
 
     def get_is_favorited(self, obj):
         request = self.context.get("request")
-        if (
-            request
-            and hasattr(request, "user")
-            and request.user
-            and request.user.is_authenticated
-        ):
-            return request.user.favorite_daos.filter(pk=obj.pk).exists()
-        return False
+        if request is None:
+            return False
+        return obj.pk in get_favorite_dao_ids(request)
 
     def create(self, validated_data):
         request = self.context.get("request")
@@ -98,6 +94,30 @@ class DAOExplorerSerializer(serializers.ModelSerializer):
         return representation
 
 
+class CampaignCardSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Campaign
+        fields = ["id", "name", "status", "progress"]
+        read_only_fields = fields
+
+
+class DAOCardSerializer(DAOExplorerSerializer):
+    """
+    Explorer card: the DAO with only its latest campaigns, prefetched into
+    `latest_campaigns`, and the total in `campaign_count`.
+    """
+
+    campaigns = CampaignCardSerializer(
+        source="latest_campaigns", many=True, read_only=True
+    )
+
+    class Meta(DAOExplorerSerializer.Meta):
+        fields = DAOExplorerSerializer.Meta.fields + ["campaign_count"]
+        read_only_fields = DAOExplorerSerializer.Meta.read_only_fields + [
+            "campaign_count"
+        ]
+
+
 class MyDAOsSerializer(DAOExplorerSerializer):
     class Meta:
         model = DAO
@@ -0,0 +1,65 @@
+from collections import Counter
+from django.db.models.signals import post_save, post_delete, pre_delete, m2m_changed
+from django.dispatch import receiver
+from core.models import User
+from utils.conditional import bump_data_version
+from .models import DAO
+from .favorites import bump_favorites_version
+
+
+@receiver(post_save, sender=DAO)
+@receiver(post_delete, sender=DAO)
+def bump_dao_version(sender, instance, **kwargs):
+    bump_data_version("dao")
+
+
+@receiver(m2m_changed, sender=User.favorite_daos.through)
+def update_favorites(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Keeps DAO.favorites_count, the favorite data version and the affected
+    users' cached favorite sets in sync with the favorites m2m, whichever side
+    it is changed from.
+    """
+    owner, other = ("dao", "user") if reverse else ("user", "dao")
+    if action in ("pre_remove", "pre_clear"):
+        # Django reports removals as requested, so remember the links that
+        # actually exist before they go
+        links = sender.objects.filter(**{owner: instance})
+        if action == "pre_remove":
+            links = links.filter(**{f"{other}_id__in": pk_set})
+        instance._removed_favorites = list(links.values_list("user_id", "dao_id"))
+        return
+
+    if action == "post_add":
+        # pk_set only contains links that were actually created
+        links = [(pk, instance.pk) if reverse else (instance.pk, pk) for pk in pk_set]
+        delta = 1
+    elif action in ("post_remove", "post_clear"):
+        links = instance.__dict__.pop("_removed_favorites", [])
+        delta = -1
+    else:
+        return
+    if not links:
+        return
+
+    deltas = Counter()
+    for _, dao_id in links:
+        deltas[dao_id] += delta
+    DAO.objects.adjust_counter("favorites_count", deltas)
+    bump_data_version("favorite")
+    bump_favorites_version({user_id for user_id, _ in links})
+
+
+@receiver(pre_delete, sender=User)
+def release_favorites_of_deleted_user(sender, instance, **kwargs):
+    """
+    Deleting a user cascades to their favorite links without m2m_changed, so the
+    favorites_count of the DAOs they favorited is decremented here instead.
+    """
+    dao_ids = User.favorite_daos.through.objects.filter(user=instance).values_list(
+        "dao_id", flat=True
+    )
+    deltas = {dao_id: -1 for dao_id in dao_ids}
+    if deltas:
+        DAO.objects.adjust_counter("favorites_count", deltas)
+        bump_data_version("favorite")
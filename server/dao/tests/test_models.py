@@ -2,6 +2,7 @@ from django.test import TestCase
 from django.core.exceptions import ValidationError
 from django.contrib.auth import get_user_model
 from dao.models import DAO
+from campaign.models import Campaign
 from django.core.files.uploadedfile import SimpleUploadedFile
 from unittest.mock import patch
 
@@ -211,3 +212,67 @@ class DAOModelTests(TestCase):
             "'balance': ['Ensure that there are no more than 18 decimal places.']",
             str(cm.exception),
         )
+
+
+class DAOCounterTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(eth_address="0xCounterUser1")
+        self.other_user = User.objects.create_user(eth_address="0xCounterUser2")
+        self.dao = DAO.objects.create(name="Counted DAO", network=0)
+        self.other_dao = DAO.objects.create(name="Other DAO", network=0)
+
+    def assertCounters(self, dao, campaign_count, favorites_count):
+        dao.refresh_from_db()
+        self.assertEqual(dao.campaign_count, campaign_count)
+        self.assertEqual(dao.favorites_count, favorites_count)
+
+    def test_campaign_count_follows_campaign_writes(self):
+        campaign = Campaign.objects.create(
+            name="C1", description="D", budget=100, dao=self.dao
+        )
+        Campaign.objects.create(name="C2", description="D", budget=100, dao=self.dao)
+        self.assertCounters(self.dao, 2, 0)
+
+        campaign = Campaign.objects.get(pk=campaign.pk)
+        campaign.dao = self.other_dao
+        campaign.save()
+        self.assertCounters(self.dao, 1, 0)
+        self.assertCounters(self.other_dao, 1, 0)
+
+        campaign.delete()
+        self.assertCounters(self.other_dao, 0, 0)
+
+    def test_favorites_count_follows_both_sides_of_the_relation(self):
+        self.user.favorite_daos.add(self.dao, self.other_dao)
+        self.dao.favorited_by_users.add(self.other_user)
+        self.user.favorite_daos.add(self.dao)  # already a favorite
+        self.assertCounters(self.dao, 0, 2)
+        self.assertCounters(self.other_dao, 0, 1)
+
+        # Removing a link that doesn't exist changes nothing
+        self.other_user.favorite_daos.remove(self.other_dao)
+        self.assertCounters(self.other_dao, 0, 1)
+
+        self.user.favorite_daos.clear()
+        self.assertCounters(self.dao, 0, 1)
+        self.assertCounters(self.other_dao, 0, 0)
+
+        self.dao.favorited_by_users.clear()
+        self.assertCounters(self.dao, 0, 0)
+
+    def test_deleting_user_releases_their_favorites(self):
+        self.user.favorite_daos.add(self.dao, self.other_dao)
+        self.other_user.favorite_daos.add(self.dao)
+
+        self.user.delete()
+        self.assertCounters(self.dao, 0, 1)
+        self.assertCounters(self.other_dao, 0, 0)
+
+    def test_recount_repairs_drift(self):
+        Campaign.objects.create(name="C1", description="D", budget=100, dao=self.dao)
+        self.user.favorite_daos.add(self.dao)
+        DAO.objects.update(campaign_count=7, favorites_count=0)
+
+        DAO.objects.recount()
+        self.assertCounters(self.dao, 1, 1)
+        self.assertCounters(self.other_dao, 0, 0)
@@ -12,12 +12,15 @@ from dao.serializers import (
 )
 from rest_framework.test import APIRequestFactory
 from unittest.mock import patch
+from django.core.cache import cache
 
 User = get_user_model()
 
 
 class SerializerTests(TestCase):
     def setUp(self):
+        # Favorite DAO sets are cached per user id, which repeats across runs
+        cache.clear()
         self.user = User.objects.create_user(
             eth_address="0x1234567890abcdef1234567890abcdef12345678",
             is_active=True,
@@ -131,8 +134,12 @@ class SerializerTests(TestCase):
         self.assertEqual(data["campaigns"][0]["name"], "Test Campaign")
         self.assertFalse(data["is_favorited"])  # User has not favorited this DAO yet
 
-        # Test with user who favorited the DAO
-        self.user.favorite_daos.add(self.dao)
+        # Test with user who favorited the DAO; favorites are loaded once per
+        # request, so the change shows up on the next one
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.favorite_daos.add(self.dao)
+        request = self.factory.get("/")
+        request.user = self.user
         serializer = DAOExplorerSerializer(
             instance=self.dao, context={"request": request}
         )
@@ -148,6 +155,27 @@ class SerializerTests(TestCase):
         data = serializer.data
         self.assertFalse(data["is_favorited"])
 
+    def test_is_favorited_reads_favorites_once_per_request(self):
+        other_dao = DAO.objects.create(name="Other DAO", network=1)
+        self.user.favorite_daos.add(self.dao)
+        request = self.factory.get("/")
+        request.user = self.user
+
+        # Unprefetched campaigns for each DAO plus a single favorites lookup
+        with self.assertNumQueries(3):
+            data = DAOExplorerSerializer(
+                [self.dao, other_dao], many=True, context={"request": request}
+            ).data
+        self.assertEqual([item["is_favorited"] for item in data], [True, False])
+
+        # Later requests read the cached set
+        request = self.factory.get("/")
+        request.user = self.user
+        with self.assertNumQueries(2):
+            DAOExplorerSerializer(
+                [self.dao, other_dao], many=True, context={"request": request}
+            ).data
+
     def test_dao_explorer_serializer_create(self):
         """
         Test the DAOExplorerSerializer create method.
@@ -6,12 +6,17 @@ from dao.models import DAO
 from campaign.models import Campaign
 from task.models import Task  # Added for task creation in tests
 from rest_framework_simplejwt.tokens import RefreshToken
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 User = get_user_model()
 
 
 class DAOTests(APITestCase):
     def setUp(self):
+        # Favorite DAO sets are cached per user id, which repeats across runs
+        cache.clear()
         self.user = User.objects.create_user(
             eth_address="0x1234567890abcdef1234567890abcdef12345678",
             is_active=True,
@@ -74,6 +79,35 @@ class DAOTests(APITestCase):
         refresh = RefreshToken.for_user(self.user)
         self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {refresh.access_token}")
 
+    def test_list_daos_conditional_get_tracks_favorites(self):
+        url = reverse("dao")
+        etag = self.client.get(url)["ETag"]
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.favorite_daos.add(self.dao2)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        # Responses carry per-user fields, so validators are per user too
+        self.client.credentials()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_toggle_favorite_refreshes_cached_favorite_set(self):
+        url = reverse("dao")
+        self.client.get(url)  # caches the user's favorite set
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(reverse("toggle-favorite-dao", args=[self.dao2.pk]))
+
+        response = self.client.get(url)
+        favorited = {dao["id"]: dao["is_favorited"] for dao in response.data["results"]}
+        self.assertTrue(favorited[self.dao1.pk])
+        self.assertTrue(favorited[self.dao2.pk])
+
     def test_list_all_daos(self):
         """
         Test listing all DAOs.
@@ -127,6 +161,60 @@ class DAOTests(APITestCase):
         self.assertIn("DAO Two", dao_names)
         self.assertNotIn("Another DAO", dao_names)
 
+    def test_list_daos_card_mode_trims_campaigns(self):
+        for i in range(3, 6):
+            Campaign.objects.create(
+                dao=self.dao1,
+                name=f"Campaign {i} for DAO One",
+                budget=100,
+                description=f"Campaign {i}",
+            )
+        url = reverse("dao")
+        self.client.credentials()
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, {"mode": "card"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        dao_one = next(d for d in response.data["results"] if d["id"] == self.dao1.pk)
+        self.assertEqual(dao_one["campaign_count"], 5)
+        self.assertEqual(
+            [campaign["name"] for campaign in dao_one["campaigns"]],
+            [f"Campaign {i} for DAO One" for i in (5, 4, 3)],
+        )
+        self.assertEqual(
+            set(dao_one["campaigns"][0]), {"id", "name", "status", "progress"}
+        )
+        # count, DAOs and one windowed query for every DAO's campaigns
+        self.assertEqual(len(queries), 3)
+        campaign_sql = queries[-1]["sql"]
+        self.assertIn("ROW_NUMBER()", campaign_sql)
+        self.assertNotIn('"description"', campaign_sql)
+
+    def test_list_favorite_and_most_active_daos_card_mode(self):
+        response = self.client.get(reverse("favorite-dao-list"), {"mode": "card"})
+        self.assertEqual(len(response.data[0]["campaigns"]), 2)
+        self.assertEqual(response.data[0]["campaign_count"], 2)
+
+        response = self.client.get(reverse("most-active-dao-list"), {"mode": "card"})
+        self.assertEqual(
+            [dao["campaign_count"] for dao in response.data["results"]], [2, 1]
+        )
+
+    def test_list_dao_campaigns(self):
+        newest = Campaign.objects.create(
+            dao=self.dao1, name="Newest", budget=10, description="Latest campaign"
+        )
+        self.client.credentials()
+        response = self.client.get(reverse("dao-campaigns", args=[self.dao1.pk]))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        campaigns = response.data["results"]
+        self.assertEqual(len(campaigns), 3)
+        self.assertEqual(campaigns[0]["id"], newest.pk)
+        self.assertEqual(campaigns[0]["description"], "Latest campaign")
+
+        response = self.client.get(reverse("dao-campaigns", args=[999999]))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
     def test_list_favorite_daos_authenticated(self):
         """
         Test listing favorite DAOs for an authenticated user.
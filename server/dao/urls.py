@@ -3,6 +3,7 @@ from .views import (
     DAOView,
     FavoriteDAOListView,
     MostActiveDAOListView,
+    DAOCampaignsView,
     RegisterDAOView,
     MyDAOsView,
     MyDAOEditView,
@@ -14,6 +15,7 @@ urlpatterns = [
     path(
         "most-active-daos", MostActiveDAOListView.as_view(), name="most-active-dao-list"
     ),
+    path("daos/<int:pk>/campaigns", DAOCampaignsView.as_view(), name="dao-campaigns"),
     path("register-dao", RegisterDAOView.as_view(), name="register-dao"),
     path("edit-dao/<int:pk>", MyDAOEditView.as_view(), name="edit-dao"),
     path("my-daos", MyDAOsView.as_view(), name="my-daos"),
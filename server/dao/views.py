@@ -2,10 +2,20 @@ from rest_framework import status, generics
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from utils.exception_handler import ErrorHandlingMixin
+from utils.conditional import ConditionalGetMixin
+from utils.edge_cache import EdgeCacheMixin
 from utils.pagination import (
+    CreatedAtCursorPagination,
     DAOResultsSetPagination,
 )
-from .serializers import DAOExplorerSerializer, MyDAOsSerializer, MyDAOEditSerializer
+from .serializers import (
+    CampaignCardSerializer,
+    CampaignSimpleSerializer,
+    DAOCardSerializer,
+    DAOExplorerSerializer,
+    MyDAOsSerializer,
+    MyDAOEditSerializer,
+)
 from .models import DAO
 from drf_spectacular.utils import (
     extend_schema,
@@ -15,15 +25,64 @@ from drf_spectacular.utils import (
 )
 from drf_spectacular.types import OpenApiTypes
 
-from django.db.models import Count
 from rest_framework.permissions import AllowAny, IsAuthenticated
+from django.db.models import Prefetch
+from django.shortcuts import get_object_or_404
+from campaign.models import Campaign
 from task.models import Task
 
+# Campaigns shown on an explorer card; the full list is served by DAOCampaignsView
+CARD_CAMPAIGN_LIMIT = 3
+
+CARD_MODE_PARAMETER = OpenApiParameter(
+    name="mode",
+    description=f"Use 'card' to return only the latest {CARD_CAMPAIGN_LIMIT} campaigns of each DAO, trimmed to the fields a card shows, plus `campaign_count`.",
+    required=False,
+    type=OpenApiTypes.STR,
+    enum=["card"],
+)
+
+
+class DAOCardModeMixin:
+    """
+    `?mode=card` serves explorer cards: each DAO carries only its latest
+    CARD_CAMPAIGN_LIMIT campaigns, loaded by one windowed prefetch query that
+    selects just the card's columns.
+    """
+
+    def is_card_mode(self):
+        return self.request.query_params.get("mode") == "card"
+
+    def get_serializer_class(self):
+        if self.is_card_mode():
+            return DAOCardSerializer
+        return self.serializer_class
+
+    def with_explorer_relations(self, queryset):
+        # The serializers read created_by.eth_address for every DAO
+        queryset = queryset.select_related("created_by")
+        if not self.is_card_mode():
+            return queryset.prefetch_related("campaigns")
+        # A sliced Prefetch is limited per DAO with ROW_NUMBER() in SQL
+        latest = Campaign.objects.only("dao", *CampaignCardSerializer.Meta.fields)
+        latest = latest.order_by("-created_at", "-id")[:CARD_CAMPAIGN_LIMIT]
+        return queryset.prefetch_related(
+            Prefetch("campaigns", queryset=latest, to_attr="latest_campaigns")
+        )
+
 
 @extend_schema(tags=["daos"])
-class DAOView(ErrorHandlingMixin, APIView):
+class DAOView(
+    DAOCardModeMixin,
+    ConditionalGetMixin,
+    EdgeCacheMixin,
+    ErrorHandlingMixin,
+    APIView,
+):
     serializer_class = DAOExplorerSerializer
     pagination_class = DAOResultsSetPagination
+    etag_versions = ("dao", "campaign", "favorite")
+    surrogate_keys = ("dao", "campaign", "favorite")
 
     def get_permissions(self):
         """
@@ -66,6 +125,7 @@ class DAOView(ErrorHandlingMixin, APIView):
                     "created_at",
                 ],  # Add other valid options if any
             ),
+            CARD_MODE_PARAMETER,
         ],
         responses={
             200: OpenApiResponse(
@@ -75,10 +135,8 @@ class DAOView(ErrorHandlingMixin, APIView):
         },
     )
     def get(self, request, *args, **kwargs):
-        queryset = (
-            DAO.objects.annotate(campaign_count=Count("campaigns"))
-            .filter(campaign_count__gt=0)
-            .prefetch_related("campaigns")
+        queryset = self.with_explorer_relations(
+            DAO.objects.filter(campaign_count__gt=0)
         )
 
         search_term = request.query_params.get("search", None)
@@ -87,9 +145,7 @@ class DAOView(ErrorHandlingMixin, APIView):
 
         ordering = request.query_params.get("ordering", "-created_at")
         if ordering == "popular":
-            queryset = queryset.annotate(
-                num_favorites=Count("favorited_by_users")
-            ).order_by("-num_favorites", "-created_at")
+            queryset = queryset.order_by("-favorites_count", "-created_at")
         else:
             queryset = queryset.order_by(ordering)
 
@@ -99,19 +155,19 @@ class DAOView(ErrorHandlingMixin, APIView):
         page = paginator.paginate_queryset(daos_queryset, request, view=self)
 
         if page is not None:
-            serializer = self.serializer_class(
+            serializer = self.get_serializer_class()(
                 page, many=True, context={"request": request}
             )
             return paginator.get_paginated_response(serializer.data)
 
-        serializer = self.serializer_class(
+        serializer = self.get_serializer_class()(
             daos_queryset, many=True, context={"request": request}
         )
         return Response(serializer.data, status=status.HTTP_200_OK)
 
 
 @extend_schema(tags=["daos"])
-class FavoriteDAOListView(ErrorHandlingMixin, APIView):
+class FavoriteDAOListView(DAOCardModeMixin, ErrorHandlingMixin, APIView):
     serializer_class = DAOExplorerSerializer
     permission_classes = [IsAuthenticated]
 
@@ -125,6 +181,7 @@ class FavoriteDAOListView(ErrorHandlingMixin, APIView):
                 required=False,
                 type=OpenApiTypes.STR,
             ),
+            CARD_MODE_PARAMETER,
         ],
         responses={
             200: OpenApiResponse(
@@ -147,12 +204,9 @@ class FavoriteDAOListView(ErrorHandlingMixin, APIView):
                 status=status.HTTP_401_UNAUTHORIZED,
             )
 
-        queryset = (
-            request.user.favorite_daos.annotate(campaign_count=Count("campaigns"))
-            .filter(campaign_count__gt=0)
-            .prefetch_related("campaigns")
-            .order_by("-created_at")
-        )
+        queryset = self.with_explorer_relations(
+            request.user.favorite_daos.filter(campaign_count__gt=0)
+        ).order_by("-created_at")
 
         search_term = request.query_params.get("search", None)
         if search_term:
@@ -162,17 +216,25 @@ class FavoriteDAOListView(ErrorHandlingMixin, APIView):
         # Note: Favorite DAOs are typically not paginated in this example,
         # but if pagination were added, it would follow the pattern of other views.
 
-        serializer = self.serializer_class(
+        serializer = self.get_serializer_class()(
             favorite_daos_queryset, many=True, context={"request": request}
         )
         return Response(serializer.data, status=status.HTTP_200_OK)
 
 
 @extend_schema(tags=["daos"])
-class MostActiveDAOListView(ErrorHandlingMixin, APIView):
+class MostActiveDAOListView(
+    DAOCardModeMixin,
+    ConditionalGetMixin,
+    EdgeCacheMixin,
+    ErrorHandlingMixin,
+    APIView,
+):
     serializer_class = DAOExplorerSerializer
     permission_classes = [AllowAny]
     pagination_class = DAOResultsSetPagination
+    etag_versions = ("dao", "campaign", "favorite")
+    surrogate_keys = ("dao", "campaign")
 
     @extend_schema(
         summary="List most active DAOs",
@@ -196,6 +258,7 @@ class MostActiveDAOListView(ErrorHandlingMixin, APIView):
                 required=False,
                 type=OpenApiTypes.INT,
             ),
+            CARD_MODE_PARAMETER,
         ],
         responses={
             200: OpenApiResponse(
@@ -205,12 +268,9 @@ class MostActiveDAOListView(ErrorHandlingMixin, APIView):
         },
     )
     def get(self, request, *args, **kwargs):
-        queryset = (
-            DAO.objects.annotate(campaign_count=Count("campaigns"))
-            .filter(campaign_count__gt=0)
-            .order_by("-campaign_count", "-created_at")
-            .prefetch_related("campaigns")
-        )
+        queryset = self.with_explorer_relations(
+            DAO.objects.filter(campaign_count__gt=0)
+        ).order_by("-campaign_count", "-created_at")
 
         search_term = request.query_params.get("search", None)
         if search_term:
@@ -222,17 +282,52 @@ class MostActiveDAOListView(ErrorHandlingMixin, APIView):
         page = paginator.paginate_queryset(daos_queryset, request, view=self)
 
         if page is not None:
-            serializer = self.serializer_class(
+            serializer = self.get_serializer_class()(
                 page, many=True, context={"request": request}
             )
             return paginator.get_paginated_response(serializer.data)
 
-        serializer = self.serializer_class(
+        serializer = self.get_serializer_class()(
             daos_queryset, many=True, context={"request": request}
         )
         return Response(serializer.data, status=status.HTTP_200_OK)
 
 
+@extend_schema(
+    tags=["daos"],
+    summary="List a DAO's campaigns",
+    description="Lazily loads the full campaign list of one DAO, newest first, for DAO details after an explorer card. Cursor-paginated: follow `next` for more.",
+    parameters=[
+        OpenApiParameter(
+            name="pk",
+            description="The ID of the DAO.",
+            required=True,
+            type=OpenApiTypes.INT,
+            location=OpenApiParameter.PATH,
+        ),
+    ],
+    responses={
+        200: OpenApiResponse(
+            response=CampaignSimpleSerializer(many=True),
+            description="Successfully retrieved the DAO's campaigns.",
+        ),
+        404: OpenApiResponse(description="DAO not found."),
+    },
+)
+class DAOCampaignsView(
+    ConditionalGetMixin, EdgeCacheMixin, ErrorHandlingMixin, generics.ListAPIView
+):
+    serializer_class = CampaignSimpleSerializer
+    permission_classes = [AllowAny]
+    pagination_class = CreatedAtCursorPagination
+    etag_versions = ("campaign",)
+    surrogate_keys = ("campaign",)
+
+    def get_queryset(self):
+        get_object_or_404(DAO, pk=self.kwargs["pk"])
+        return Campaign.objects.filter(dao_id=self.kwargs["pk"])
+
+
 @extend_schema(tags=["daos"])
 class RegisterDAOView(ErrorHandlingMixin, APIView):
     serializer_class = DAOExplorerSerializer
@@ -0,0 +1,247 @@
+import logging
+from uuid import uuid4
+from django.db import transaction
+from django.db.models import Count, Q
+from redis.exceptions import RedisError
+from core.models import User
+from utils.redis_client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+# user id -> approved * SCORE_SCALE - user id, so equal counts rank the lower id
+# first, the same order the database fallback uses
+LEADERBOARD_KEY = "leaderboard:approved"
+SCORE_SCALE = 2**32
+# set once the sorted set has been built, so an empty leaderboard is still "warm"
+LEADERBOARD_READY_KEY = "leaderboard:approved:ready"
+# held by the one request that rebuilds a cold leaderboard
+LEADERBOARD_LOCK_KEY = "leaderboard:approved:lock"
+LEADERBOARD_LOCK_TTL = 60
+# journals of the rebuilds in progress; increments land in each of them too
+LEADERBOARD_JOURNALS_KEY = "leaderboard:approved:journals"
+LEADERBOARD_JOURNAL_TTL = 3600
+
+# Adds a scaled delta to one member, seeding a new member with its id tiebreak
+_ADD_SCORE = """
+local function add_score(key, member, delta)
+    if not redis.call('ZSCORE', key, member) then
+        redis.call('ZADD', key, '-' .. member, member)
+    end
+    local score = tonumber(redis.call('ZINCRBY', key, delta, member))
+    if score <= 0 then
+        redis.call('ZREM', key, member)
+    end
+end
+"""
+
+_INCREMENT_IF_READY = _ADD_SCORE + """
+local journals = redis.call('SMEMBERS', KEYS[3])
+for _, journal in ipairs(journals) do
+    for i = 1, #ARGV - 1, 2 do
+        redis.call('HINCRBY', journal, ARGV[i], ARGV[i + 1])
+    end
+    redis.call('EXPIRE', journal, ARGV[#ARGV])
+end
+if redis.call('EXISTS', KEYS[2]) == 0 then
+    return 0
+end
+for i = 1, #ARGV - 1, 2 do
+    add_score(KEYS[1], ARGV[i], ARGV[i + 1])
+end
+return 1
+"""
+
+# Replays the increments journaled while the staging set was built, then swaps it in
+_SWAP_IN_REBUILD = _ADD_SCORE + """
+local journaled = redis.call('HGETALL', KEYS[3])
+for i = 1, #journaled, 2 do
+    add_score(KEYS[2], journaled[i], journaled[i + 1])
+end
+if redis.call('EXISTS', KEYS[2]) == 1 then
+    redis.call('RENAME', KEYS[2], KEYS[1])
+else
+    redis.call('DEL', KEYS[1])
+end
+redis.call('SET', KEYS[4], 1)
+redis.call('SREM', KEYS[5], KEYS[3])
+redis.call('DEL', KEYS[3])
+return redis.call('ZCARD', KEYS[1])
+"""
+
+
+def _score(user_id, approved):
+    return approved * SCORE_SCALE - user_id
+
+
+def _approved(user_id, score):
+    return (round(score) + user_id) // SCORE_SCALE
+
+
+def record_approval_deltas(approval_deltas):
+    """Applies {user_id: delta} approved-count changes after the transaction commits."""
+    args = []
+    for user_id, delta in approval_deltas.items():
+        if delta:
+            args += [user_id, delta * SCORE_SCALE]
+    if args:
+        transaction.on_commit(lambda: _increment_scores(args))
+
+
+def _increment_scores(args):
+    try:
+        get_redis_client().eval(
+            _INCREMENT_IF_READY,
+            3,
+            LEADERBOARD_KEY,
+            LEADERBOARD_READY_KEY,
+            LEADERBOARD_JOURNALS_KEY,
+            *args,
+            LEADERBOARD_JOURNAL_TTL,
+        )
+    except RedisError as e:
+        logger.warning("Could not update leaderboard (%s)", e)
+
+
+def remove_from_leaderboard(user_id):
+    """Drops a deleted user's entry once the transaction commits."""
+
+    def remove():
+        try:
+            get_redis_client().zrem(LEADERBOARD_KEY, user_id)
+        except RedisError as e:
+            logger.warning("Could not update leaderboard (%s)", e)
+
+    transaction.on_commit(remove)
+
+
+def rebuild_leaderboard(batch_size=5000) -> int:
+    """
+    Rebuilds the sorted set from the users' approved counters and swaps it in.
+
+    Increments applied while the staging set is built are journaled and replayed
+    onto it before the swap, so they aren't lost. The journal is opened before
+    the counters are read in a single query; only an approval committed in
+    between but applied after the journal opened is counted twice, until the
+    next rebuild.
+    """
+    client = get_redis_client()
+    # Concurrent rebuilds (Celery, the command, a cold read) stage separately
+    rebuild_id = uuid4().hex
+    staging_key = f"{LEADERBOARD_KEY}:rebuild:{rebuild_id}"
+    journal_key = f"{LEADERBOARD_KEY}:journal:{rebuild_id}"
+    client.sadd(LEADERBOARD_JOURNALS_KEY, journal_key)
+
+    scores = {}
+    try:
+        for user_id, approved in (
+            User.objects.filter(approved_submissions__gt=0)
+            .values_list("id", "approved_submissions")
+            .iterator(chunk_size=batch_size)
+        ):
+            scores[user_id] = _score(user_id, approved)
+            if len(scores) >= batch_size:
+                client.zadd(staging_key, scores)
+                scores = {}
+        if scores:
+            client.zadd(staging_key, scores)
+    except BaseException:
+        # Don't leave a half-built staging set or an open journal behind
+        with client.pipeline() as pipe:
+            pipe.srem(LEADERBOARD_JOURNALS_KEY, journal_key)
+            pipe.delete(staging_key, journal_key)
+            pipe.execute()
+        raise
+
+    return client.eval(
+        _SWAP_IN_REBUILD,
+        5,
+        LEADERBOARD_KEY,
+        staging_key,
+        journal_key,
+        LEADERBOARD_READY_KEY,
+        LEADERBOARD_JOURNALS_KEY,
+    )
+
+
+def _ensure_ready(client) -> bool:
+    """
+    True when the sorted set can be read. A cold leaderboard is rebuilt by
+    whichever caller takes the lock; the others read from the database meanwhile.
+    """
+    if client.exists(LEADERBOARD_READY_KEY):
+        return True
+    if not client.set(LEADERBOARD_LOCK_KEY, 1, nx=True, ex=LEADERBOARD_LOCK_TTL):
+        return False
+    try:
+        rebuild_leaderboard()
+    finally:
+        client.delete(LEADERBOARD_LOCK_KEY)
+    return True
+
+
+def _ranked_users():
+    return User.objects.filter(approved_submissions__gt=0).order_by(
+        "-approved_submissions", "id"
+    )
+
+
+def get_top(offset=0, limit=10):
+    """[(user_id, approved_count), ...] for ranks offset+1 .. offset+limit."""
+    try:
+        client = get_redis_client()
+        if _ensure_ready(client):
+            entries = client.zrevrange(
+                LEADERBOARD_KEY, offset, offset + limit - 1, withscores=True
+            )
+            return [
+                (int(user_id), _approved(int(user_id), score))
+                for user_id, score in entries
+            ]
+    except RedisError as e:
+        logger.warning("Leaderboard unavailable in Redis (%s)", e)
+    return list(
+        _ranked_users().values_list("id", "approved_submissions")[
+            offset : offset + limit
+        ]
+    )
+
+
+def get_rank(user_id):
+    """(1-based rank or None, approved_count, ranked_users) for one user."""
+    try:
+        client = get_redis_client()
+        if _ensure_ready(client):
+            with client.pipeline() as pipe:
+                pipe.zrevrank(LEADERBOARD_KEY, user_id)
+                pipe.zscore(LEADERBOARD_KEY, user_id)
+                pipe.zcard(LEADERBOARD_KEY)
+                rank, score, ranked_users = pipe.execute()
+            return (
+                rank + 1 if rank is not None else None,
+                _approved(user_id, score) if score is not None else 0,
+                ranked_users,
+            )
+    except RedisError as e:
+        logger.warning("Leaderboard unavailable in Redis (%s)", e)
+    return _get_rank_from_database(user_id)
+
+
+def _get_rank_from_database(user_id):
+    approved = (
+        User.objects.filter(pk=user_id)
+        .values_list("approved_submissions", flat=True)
+        .first()
+    ) or 0
+    counts = User.objects.aggregate(
+        ranked_users=Count("id", filter=Q(approved_submissions__gt=0)),
+        ahead=Count(
+            "id",
+            filter=Q(approved_submissions__gt=approved)
+            | Q(approved_submissions=approved, id__lt=user_id),
+        ),
+    )
+    return (
+        counts["ahead"] + 1 if approved > 0 else None,
+        approved,
+        counts["ranked_users"],
+    )
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-16 23:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("metrics", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DailyActivityStats",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("day", models.DateField(unique=True)),
+                ("task_capacity", models.PositiveIntegerField(default=0)),
+                ("approved_submissions", models.PositiveIntegerField(default=0)),
+                (
+                    "reward_total",
+                    models.DecimalField(decimal_places=2, default=0, max_digits=18),
+                ),
+            ],
+        ),
+    ]
@@ -0,0 +1,64 @@
+from collections import defaultdict
+from decimal import Decimal
+from django.db import migrations
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncDate
+
+
+def backfill_user_daily_stats(apps, schema_editor):
+    """
+    Rolls up the whole history once; the periodic rollup only rebuilds the
+    trailing days.
+    """
+    Submission = apps.get_model("submission", "Submission")
+    Reward = apps.get_model("reward", "Reward")
+    UserDailyStats = apps.get_model("metrics", "UserDailyStats")
+
+    rows = defaultdict(
+        lambda: {"approved_count": 0, "submission_count": 0, "reward_sum": Decimal(0)}
+    )
+    for item in (
+        Submission.objects.filter(user__isnull=False)
+        .annotate(day=TruncDate("created_at"))
+        .values("user_id", "day")
+        .annotate(count=Count("id"))
+    ):
+        rows[item["user_id"], item["day"]]["submission_count"] = item["count"]
+    for item in (
+        Submission.objects.filter(
+            status=2, approved_at__isnull=False, user__isnull=False
+        )
+        .annotate(day=TruncDate("approved_at"))
+        .values("user_id", "day")
+        .annotate(count=Count("id"))
+    ):
+        rows[item["user_id"], item["day"]]["approved_count"] = item["count"]
+    for item in (
+        Reward.objects.filter(user__isnull=False)
+        .annotate(day=TruncDate("created_at"))
+        .values("user_id", "day")
+        .annotate(total=Sum("reward"))
+    ):
+        rows[item["user_id"], item["day"]]["reward_sum"] = item["total"]
+
+    UserDailyStats.objects.all().delete()
+    UserDailyStats.objects.bulk_create(
+        [
+            UserDailyStats(user_id=user_id, day=day, **values)
+            for (user_id, day), values in rows.items()
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("metrics", "0002_dailyactivitystats"),
+        ("submission", "0009_submission_approved_at"),
+        ("reward", "0008_reward_unique_reward_per_submission"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_user_daily_stats, migrations.RunPython.noop),
+    ]
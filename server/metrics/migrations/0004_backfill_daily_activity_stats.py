@@ -0,0 +1,61 @@
+from collections import defaultdict
+from decimal import Decimal
+from django.db import migrations
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncDate
+
+
+def backfill_daily_activity_stats(apps, schema_editor):
+    """
+    Rolls up the whole history once so the graphs are not empty before the
+    first days pass; the periodic rollup only rebuilds the trailing days.
+    """
+    Task = apps.get_model("task", "Task")
+    Submission = apps.get_model("submission", "Submission")
+    Reward = apps.get_model("reward", "Reward")
+    DailyActivityStats = apps.get_model("metrics", "DailyActivityStats")
+
+    rows = defaultdict(
+        lambda: {
+            "task_capacity": 0,
+            "approved_submissions": 0,
+            "reward_total": Decimal(0),
+        }
+    )
+    for item in (
+        Task.objects.annotate(day=TruncDate("created_at"))
+        .values("day")
+        .annotate(total=Sum("quantity"))
+    ):
+        rows[item["day"]]["task_capacity"] = item["total"]
+    for item in (
+        Submission.objects.filter(status=2, approved_at__isnull=False)
+        .annotate(day=TruncDate("approved_at"))
+        .values("day")
+        .annotate(count=Count("id"))
+    ):
+        rows[item["day"]]["approved_submissions"] = item["count"]
+    for item in (
+        Reward.objects.annotate(day=TruncDate("created_at"))
+        .values("day")
+        .annotate(total=Sum("reward"))
+    ):
+        rows[item["day"]]["reward_total"] = item["total"]
+
+    DailyActivityStats.objects.all().delete()
+    DailyActivityStats.objects.bulk_create(
+        [DailyActivityStats(day=day, **values) for day, values in rows.items()],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("metrics", "0003_backfill_user_daily_stats"),
+        ("task", "0006_recount_task_filled"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_daily_activity_stats, migrations.RunPython.noop),
+    ]
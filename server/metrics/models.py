@@ -0,0 +1,43 @@
+from django.db import models
+
+
+class UserDailyStats(models.Model):
+    """Per-user activity for one day, rolled up from submissions and rewards."""
+
+    user = models.ForeignKey(
+        "core.User", on_delete=models.CASCADE, related_name="daily_stats"
+    )
+    day = models.DateField()
+    # submissions approved on this day (by their approval time)
+    approved_count = models.PositiveIntegerField(default=0)
+    # submissions created on this day
+    submission_count = models.PositiveIntegerField(default=0)
+    reward_sum = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "day"], name="unique_user_daily_stats"
+            )
+        ]
+        indexes = [
+            # Range-sums over a timeframe scan (day >= since) grouped by user
+            models.Index(fields=["day", "user"], name="user_daily_stats_day_idx"),
+        ]
+
+    def __str__(self):
+        return f"Stats for User {self.user_id} on {self.day}"
+
+
+class DailyActivityStats(models.Model):
+    """Platform-wide activity for one day, backing the graph endpoints."""
+
+    day = models.DateField(unique=True)
+    # sum of Task.quantity for tasks created on this day
+    task_capacity = models.PositiveIntegerField(default=0)
+    # submissions approved on this day (by their approval time)
+    approved_submissions = models.PositiveIntegerField(default=0)
+    reward_total = models.DecimalField(max_digits=18, decimal_places=2, default=0)
+
+    def __str__(self):
+        return f"Activity on {self.day}"
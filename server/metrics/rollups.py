@@ -0,0 +1,110 @@
+from collections import defaultdict
+from datetime import datetime, time, timedelta
+from decimal import Decimal
+from django.db import transaction
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+from reward.models import Reward
+from submission.models import Submission
+from task.models import Task
+from .models import DailyActivityStats, UserDailyStats
+
+
+def _day_start(day):
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def _window_start(days):
+    first_day = timezone.localdate() - timedelta(days=days - 1)
+    return first_day, _day_start(first_day)
+
+
+def rollup_user_daily_stats(days=2):
+    """
+    Rebuilds the per-user daily rows for the trailing `days` days (today
+    included) from the source tables. Older days are left untouched, so each
+    run only scans the recent, indexed slice of submissions and rewards.
+    Returns the number of rows written.
+    """
+    first_day, since = _window_start(days)
+
+    rows = defaultdict(
+        lambda: {"approved_count": 0, "submission_count": 0, "reward_sum": Decimal(0)}
+    )
+    for item in (
+        Submission.objects.filter(created_at__gte=since, user__isnull=False)
+        .annotate(day=TruncDate("created_at"))
+        .values("user_id", "day")
+        .annotate(count=Count("id"))
+    ):
+        rows[item["user_id"], item["day"]]["submission_count"] = item["count"]
+    for item in (
+        Submission.objects.filter(status=2, approved_at__gte=since, user__isnull=False)
+        .annotate(day=TruncDate("approved_at"))
+        .values("user_id", "day")
+        .annotate(count=Count("id"))
+    ):
+        rows[item["user_id"], item["day"]]["approved_count"] = item["count"]
+    for item in (
+        Reward.objects.filter(created_at__gte=since, user__isnull=False)
+        .annotate(day=TruncDate("created_at"))
+        .values("user_id", "day")
+        .annotate(total=Sum("reward"))
+    ):
+        rows[item["user_id"], item["day"]]["reward_sum"] = item["total"]
+
+    with transaction.atomic():
+        UserDailyStats.objects.filter(day__gte=first_day).delete()
+        UserDailyStats.objects.bulk_create(
+            [
+                UserDailyStats(user_id=user_id, day=day, **values)
+                for (user_id, day), values in rows.items()
+            ],
+            batch_size=1000,
+        )
+    return len(rows)
+
+
+def rollup_daily_activity(days=2):
+    """
+    Rebuilds the platform-wide daily rows for the trailing `days` days, the same
+    way as rollup_user_daily_stats. Returns the number of rows written.
+    """
+    first_day, since = _window_start(days)
+
+    rows = defaultdict(
+        lambda: {
+            "task_capacity": 0,
+            "approved_submissions": 0,
+            "reward_total": Decimal(0),
+        }
+    )
+    for item in (
+        Task.objects.filter(created_at__gte=since)
+        .annotate(day=TruncDate("created_at"))
+        .values("day")
+        .annotate(total=Sum("quantity"))
+    ):
+        rows[item["day"]]["task_capacity"] = item["total"]
+    for item in (
+        Submission.objects.filter(status=2, approved_at__gte=since)
+        .annotate(day=TruncDate("approved_at"))
+        .values("day")
+        .annotate(count=Count("id"))
+    ):
+        rows[item["day"]]["approved_submissions"] = item["count"]
+    for item in (
+        Reward.objects.filter(created_at__gte=since)
+        .annotate(day=TruncDate("created_at"))
+        .values("day")
+        .annotate(total=Sum("reward"))
+    ):
+        rows[item["day"]]["reward_total"] = item["total"]
+
+    with transaction.atomic():
+        DailyActivityStats.objects.filter(day__gte=first_day).delete()
+        DailyActivityStats.objects.bulk_create(
+            [DailyActivityStats(day=day, **values) for day, values in rows.items()]
+        )
+    return len(rows)
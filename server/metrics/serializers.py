@@ -1,6 +1,9 @@
 from rest_framework import serializers
 from core.models import User
 from reward.models import Reward
+from .timeframes import TIMEFRAME_CHOICES
+from .timeseries import BUCKET_CHOICES, default_range_start
+from django.utils import timezone
 
 
 class DashboardStatisticsSerializer(serializers.Serializer):
@@ -30,6 +33,18 @@ class DashboardStatisticsSerializer(serializers.Serializer):
         }
 
 
+class LeaderboardQuerySerializer(serializers.Serializer):
+    limit = serializers.IntegerField(min_value=1, max_value=100, default=10)
+    offset = serializers.IntegerField(min_value=0, default=0)
+    timeframe = serializers.ChoiceField(choices=TIMEFRAME_CHOICES, default="all")
+
+
+class LeaderboardRankSerializer(serializers.Serializer):
+    rank = serializers.IntegerField(allow_null=True)
+    approved_submissions_count = serializers.IntegerField()
+    ranked_users = serializers.IntegerField()
+
+
 class TopShillersSerializer(serializers.ModelSerializer):
     # !: FOR DASHBOARD
     approved_submissions_count = serializers.IntegerField(read_only=True)
@@ -97,6 +112,13 @@ class TopShillersExtendedSerializer(TopShillersSerializer):
         read_only_fields = fields
 
     def get_total_rewards(self, instance):
+        # Annotated by TopShillersExtendedView; other callers fall back to a query
+        if hasattr(instance, "total_rewards_sum"):
+            return (
+                instance.total_rewards_sum
+                if instance.total_rewards_sum is not None
+                else 0.0
+            )
         return instance.get_total_rewards()
 
     def get_tier(self, instance):
@@ -109,11 +131,15 @@ class TopShillersExtendedSerializer(TopShillersSerializer):
         return None
 
     def get_last_approved_task_date(self, instance):
-        last_approved = (
-            instance.submissions.filter(status=2).order_by("-updated_at").first()
-        )
-        if last_approved:
-            return last_approved.updated_at.strftime("%b %d, %Y")
+        if hasattr(instance, "last_approved_at"):
+            last_approved_at = instance.last_approved_at
+        else:
+            last_approved = (
+                instance.submissions.filter(status=2).order_by("-approved_at").first()
+            )
+            last_approved_at = last_approved.approved_at if last_approved else None
+        if last_approved_at:
+            return last_approved_at.strftime("%b %d, %Y")
         return None
 
     def to_representation(self, instance):
@@ -122,6 +148,31 @@ class TopShillersExtendedSerializer(TopShillersSerializer):
         return representation
 
 
+class GraphRangeSerializer(serializers.Serializer):
+    MAX_RANGE_DAYS = 366 * 3
+
+    bucket = serializers.ChoiceField(choices=BUCKET_CHOICES, default="month")
+
+    def get_fields(self):
+        # "from" is a Python keyword, so the range fields are declared here
+        fields = super().get_fields()
+        fields["from"] = serializers.DateField(required=False, source="start")
+        fields["to"] = serializers.DateField(required=False, source="end")
+        return fields
+
+    def validate(self, attrs):
+        end = attrs.get("end") or timezone.localdate()
+        start = attrs.get("start") or default_range_start(end, attrs["bucket"])
+        if start > end:
+            raise serializers.ValidationError({"from": "Must not be after 'to'."})
+        if (end - start).days > self.MAX_RANGE_DAYS:
+            raise serializers.ValidationError(
+                {"from": f"Range can span at most {self.MAX_RANGE_DAYS} days."}
+            )
+        attrs["start"], attrs["end"] = start, end
+        return attrs
+
+
 class CampaignGraphSerializer(serializers.Serializer):
     submissions_count = serializers.IntegerField(read_only=True)
     tasks_count = serializers.IntegerField(read_only=True)
@@ -143,3 +194,11 @@ class RewardGraphSerializer(serializers.ModelSerializer):
         model = Reward
         fields = ["id", "reward", "month"]
         read_only_fields = fields
+
+
+class DashboardBundleSerializer(serializers.Serializer):
+    statistics = DashboardStatisticsSerializer(read_only=True)
+    top_shillers = TopShillersSerializer(many=True, read_only=True)
+    campaigns_graph = serializers.ListField(child=serializers.DictField())
+    rewards_graph = serializers.ListField(child=serializers.DictField())
+    tier_graph = TierDistributionGraphSerializer(many=True, read_only=True)
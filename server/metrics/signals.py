@@ -0,0 +1,9 @@
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+from core.models import User
+from .leaderboard import remove_from_leaderboard
+
+
+@receiver(post_delete, sender=User)
+def remove_deleted_user_from_leaderboard(sender, instance, **kwargs):
+    remove_from_leaderboard(instance.pk)
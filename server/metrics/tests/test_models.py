@@ -0,0 +1,106 @@
+from django.test import TestCase
+from decimal import Decimal
+from django.utils import timezone
+import datetime
+
+from core.models import User
+from campaign.models import Campaign
+from task.models import Task
+from submission.models import Submission
+from reward.models import Reward
+from dao.models import DAO
+from metrics.models import DailyActivityStats, UserDailyStats
+from metrics.rollups import rollup_daily_activity, rollup_user_daily_stats
+
+
+class UserDailyStatsRollupTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username="rollupuser", eth_address="0xRollupUser"
+        )
+        dao = DAO.objects.create(name="Rollup DAO")
+        campaign = Campaign.objects.create(
+            name="Rollup Camp", description="D", budget=100, dao=dao
+        )
+        cls.task = Task.objects.create(
+            campaign=campaign, description="T", type=1, reward=1, quantity=10
+        )
+        for status in (1, 2, 2):
+            Submission.objects.create(
+                task=cls.task, user=cls.user, link="http://r.com", status=status
+            )
+        Reward.objects.create(user=cls.user, reward=Decimal("3.25"))
+        Reward.objects.create(user=cls.user, reward=Decimal("1.75"))
+
+    def test_rollup_writes_one_row_per_user_and_day(self):
+        written = rollup_user_daily_stats()
+
+        self.assertEqual(written, 1)
+        stats = UserDailyStats.objects.get(user=self.user)
+        self.assertEqual(stats.day, timezone.localdate())
+        self.assertEqual(stats.submission_count, 3)
+        self.assertEqual(stats.approved_count, 2)
+        self.assertEqual(stats.reward_sum, Decimal("5.00"))
+
+    def test_approvals_keep_their_day_when_saved_again(self):
+        approved = Submission.objects.filter(user=self.user, status=2).first()
+        yesterday = timezone.now() - datetime.timedelta(days=1)
+        Submission.objects.filter(pk=approved.pk).update(approved_at=yesterday)
+
+        approved = Submission.objects.get(pk=approved.pk)
+        approved.feedback = "Edited after approval"
+        approved.save()
+        rollup_user_daily_stats()
+
+        approvals = dict(
+            UserDailyStats.objects.filter(user=self.user).values_list(
+                "day", "approved_count"
+            )
+        )
+        self.assertEqual(approvals[timezone.localdate(yesterday)], 1)
+        self.assertEqual(approvals[timezone.localdate()], 1)
+
+    def test_rollup_is_idempotent(self):
+        rollup_user_daily_stats()
+        rollup_user_daily_stats()
+        self.assertEqual(UserDailyStats.objects.filter(user=self.user).count(), 1)
+
+    def test_rollup_leaves_days_outside_window_untouched(self):
+        old_day = timezone.localdate() - datetime.timedelta(days=10)
+        UserDailyStats.objects.create(user=self.user, day=old_day, approved_count=4)
+
+        rollup_user_daily_stats(days=2)
+
+        self.assertEqual(
+            UserDailyStats.objects.get(user=self.user, day=old_day).approved_count, 4
+        )
+
+
+class DailyActivityStatsRollupTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create_user(username="activity", eth_address="0xActivity")
+        dao = DAO.objects.create(name="Activity DAO")
+        campaign = Campaign.objects.create(
+            name="Activity Camp", description="D", budget=100, dao=dao
+        )
+        task = Task.objects.create(
+            campaign=campaign, description="T", type=1, reward=1, quantity=4
+        )
+        Task.objects.create(
+            campaign=campaign, description="T2", type=1, reward=1, quantity=6
+        )
+        Submission.objects.create(task=task, user=user, link="http://a.com", status=2)
+        Submission.objects.create(task=task, user=user, link="http://b.com", status=3)
+        Reward.objects.create(user=user, reward=Decimal("2.50"))
+
+    def test_rollup_writes_daily_totals(self):
+        self.assertEqual(rollup_daily_activity(), 1)
+
+        stats = DailyActivityStats.objects.get(day=timezone.localdate())
+        self.assertEqual(stats.task_capacity, 10)
+        self.assertEqual(stats.approved_submissions, 1)
+        self.assertEqual(stats.reward_total, Decimal("2.50"))
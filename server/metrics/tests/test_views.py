@@ -1,6 +1,6 @@
 from django.urls import reverse
 from rest_framework import status
-from rest_framework.test import APITestCase
+from rest_framework.test import APITestCase, APITransactionTestCase
 from decimal import Decimal
 from django.utils import timezone
 import datetime
@@ -13,6 +13,19 @@ from reward.models import Reward
 from dao.models import DAO
 
 from unittest.mock import patch  # For mocking timezone.now()
+from django.core.cache import cache
+from redis.exceptions import RedisError
+from utils.redis_client import get_redis_client
+from metrics import leaderboard
+from metrics.leaderboard import (
+    LEADERBOARD_LOCK_KEY,
+    LEADERBOARD_READY_KEY,
+    SCORE_SCALE,
+    _increment_scores,
+    rebuild_leaderboard,
+)
+from metrics.models import DailyActivityStats, UserDailyStats
+from metrics.rollups import rollup_daily_activity, rollup_user_daily_stats
 
 
 class MetricsViewTests(APITestCase):
@@ -207,6 +220,11 @@ class MetricsViewTests(APITestCase):
             created_at=timezone.make_aware(datetime.datetime(2023, 10, 20)),
         )
 
+    def setUp(self):
+        # Leaderboard and other Redis state must not leak between tests
+        get_redis_client().flushdb()
+        cache.clear()
+
     # --- DashboardStatisticsView Tests ---
     @patch("django.utils.timezone.now")
     def run_dashboard_stats_test(
@@ -262,6 +280,33 @@ class MetricsViewTests(APITestCase):
 
         self.run_dashboard_stats_test("all", 3, 3, 3)
 
+    def test_dashboard_statistics_cached_per_timeframe(self):
+        url = reverse("statistics-overview")
+        self.client.get(url, {"timeframe": "weekly"})
+
+        with self.assertNumQueries(0):
+            response = self.client.get(url, {"timeframe": "weekly"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        # Other timeframes have their own entries
+        with self.assertNumQueries(3):
+            self.client.get(url, {"timeframe": "all"})
+
+    def test_dashboard_statistics_serves_stale_value_while_refreshing(self):
+        url = reverse("statistics-overview")
+        stale = {"active_shillers": 99, "total_campaigns": 98, "total_tasks": 97}
+        cache.set("dashboard_statistics:all", {"value": stale, "fresh_until": 0}, None)
+        # Another worker is already recomputing the entry
+        cache.add("dashboard_statistics:all:lock", 1)
+
+        with self.assertNumQueries(0):
+            response = self.client.get(url)
+        self.assertEqual(response.data["active_shillers"], 99)
+
+        cache.delete("dashboard_statistics:all:lock")
+        response = self.client.get(url)
+        self.assertEqual(response.data["active_shillers"], 3)
+
     # --- TopShillersView & TopShillersExtendedView Tests ---
     def test_top_shillers_view(self):
         url = reverse("top-shillers")
@@ -283,6 +328,178 @@ class MetricsViewTests(APITestCase):
                 "total_submissions_count", item
             )  # Not in TopShillersSerializer
 
+    def test_top_shillers_view_pagination(self):
+        url = reverse("top-shillers")
+        response = self.client.get(url, {"limit": 1, "offset": 1})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([item["id"] for item in response.data], [self.user2.id])
+
+        response = self.client.get(url, {"limit": 1000})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_top_shillers_served_from_leaderboard(self):
+        url = reverse("top-shillers")
+        self.client.get(url)  # Builds the leaderboard
+
+        # Only the users for the returned ranks are loaded from Postgres
+        with self.assertNumQueries(1):
+            response = self.client.get(url)
+        self.assertEqual(response.data[0]["approved_submissions_count"], 2)
+
+    def test_top_shillers_timeframe_uses_rollups(self):
+        rollup_user_daily_stats()
+        # An old approval outside the weekly window must not count
+        UserDailyStats.objects.create(
+            user=self.user4_no_subs,
+            day=timezone.localdate() - datetime.timedelta(days=20),
+            approved_count=50,
+        )
+
+        url = reverse("top-shillers-extended")
+        response = self.client.get(url, {"timeframe": "weekly"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [item["id"] for item in response.data], [self.user1.id, self.user2.id]
+        )
+        self.assertEqual(response.data[0]["approved_submissions_count"], 2)
+
+        response = self.client.get(url, {"timeframe": "monthly"})
+        self.assertEqual(response.data[0]["id"], self.user4_no_subs.id)
+
+        response = self.client.get(url, {"timeframe": "yearly"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_top_shillers_timeframes_count_whole_days(self):
+        today = timezone.localdate()
+        for days_ago, approved in ((1, 5), (6, 7), (7, 9)):
+            UserDailyStats.objects.create(
+                user=self.user4_no_subs,
+                day=today - datetime.timedelta(days=days_ago),
+                approved_count=approved,
+            )
+
+        url = reverse("top-shillers-extended")
+        response = self.client.get(url, {"timeframe": "daily"})
+        self.assertNotIn(self.user4_no_subs.id, [item["id"] for item in response.data])
+
+        response = self.client.get(url, {"timeframe": "weekly"})
+        self.assertEqual(response.data[0]["id"], self.user4_no_subs.id)
+        self.assertEqual(response.data[0]["approved_submissions_count"], 12)
+
+    def test_leaderboard_follows_approvals(self):
+        self.client.get(reverse("top-shillers"))
+        with patch("celery_tasks.tasks.flush_campaign_progress.apply_async"):
+            with self.captureOnCommitCallbacks(execute=True):
+                for i in range(2):
+                    Submission.objects.create(
+                        task=self.task_cr_t1,
+                        user=self.user2,
+                        link=f"lb{i}.com",
+                        proof_text="p",
+                        status=2,
+                    )
+
+        response = self.client.get(reverse("top-shillers"))
+        self.assertEqual(response.data[0]["id"], self.user2.id)
+        self.assertEqual(response.data[0]["approved_submissions_count"], 3)
+
+    def test_my_leaderboard_rank(self):
+        url = reverse("top-shillers-me")
+        self.client.force_authenticate(user=self.user2)
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data,
+            {"rank": 2, "approved_submissions_count": 1, "ranked_users": 2},
+        )
+
+        self.client.force_authenticate(user=self.user4_no_subs)
+        response = self.client.get(url)
+        self.assertIsNone(response.data["rank"])
+
+    def test_leaderboard_falls_back_to_database_without_redis(self):
+        with patch(
+            "metrics.leaderboard.get_redis_client",
+            side_effect=RedisError("connection refused"),
+        ):
+            response = self.client.get(reverse("top-shillers"))
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(
+                [item["id"] for item in response.data[:2]],
+                [self.user1.id, self.user2.id],
+            )
+
+            self.client.force_authenticate(user=self.user2)
+            response = self.client.get(reverse("top-shillers-me"))
+            self.assertEqual(
+                response.data,
+                {"rank": 2, "approved_submissions_count": 1, "ranked_users": 2},
+            )
+
+    def test_cold_leaderboard_read_while_another_request_rebuilds(self):
+        get_redis_client().set(LEADERBOARD_LOCK_KEY, 1)
+        response = self.client.get(reverse("top-shillers"), {"limit": 1})
+        self.assertEqual([item["id"] for item in response.data], [self.user1.id])
+        # Left to the lock holder
+        self.assertFalse(get_redis_client().exists(LEADERBOARD_READY_KEY))
+
+    def test_leaderboard_ties_rank_like_database_fallback(self):
+        User.objects.filter(pk=self.user4_no_subs.pk).update(approved_submissions=2)
+        url = reverse("top-shillers")
+        response = self.client.get(url, {"limit": 2})
+        from_redis = [item["id"] for item in response.data]
+
+        with patch(
+            "metrics.leaderboard.get_redis_client",
+            side_effect=RedisError("connection refused"),
+        ):
+            response = self.client.get(url, {"limit": 2})
+        self.assertEqual(from_redis, [item["id"] for item in response.data])
+        self.assertEqual(from_redis, sorted([self.user1.id, self.user4_no_subs.id]))
+
+    def test_deleted_user_leaves_leaderboard(self):
+        url = reverse("top-shillers")
+        self.client.get(url)  # Builds the leaderboard
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user1.delete()
+
+        response = self.client.get(url)
+        self.assertEqual([item["id"] for item in response.data], [self.user2.id])
+
+    def test_rebuild_keeps_increments_applied_while_it_runs(self):
+        rebuild_leaderboard()
+        score = leaderboard._score
+
+        def approve_while_reading(user_id, approved):
+            # Committed after the counters were read
+            if user_id == self.user2.id:
+                _increment_scores([user_id, 5 * SCORE_SCALE])
+            return score(user_id, approved)
+
+        with patch("metrics.leaderboard._score", side_effect=approve_while_reading):
+            rebuild_leaderboard()
+
+        self.client.force_authenticate(user=self.user2)
+        response = self.client.get(reverse("top-shillers-me"))
+        self.assertEqual(response.data["approved_submissions_count"], 6)
+
+    def test_my_leaderboard_rank_unauthenticated(self):
+        response = self.client.get(reverse("top-shillers-me"))
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_top_shillers_extended_view_query_count(self):
+        Reward.objects.create(user=self.user2, reward=Decimal("5.50"))
+        url = reverse("top-shillers-extended")
+        self.client.get(url)  # Builds the leaderboard
+
+        with self.assertNumQueries(1):
+            response = self.client.get(url)
+
+        by_id = {item["id"]: item for item in response.data}
+        self.assertEqual(by_id[self.user1.id]["total_rewards"], Decimal("10.00"))
+        self.assertEqual(by_id[self.user2.id]["total_rewards"], Decimal("25.50"))
+        self.assertIsNotNone(by_id[self.user1.id]["last_approved_task_date"])
+
     def test_top_shillers_extended_view(self):
         url = reverse("top-shillers-extended")
         response = self.client.get(url)
@@ -310,11 +527,52 @@ class MetricsViewTests(APITestCase):
             self.assertIn("submissions", item)
 
     def test_reward_graph_view(self):
+        rollup_daily_activity()
+        today = timezone.localdate()
         url = reverse("rewards")  # Name is "rewards"
-        response = self.client.get(url)
+        response = self.client.get(
+            url, {"from": today.replace(day=1).isoformat(), "to": today.isoformat()}
+        )
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data), 1)
         self.assertEqual(response.data[0]["rewards"], 30.00)
+        self.assertEqual(response.data[0]["name"], today.strftime("%b %Y"))
+
+    def test_reward_graph_view_defaults_to_latest_twelve_months(self):
+        rollup_daily_activity()
+        response = self.client.get(reverse("rewards"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 12)
+        # Latest month last, with gaps filled with zeroes
+        self.assertEqual(response.data[-1]["rewards"], 30.00)
+        self.assertEqual(response.data[0]["rewards"], 0)
+
+    def test_campaign_graph_view_buckets_across_years(self):
+        DailyActivityStats.objects.create(
+            day=datetime.date(2023, 12, 30), task_capacity=5, approved_submissions=1
+        )
+        DailyActivityStats.objects.create(
+            day=datetime.date(2024, 1, 2), task_capacity=7, approved_submissions=2
+        )
+        url = reverse("campaigns-graph")
+        response = self.client.get(
+            url, {"from": "2023-12-20", "to": "2024-01-10", "bucket": "week"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [item["name"] for item in response.data],
+            ["Dec 18, 2023", "Dec 25, 2023", "Jan 01, 2024", "Jan 08, 2024"],
+        )
+        self.assertEqual(
+            [(item["tasks"], item["submissions"]) for item in response.data],
+            [(0, 0), (5, 1), (7, 2), (0, 0)],
+        )
+
+    def test_graph_view_rejects_inverted_range(self):
+        response = self.client.get(
+            reverse("campaigns-graph"), {"from": "2024-02-01", "to": "2024-01-01"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
     def test_tier_distribution_graph_view(self):
         url = reverse("tier-graph")
@@ -333,3 +591,91 @@ class MetricsViewTests(APITestCase):
         self.assertEqual(bronze_data["value"], 3)
         self.assertIsNotNone(silver_data)
         self.assertEqual(silver_data["value"], 1)
+
+    def test_tier_distribution_etag_ignores_profile_edits(self):
+        url = reverse("tier-graph")
+        etag = self.client.get(url)["ETag"]
+
+        self.user1.username = "renamed_mu1"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user1.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.user1.tier = 3
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user1.save(update_fields=["tier"])
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+class DashboardBundleViewTests(APITransactionTestCase):
+    # Missing widgets are computed on worker threads with their own database
+    # connections, so the fixture rows must actually be committed.
+
+    def setUp(self):
+        get_redis_client().flushdb()
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="bundleuser", eth_address="0xBundleUser"
+        )
+        campaign = Campaign.objects.create(
+            name="Bundle Campaign", description="D", budget=Decimal("100.00")
+        )
+        task = Task.objects.create(
+            campaign=campaign, description="T", type=1, reward=10, quantity=5
+        )
+        Submission.objects.create(
+            task=task, user=self.user, link="http://example.com/b1", status=2
+        )
+        rollup_daily_activity()
+
+    def test_bundle_returns_all_widgets_with_etag(self):
+        url = reverse("dashboard-bundle")
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.assertEqual(
+            set(response.data),
+            {
+                "statistics",
+                "top_shillers",
+                "campaigns_graph",
+                "rewards_graph",
+                "tier_graph",
+            },
+        )
+        self.assertEqual(response.data["statistics"]["total_campaigns"], 1)
+        self.assertEqual(response.data["top_shillers"][0]["id"], self.user.id)
+        self.assertEqual(len(response.data["campaigns_graph"]), 12)
+        self.assertEqual(response.data["campaigns_graph"][-1]["submissions"], 1)
+        self.assertEqual(response.data["tier_graph"], [{"name": "Bronze", "value": 1}])
+        self.assertTrue(response.has_header("ETag"))
+
+    def test_bundle_builds_cached_image_urls_for_each_request(self):
+        User.objects.filter(pk=self.user.pk).update(image="user_images/bundle.png")
+        url = reverse("dashboard-bundle")
+
+        response = self.client.get(url, secure=True)
+        self.assertEqual(
+            response.data["top_shillers"][0]["image"],
+            "https://testserver/media/user_images/bundle.png",
+        )
+        # Served from the shared cache, with this request's scheme
+        response = self.client.get(url)
+        self.assertEqual(
+            response.data["top_shillers"][0]["image"],
+            "http://testserver/media/user_images/bundle.png",
+        )
+
+    def test_bundle_served_from_cache_and_honours_if_none_match(self):
+        url = reverse("dashboard-bundle")
+        etag = self.client.get(url)["ETag"]
+
+        with self.assertNumQueries(0):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], etag)
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH='"stale"')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -0,0 +1,27 @@
+from datetime import timedelta
+
+# timeframe query value -> length of the trailing window
+TIMEFRAME_WINDOWS = {
+    "daily": timedelta(days=1),
+    "weekly": timedelta(days=7),
+    "monthly": timedelta(days=30),
+}
+
+TIMEFRAME_CHOICES = ["all", *TIMEFRAME_WINDOWS]
+
+
+def get_timeframe_start(timeframe, now):
+    """Start of the trailing window for a timeframe, or None for all time."""
+    window = TIMEFRAME_WINDOWS.get(timeframe)
+    return now - window if window else None
+
+
+def get_timeframe_first_day(timeframe, today):
+    """
+    First day of a timeframe counted in whole days, today included: daily is
+    today, weekly the last 7 days and monthly the last 30. Used where the data
+    is rolled up per day, so the window cannot start mid-day like
+    get_timeframe_start's. None for all time.
+    """
+    window = TIMEFRAME_WINDOWS.get(timeframe)
+    return today - (window - timedelta(days=1)) if window else None
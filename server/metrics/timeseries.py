@@ -0,0 +1,64 @@
+from datetime import date, timedelta
+
+BUCKET_CHOICES = ["day", "week", "month"]
+
+# how far back each bucket size reaches when no `from` is given
+DEFAULT_BUCKET_COUNT = {"day": 30, "week": 12, "month": 12}
+
+
+def bucket_start(day, bucket):
+    """First day of the bucket containing `day` (weeks start on Monday)."""
+    if bucket == "week":
+        return day - timedelta(days=day.weekday())
+    if bucket == "month":
+        return day.replace(day=1)
+    return day
+
+
+def next_bucket(start, bucket):
+    if bucket == "week":
+        return start + timedelta(days=7)
+    if bucket == "month":
+        return date(start.year + start.month // 12, start.month % 12 + 1, 1)
+    return start + timedelta(days=1)
+
+
+def default_range_start(end, bucket):
+    start = bucket_start(end, bucket)
+    for _ in range(DEFAULT_BUCKET_COUNT[bucket] - 1):
+        start = bucket_start(start - timedelta(days=1), bucket)
+    return start
+
+
+def bucket_label(start, bucket):
+    """Year-aware label, so buckets from different years never collide."""
+    if bucket == "month":
+        return start.strftime("%b %Y")
+    return start.strftime("%b %d, %Y")
+
+
+def rebucket(rows, start, end, bucket, fields):
+    """
+    Sums daily `rows` (dicts with a "day" key) into consecutive buckets from
+    `start` to `end`, emitting zeroes for buckets without any rows.
+    """
+    totals = {}
+    for row in rows:
+        bucket_totals = totals.setdefault(
+            bucket_start(row["day"], bucket), dict.fromkeys(fields, 0)
+        )
+        for field in fields:
+            bucket_totals[field] += row[field]
+
+    series = []
+    current = bucket_start(start, bucket)
+    while current <= end:
+        series.append(
+            {
+                "name": bucket_label(current, bucket),
+                "start": current,
+                **totals.get(current, dict.fromkeys(fields, 0)),
+            }
+        )
+        current = next_bucket(current, bucket)
+    return series
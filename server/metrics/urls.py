@@ -3,9 +3,11 @@ from .views import (
     DashboardStatisticsView,
     TopShillersView,
     TopShillersExtendedView,
+    MyLeaderboardRankView,
     CampaignGraphView,
     TierDistributionGraphView,
     RewardGraphView,
+    DashboardBundleView,
 )
 
 urlpatterns = [
@@ -14,12 +16,18 @@ urlpatterns = [
         DashboardStatisticsView.as_view(),
         name="statistics-overview",
     ),
+    path("dashboard", DashboardBundleView.as_view(), name="dashboard-bundle"),
     path("top-shillers", TopShillersView.as_view(), name="top-shillers"),
     path(
         "top-shillers-extended",
         TopShillersExtendedView.as_view(),
         name="top-shillers-extended",
     ),
+    path(
+        "top-shillers/me",
+        MyLeaderboardRankView.as_view(),
+        name="top-shillers-me",
+    ),
     path("campaigns-graph", CampaignGraphView.as_view(), name="campaigns-graph"),
     path("rewards-graph", RewardGraphView.as_view(), name="rewards"),
     path("tier-graph", TierDistributionGraphView.as_view(), name="tier-graph"),
@@ -2,7 +2,7 @@ from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from utils.exception_handler import ErrorHandlingMixin
-from rest_framework.permissions import AllowAny
+from rest_framework.permissions import AllowAny, IsAuthenticated
 from drf_spectacular.utils import (
     extend_schema,
     OpenApiResponse,
@@ -16,6 +16,9 @@ from task.models import Task
 from reward.models import Reward
 from submission.models import Submission
 from django.core.cache import cache
+from utils.cache import get_or_compute, get_many_or_compute
+from utils.conditional import ConditionalGetMixin
+from utils.edge_cache import EdgeCacheMixin
 from .serializers import (
     DashboardStatisticsSerializer,
     TopShillersSerializer,
@@ -23,13 +26,28 @@ from .serializers import (
     CampaignGraphSerializer,
     RewardGraphSerializer,
     TierDistributionGraphSerializer,
+    LeaderboardQuerySerializer,
+    LeaderboardRankSerializer,
+    GraphRangeSerializer,
+    DashboardBundleSerializer,
 )
-from logging_config import logger
-from django.db.models import Count, Q, Sum
-from django.db.models.functions import TruncMonth
-from datetime import timedelta
+from .leaderboard import get_top, get_rank
+from .models import DailyActivityStats, UserDailyStats
+from .timeseries import BUCKET_CHOICES, default_range_start, rebucket
+from .timeframes import (
+    TIMEFRAME_CHOICES,
+    get_timeframe_first_day,
+    get_timeframe_start,
+)
+from django.db.models import Count, Max, OuterRef, Subquery, Sum
 from django.utils import timezone
-from datetime import datetime
+from django.utils.http import parse_etags, quote_etag
+from django.core.serializers.json import DjangoJSONEncoder
+import hashlib
+import json
+
+# Counts are allowed to lag this many seconds behind the database
+DASHBOARD_STATISTICS_TTL = 60
 
 
 @extend_schema(
@@ -56,20 +74,8 @@ class DashboardStatisticsView(ErrorHandlingMixin, APIView):
     serializer_class = DashboardStatisticsSerializer
     permission_classes = [AllowAny]
 
-    def get(self, request, *args, **kwargs):
-        timeframe = request.query_params.get("timeframe", "all")
-
-        now = timezone.now()
-
-        match timeframe:
-            case "daily":
-                since = now - timedelta(days=1)
-            case "weekly":
-                since = now - timedelta(days=7)
-            case "monthly":
-                since = now - timedelta(days=30)
-            case _:
-                since = None
+    def get_statistics(self, timeframe):
+        since = get_timeframe_start(timeframe, timezone.now())
 
         active_shillers_count = (
             User.objects.filter(is_active=True, submissions__created_at__gte=since)
@@ -82,40 +88,69 @@ class DashboardStatisticsView(ErrorHandlingMixin, APIView):
         campaign_qs = Campaign.objects.exclude(status=3)
         if since:
             campaign_qs = campaign_qs.filter(created_at__gte=since)
-        total_campaigns_count = campaign_qs.count()
 
         task_qs = Task.objects.exclude(status=2)
         if since:
             task_qs = task_qs.filter(created_at__gte=since)
-        total_tasks_count = task_qs.count()
 
-        submission_qs = Submission.objects.all()
-        if since:
-            submission_qs = submission_qs.filter(created_at__gte=since)
-
-        # Try to get Shill token prices from cache
-        shill_price_usd = cache.get("shill_price_usd")
+        return {
+            "active_shillers": active_shillers_count,
+            "total_campaigns": campaign_qs.count(),
+            "total_tasks": task_qs.count(),
+        }
 
-        # If not found in cache, try to get it directly from Redis
-        if shill_price_usd is None:
-            logger.critical("failed to fetch shill prices from cache trying from redis")
+    def get(self, request, *args, **kwargs):
+        timeframe = request.query_params.get("timeframe", "all")
+        if timeframe not in TIMEFRAME_CHOICES:
+            timeframe = "all"
 
-        logger.critical(f"shill price usd from cache: {shill_price_usd}")
-        serializer = self.serializer_class(
-            {
-                "active_shillers": active_shillers_count,
-                "total_campaigns": total_campaigns_count,
-                "total_tasks": total_tasks_count,
-                "shill_price_usd": shill_price_usd,
-            }
+        statistics = get_or_compute(
+            self.get_cache_key(timeframe),
+            lambda: self.get_statistics(timeframe),
+            ttl=DASHBOARD_STATISTICS_TTL,
         )
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return Response(self.serialize(statistics), status=status.HTTP_200_OK)
+
+    @staticmethod
+    def get_cache_key(timeframe):
+        return f"dashboard_statistics:{timeframe}"
+
+    def serialize(self, statistics):
+        # Refreshed by the fetch_shill_price task; None until its first run
+        shill_price_usd = cache.get("shill_price_usd")
+        return self.serializer_class(
+            {**statistics, "shill_price_usd": shill_price_usd}
+        ).data
+
+
+LEADERBOARD_PARAMETERS = [
+    OpenApiParameter(
+        name="timeframe",
+        description='Rank by activity within a timeframe. Options: "all" (default), "daily" (today), "weekly" (the last 7 days) and "monthly" (the last 30 days), counted in whole days including today.',
+        required=False,
+        type=OpenApiTypes.STR,
+        enum=TIMEFRAME_CHOICES,
+    ),
+    OpenApiParameter(
+        name="limit",
+        description="Number of shillers to return (1-100, default 10).",
+        required=False,
+        type=OpenApiTypes.INT,
+    ),
+    OpenApiParameter(
+        name="offset",
+        description="Number of leaderboard ranks to skip (default 0).",
+        required=False,
+        type=OpenApiTypes.INT,
+    ),
+]
 
 
 @extend_schema(
     tags=["statistics"],
     summary="Get Top Shillers (Basic)",
-    description="Retrieves a list of the top 10 shillers based on their approved submissions count. Includes basic shiller info.",
+    description="Retrieves shillers ranked by approved submissions count from the leaderboard, 10 by default. Use limit/offset to page through ranks. Includes basic shiller info.",
+    parameters=LEADERBOARD_PARAMETERS,
     responses={
         200: OpenApiResponse(
             response=TopShillersSerializer(many=True),
@@ -123,23 +158,62 @@ class DashboardStatisticsView(ErrorHandlingMixin, APIView):
         )
     },
 )
-class TopShillersView(ErrorHandlingMixin, APIView):
+class TopShillersView(EdgeCacheMixin, ErrorHandlingMixin, APIView):
     serializer_class = TopShillersSerializer
     permission_classes = [AllowAny]
+    surrogate_keys = ("submission", "user")
+
+    def get_user_queryset(self):
+        return User.objects.all()
+
+    def get_ranked_entries(self, limit, offset, timeframe):
+        first_day = get_timeframe_first_day(timeframe, timezone.localdate())
+        if first_day is None:
+            return [
+                {"user_id": user_id, "approved": approved}
+                for user_id, approved in get_top(offset=offset, limit=limit)
+            ]
+        # Range-sum over the daily rollups instead of counting raw submissions
+        return list(
+            UserDailyStats.objects.filter(day__gte=first_day)
+            .values("user_id")
+            .annotate(
+                approved=Sum("approved_count"),
+                submissions=Sum("submission_count"),
+                rewards=Sum("reward_sum"),
+            )
+            .filter(approved__gt=0)
+            .order_by("-approved", "user_id")[offset : offset + limit]
+        )
+
+    def get_top_shillers(self, limit, offset, timeframe="all"):
+        entries = self.get_ranked_entries(limit, offset, timeframe)
+        users = self.get_user_queryset().in_bulk(
+            [entry["user_id"] for entry in entries]
+        )
+
+        top_shillers = []
+        for entry in entries:
+            user = users.get(entry["user_id"])
+            if user is None:
+                continue
+            user.approved_submissions_count = entry["approved"]
+            if "submissions" in entry:
+                # Approvals in the window may belong to older submissions
+                user.total_submissions_count = max(
+                    entry["submissions"], entry["approved"]
+                )
+                user.total_rewards_sum = entry["rewards"]
+            else:
+                user.total_submissions_count = user.total_submissions
+            top_shillers.append(user)
+        return top_shillers
 
     def get(self, request):
+        query = LeaderboardQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
 
-        top_shillers = (
-            User.objects.annotate(
-                approved_submissions_count=Count(
-                    "submissions",
-                    filter=Q(submissions__status=2),
-                ),
-                total_submissions_count=Count("submissions"),
-            )
-            .filter(approved_submissions_count__gt=0)
-            .order_by("-approved_submissions_count")[:10]
-        )
+        top_shillers = self.get_top_shillers(**query.validated_data)
 
         serializer = self.serializer_class(
             top_shillers, many=True, context={"request": request}
@@ -147,10 +221,41 @@ class TopShillersView(ErrorHandlingMixin, APIView):
         return Response(serializer.data, status=status.HTTP_200_OK)
 
 
+@extend_schema(
+    tags=["statistics"],
+    summary="Get My Leaderboard Rank",
+    description="Returns the authenticated user's rank by approved submissions. Rank is null when the user has no approved submissions.",
+    responses={
+        200: OpenApiResponse(
+            response=LeaderboardRankSerializer,
+            description="Rank retrieved successfully.",
+        ),
+        401: OpenApiResponse(
+            description="Authentication credentials were not provided."
+        ),
+    },
+)
+class MyLeaderboardRankView(ErrorHandlingMixin, APIView):
+    serializer_class = LeaderboardRankSerializer
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        rank, approved, ranked_users = get_rank(request.user.id)
+        serializer = self.serializer_class(
+            {
+                "rank": rank,
+                "approved_submissions_count": approved,
+                "ranked_users": ranked_users,
+            }
+        )
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+
 @extend_schema(
     tags=["statistics"],
     summary="Get Top Shillers (Extended)",
-    description="Retrieves a list of the top 10 shillers with extended information, including role and join date.",
+    description="Retrieves shillers ranked by approved submissions with extended information, including role and join date.",
+    parameters=LEADERBOARD_PARAMETERS,
     responses={
         200: OpenApiResponse(
             response=TopShillersExtendedSerializer(many=True),
@@ -162,15 +267,78 @@ class TopShillersExtendedView(TopShillersView):
     permission_classes = [AllowAny]
     serializer_class = TopShillersExtendedSerializer
 
+    def get_user_queryset(self):
+        # Everything the extended card needs comes with the user row, so the
+        # response costs one query regardless of how many shillers are returned.
+        total_rewards = (
+            Reward.objects.filter(user=OuterRef("pk"))
+            .values("user")
+            .annotate(total=Sum("reward"))
+            .values("total")
+        )
+        last_approved_at = (
+            Submission.objects.filter(user=OuterRef("pk"), status=2)
+            .values("user")
+            .annotate(last=Max("approved_at"))
+            .values("last")
+        )
+        return User.objects.annotate(
+            total_rewards_sum=Subquery(total_rewards),
+            last_approved_at=Subquery(last_approved_at),
+        )
+
     def get(self, request, *args, **kwargs):
 
         return super().get(request, *args, **kwargs)
 
 
+GRAPH_PARAMETERS = [
+    OpenApiParameter(
+        name="from",
+        description="First day of the range (YYYY-MM-DD). Defaults to 30 days, 12 weeks or 12 months before `to`, depending on the bucket.",
+        required=False,
+        type=OpenApiTypes.DATE,
+    ),
+    OpenApiParameter(
+        name="to",
+        description="Last day of the range (YYYY-MM-DD). Defaults to today.",
+        required=False,
+        type=OpenApiTypes.DATE,
+    ),
+    OpenApiParameter(
+        name="bucket",
+        description='Bucket size. Options: "day", "week", "month" (default).',
+        required=False,
+        type=OpenApiTypes.STR,
+        enum=BUCKET_CHOICES,
+    ),
+]
+
+
+class GraphRangeMixin:
+    """Reads daily rollup rows for the requested range and re-buckets them."""
+
+    def get_range(self, request):
+        query = GraphRangeSerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        return (
+            query.validated_data["start"],
+            query.validated_data["end"],
+            query.validated_data["bucket"],
+        )
+
+    def get_series(self, start, end, bucket, fields):
+        rows = DailyActivityStats.objects.filter(day__range=(start, end)).values(
+            "day", *fields
+        )
+        return rebucket(rows, start, end, bucket, fields)
+
+
 @extend_schema(
     tags=["graphs"],
     summary="Campaign Activity Graph Data",
-    description="Provides data for the campaign activity graph, showing task capacity (sum of task quantities) and approved submissions over time (monthly).",
+    description="Provides data for the campaign activity graph: task capacity (sum of task quantities of tasks created) and approved submissions per day, week or month over a date range. Empty buckets are included with zeroes.",
+    parameters=GRAPH_PARAMETERS,
     responses={
         200: OpenApiResponse(
             response=CampaignGraphSerializer(many=True),
@@ -179,8 +347,18 @@ class TopShillersExtendedView(TopShillersView):
                 OpenApiExample(
                     "Example Campaign Graph Data",
                     value=[
-                        {"name": "Jan", "tasks": 50, "submissions": 30},
-                        {"name": "Feb", "tasks": 70, "submissions": 55},
+                        {
+                            "name": "Jan 2025",
+                            "start": "2025-01-01",
+                            "tasks": 50,
+                            "submissions": 30,
+                        },
+                        {
+                            "name": "Feb 2025",
+                            "start": "2025-02-01",
+                            "tasks": 70,
+                            "submissions": 55,
+                        },
                     ],
                     response_only=True,
                 )
@@ -188,75 +366,37 @@ class TopShillersExtendedView(TopShillersView):
         )
     },
 )
-class CampaignGraphView(ErrorHandlingMixin, APIView):
+class CampaignGraphView(GraphRangeMixin, EdgeCacheMixin, ErrorHandlingMixin, APIView):
     serializer_class = CampaignGraphSerializer
     permission_classes = [AllowAny]
+    # Served from rollups that refresh every few minutes, so no purge keys
+    edge_cache_seconds = 300
 
     def get(self, request, *args, **kwargs):
-        # Get monthly task capacity (sum of task.quantity for tasks created in that month)
-        tasks_capacity_by_month = (
-            Task.objects.annotate(month=TruncMonth("created_at"))
-            .values("month")
-            .annotate(total_task_quantity=Sum("quantity"))
-            .order_by("month")
+        return Response(
+            self.get_graph(*self.get_range(request)), status=status.HTTP_200_OK
         )
 
-        # Get monthly approved submissions (count of approved submissions created in that month)
-        approved_submissions_by_month = (
-            Submission.objects.filter(status=2)
-            .annotate(month=TruncMonth("created_at"))
-            .values("month")
-            .annotate(approved_submission_count=Count("id"))
-            .order_by("month")
-        )
-
-        # Combine the data
-        # Create a dictionary for easy lookup
-        tasks_dict = {
-            item["month"].strftime("%Y-%m"): item["total_task_quantity"]
-            for item in tasks_capacity_by_month
-        }
-        submissions_dict = {
-            item["month"].strftime("%Y-%m"): item["approved_submission_count"]
-            for item in approved_submissions_by_month
-        }
-
-        # Get all unique months from both datasets, ensuring they are datetime objects for sorting
-        all_months_datetime = sorted(
-            list(
-                set(
-                    [item["month"] for item in tasks_capacity_by_month]
-                    + [item["month"] for item in approved_submissions_by_month]
-                )
-            )
+    def get_graph(self, start, end, bucket):
+        series = self.get_series(
+            start, end, bucket, ["task_capacity", "approved_submissions"]
         )
-
-        formatted_data = []
-        for month_dt in all_months_datetime:
-            month_str_lookup = month_dt.strftime("%Y-%m")
-            month_display_name = month_dt.strftime("%b")  # For "Jan", "Feb"
-
-            formatted_data.append(
-                {
-                    "name": month_display_name,
-                    "tasks": tasks_dict.get(
-                        month_str_lookup, 0
-                    ),  # Represents task capacity
-                    "submissions": submissions_dict.get(
-                        month_str_lookup, 0
-                    ),  # Represents approved submissions
-                }
-            )
-
-        # The serializer is simple (name, tasks, submissions), so direct construction is fine
-        # If serializer had more complex validation/transformation, you'd use it here.
-        return Response(formatted_data, status=status.HTTP_200_OK)
+        return [
+            {
+                "name": item["name"],
+                "start": item["start"],
+                "tasks": item["task_capacity"],  # Represents task capacity
+                "submissions": item["approved_submissions"],
+            }
+            for item in series
+        ]
 
 
 @extend_schema(
     tags=["graphs"],
     summary="Reward Distribution Graph Data",
-    description="Retrieves data for the reward distribution graph. Currently returns all reward records.",
+    description="Retrieves total rewards issued per day, week or month over a date range. Empty buckets are included with zeroes.",
+    parameters=GRAPH_PARAMETERS,
     responses={
         200: OpenApiResponse(
             response=RewardGraphSerializer(many=True),
@@ -264,40 +404,26 @@ class CampaignGraphView(ErrorHandlingMixin, APIView):
         )
     },
 )
-class RewardGraphView(ErrorHandlingMixin, APIView):
+class RewardGraphView(GraphRangeMixin, EdgeCacheMixin, ErrorHandlingMixin, APIView):
     permission_classes = [AllowAny]
     serializer_class = RewardGraphSerializer
+    edge_cache_seconds = 300
 
     def get(self, request, *args, **kwargs):
-        rewards_by_month = (
-            Reward.objects.annotate(month=TruncMonth("created_at"))
-            .values("month")
-            .annotate(total_rewards=Sum("reward"))
-            .order_by("month")[:10]
+        return Response(
+            self.get_graph(*self.get_range(request)), status=status.HTTP_200_OK
         )
 
-        rewards_dict = {
-            item["month"].strftime("%Y-%m"): float(item["total_rewards"])
-            for item in rewards_by_month
-        }
-
-        all_months_sorted = rewards_dict.keys()
-
-        formatted_data = []
-
-        for month_str in all_months_sorted:
-
-            month_dt = datetime.strptime(month_str, "%Y-%m")
-
-            month_display_name = month_dt.strftime("%b")
-
-            formatted_data.append(
-                {
-                    "name": month_display_name,
-                    "rewards": rewards_dict.get(month_str, 0),
-                }
-            )
-        return Response(formatted_data, status=status.HTTP_200_OK)
+    def get_graph(self, start, end, bucket):
+        series = self.get_series(start, end, bucket, ["reward_total"])
+        return [
+            {
+                "name": item["name"],
+                "start": item["start"],
+                "rewards": float(item["reward_total"]),
+            }
+            for item in series
+        ]
 
 
 TIER_LABELS = {
@@ -333,15 +459,110 @@ TIER_LABELS = {
         )
     },
 )
-class TierDistributionGraphView(ErrorHandlingMixin, APIView):
+class TierDistributionGraphView(
+    ConditionalGetMixin, EdgeCacheMixin, ErrorHandlingMixin, APIView
+):
     serializer_class = TierDistributionGraphSerializer
     permission_classes = [AllowAny]
+    etag_versions = ("user",)
+    edge_cache_seconds = 300
+    surrogate_keys = ("user",)
 
     def get(self, request, *args, **kwargs):
+        return Response(self.get_tiers(), status=status.HTTP_200_OK)
+
+    def get_tiers(self):
         data = User.objects.values("tier").annotate(value=Count("id")).order_by("tier")
 
         tiers = [
             {"name": TIER_LABELS[item["tier"]], "value": item["value"]} for item in data
         ]
-        serializer = self.serializer_class(tiers, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return self.serializer_class(tiers, many=True).data
+
+
+# Widgets in the bundle may lag this many seconds behind their own endpoints
+DASHBOARD_BUNDLE_TTL = 60
+
+
+@extend_schema(
+    tags=["statistics"],
+    summary="Get Dashboard Bundle",
+    description="Returns the statistics, top shillers, campaign graph, reward graph and tier graph payloads in one response, each with its endpoint's default parameters. Widgets are cached briefly and missing ones are computed concurrently. Send the returned ETag in If-None-Match to get a 304 when nothing changed.",
+    responses={
+        200: OpenApiResponse(
+            response=DashboardBundleSerializer,
+            description="Dashboard bundle retrieved successfully.",
+        ),
+        304: OpenApiResponse(description="Bundle matches the given ETag."),
+    },
+)
+class DashboardBundleView(EdgeCacheMixin, ErrorHandlingMixin, APIView):
+    serializer_class = DashboardBundleSerializer
+    permission_classes = [AllowAny]
+    surrogate_keys = ("campaign", "task", "submission", "user")
+
+    def get_widgets(self):
+        """Widget name -> (cache key, callable computing the widget payload)."""
+        end = timezone.localdate()
+        start = default_range_start(end, "month")
+        top_shillers = TopShillersView()
+
+        return {
+            "statistics": (
+                DashboardStatisticsView.get_cache_key("all"),
+                lambda: DashboardStatisticsView().get_statistics("all"),
+            ),
+            # Shared by every caller, so serialized without the request: image
+            # URLs stay relative until get() builds them for the current host
+            "top_shillers": (
+                "dashboard_bundle:top_shillers",
+                lambda: list(
+                    TopShillersSerializer(
+                        top_shillers.get_top_shillers(limit=10, offset=0),
+                        many=True,
+                    ).data
+                ),
+            ),
+            "campaigns_graph": (
+                f"dashboard_bundle:campaigns_graph:{end}",
+                lambda: CampaignGraphView().get_graph(start, end, "month"),
+            ),
+            "rewards_graph": (
+                f"dashboard_bundle:rewards_graph:{end}",
+                lambda: RewardGraphView().get_graph(start, end, "month"),
+            ),
+            "tier_graph": (
+                "dashboard_bundle:tier_graph",
+                lambda: list(TierDistributionGraphView().get_tiers()),
+            ),
+        }
+
+    def get(self, request, *args, **kwargs):
+        widgets = self.get_widgets()
+        values = get_many_or_compute(
+            {key: compute for key, compute in widgets.values()},
+            ttl=DASHBOARD_BUNDLE_TTL,
+        )
+        bundle = {name: values[key] for name, (key, _) in widgets.items()}
+        bundle["top_shillers"] = [
+            {
+                **shiller,
+                "image": shiller["image"]
+                and request.build_absolute_uri(shiller["image"]),
+            }
+            for shiller in bundle["top_shillers"]
+        ]
+        # The statistics entry is shared with the standalone endpoint, which
+        # adds the live token price on top of the cached counts.
+        bundle["statistics"] = DashboardStatisticsView().serialize(bundle["statistics"])
+
+        digest = hashlib.md5(
+            json.dumps(bundle, sort_keys=True, cls=DjangoJSONEncoder).encode()
+        ).hexdigest()
+        etag = quote_etag(digest)
+        if etag in parse_etags(request.headers.get("If-None-Match", "")):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = Response(bundle, status=status.HTTP_200_OK)
+        response["ETag"] = etag
+        return response
@@ -0,0 +1,45 @@
+# Generated by Django 5.2.18 on 2026-10-16 23:22
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def detach_duplicate_rewards(apps, schema_editor):
+    """Keeps the earliest reward per submission; later duplicates are unlinked, not deleted."""
+    Reward = apps.get_model("reward", "Reward")
+    seen = set()
+    duplicate_ids = []
+    for reward_id, submission_id in (
+        Reward.objects.filter(submission__isnull=False)
+        .order_by("submission_id", "id")
+        .values_list("id", "submission_id")
+    ):
+        if submission_id in seen:
+            duplicate_ids.append(reward_id)
+        seen.add(submission_id)
+    if duplicate_ids:
+        Reward.objects.filter(pk__in=duplicate_ids).update(submission=None)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("reward", "0007_alter_reward_created_at_alter_reward_reward_and_more"),
+        (
+            "submission",
+            "0005_alter_submission_created_at_alter_submission_link_and_more",
+        ),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(detach_duplicate_rewards, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="reward",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("submission__isnull", False)),
+                fields=("submission",),
+                name="unique_reward_per_submission",
+            ),
+        ),
+    ]
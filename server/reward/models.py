@@ -29,3 +29,12 @@ class Reward(models.Model):
                 fields=["created_at", "reward"],
             )
         ]
+        constraints = [
+            # One reward per approved submission; bulk grading relies on this to
+            # skip rewards that were already issued.
+            models.UniqueConstraint(
+                fields=["submission"],
+                condition=models.Q(submission__isnull=False),
+                name="unique_reward_per_submission",
+            )
+        ]
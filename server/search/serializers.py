@@ -0,0 +1,27 @@
+from rest_framework import serializers
+
+SEARCH_TYPES = ("dao", "campaign", "task")
+
+
+class SearchQuerySerializer(serializers.Serializer):
+    q = serializers.CharField(min_length=2, max_length=100, trim_whitespace=True)
+    types = serializers.CharField(required=False, default=",".join(SEARCH_TYPES))
+    limit = serializers.IntegerField(min_value=1, max_value=50, default=20)
+
+    def validate_types(self, value):
+        types = [item.strip() for item in value.split(",") if item.strip()]
+        unknown = set(types) - set(SEARCH_TYPES)
+        if not types or unknown:
+            raise serializers.ValidationError(
+                f"Comma-separated subset of: {', '.join(SEARCH_TYPES)}."
+            )
+        return list(dict.fromkeys(types))
+
+
+class SearchHitSerializer(serializers.Serializer):
+    type = serializers.ChoiceField(choices=SEARCH_TYPES)
+    id = serializers.IntegerField()
+    title = serializers.CharField()
+    score = serializers.FloatField()
+    dao_id = serializers.IntegerField(allow_null=True)
+    campaign_id = serializers.IntegerField(allow_null=True)
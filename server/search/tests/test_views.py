@@ -0,0 +1,148 @@
+from django.contrib.postgres.search import SearchQuery
+from django.core.cache import cache
+from django.db import connection
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from campaign.models import Campaign
+from dao.models import DAO
+from search.views import SearchView, description_vector
+from task.models import Task
+from utils.redis_client import get_redis_client
+
+
+class SearchViewTests(APITestCase):
+    def setUp(self):
+        # ETags derive from data versions, which persist in Redis across runs
+        get_redis_client().flushdb()
+        cache.clear()
+        self.url = reverse("search")
+        self.uniswap = DAO.objects.create(name="Uniswap", network=0)
+        self.aave = DAO.objects.create(name="Aave", network=0)
+        # Unlisted: no campaigns
+        DAO.objects.create(name="Uniswap Labs", network=0)
+
+        self.campaign = Campaign.objects.create(
+            dao=self.uniswap,
+            name="Liquidity Drive",
+            description="Grow liquidity on the new pools.",
+            budget=1000,
+        )
+        self.other_campaign = Campaign.objects.create(
+            dao=self.aave,
+            name="Lending Launch",
+            description="Explain flash loans to newcomers.",
+            budget=1000,
+        )
+        self.task = Task.objects.create(
+            campaign=self.campaign,
+            description="Record a video tutorial about providing liquidity.",
+            reward=10,
+            quantity=5,
+        )
+        Task.objects.create(
+            campaign=self.campaign,
+            description="Write a thread about liquidity mining.",
+            reward=10,
+            quantity=5,
+            status=2,
+        )
+
+    def hits(self, response):
+        return [(hit["type"], hit["id"]) for hit in response.data]
+
+    def test_dao_name_matches_with_typos(self):
+        response = self.client.get(self.url, {"q": "uniswp"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.hits(response), [("dao", self.uniswap.id)])
+        self.assertEqual(response.data[0]["title"], "Uniswap")
+        self.assertIsNone(response.data[0]["dao_id"])
+
+    def test_descriptions_match_stemmed_words_across_types(self):
+        response = self.client.get(self.url, {"q": "liquid"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        hits = self.hits(response)
+        # The completed task is left out
+        self.assertCountEqual(
+            hits, [("campaign", self.campaign.id), ("task", self.task.id)]
+        )
+        scores = [hit["score"] for hit in response.data]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+        task_hit = next(hit for hit in response.data if hit["type"] == "task")
+        self.assertEqual(task_hit["campaign_id"], self.campaign.id)
+        self.assertEqual(task_hit["dao_id"], self.uniswap.id)
+
+    def test_campaign_name_outranks_description_only_match(self):
+        Campaign.objects.create(
+            dao=self.aave,
+            name="Pool Party",
+            description="Bring liquidity drive energy to the pools.",
+            budget=10,
+        )
+        response = self.client.get(
+            self.url, {"q": "liquidity drive", "types": "campaign"}
+        )
+        self.assertEqual(response.data[0]["id"], self.campaign.id)
+        self.assertEqual(response.data[0]["dao_id"], self.uniswap.id)
+
+    def test_types_and_limit(self):
+        response = self.client.get(
+            self.url, {"q": "liquidity", "types": "task", "limit": 1}
+        )
+        self.assertEqual(self.hits(response), [("task", self.task.id)])
+
+    def test_invalid_parameters(self):
+        for params in (
+            {},
+            {"q": "a"},
+            {"q": "liquidity", "types": "user"},
+            {"q": "liquidity", "limit": 0},
+        ):
+            with self.subTest(params=params):
+                response = self.client.get(self.url, params)
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_search_is_answered_in_one_query_per_type(self):
+        with self.assertNumQueries(3):
+            self.client.get(self.url, {"q": "uniswap"})
+
+    def test_not_modified_until_a_campaign_changes(self):
+        response = self.client.get(self.url, {"q": "liquidity"})
+        etag = response["ETag"]
+        response = self.client.get(
+            self.url, {"q": "liquidity"}, HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.campaign.description = "Something else entirely."
+            self.campaign.save()
+        response = self.client.get(
+            self.url, {"q": "liquidity"}, HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+class SearchIndexTests(APITestCase):
+    def explain(self, queryset):
+        with connection.cursor() as cursor:
+            # Tables are tiny here, so the planner must be kept off seq scans
+            cursor.execute("SET LOCAL enable_seqscan = off")
+            return queryset.explain()
+
+    def test_explorer_name_filter_uses_trigram_index(self):
+        plan = self.explain(DAO.objects.filter(name__icontains="swap"))
+        self.assertIn("dao_name_upper_trgm_idx", plan)
+
+    def test_search_queries_use_their_indexes(self):
+        view = SearchView()
+        # The listed-DAO partial indexes compete with it on an empty table
+        plan = self.explain(DAO.objects.filter(name__trigram_word_similar="uni"))
+        self.assertIn("dao_name_trgm_idx", plan)
+        campaign_plan = self.explain(view.search_campaigns("uni", 5))
+        self.assertIn("campaign_name_trgm_idx", campaign_plan)
+        self.assertIn("campaign_description_fts_idx", campaign_plan)
+        tasks = Task.objects.annotate(document=description_vector()).filter(
+            document=SearchQuery("uni", config="english")
+        )
+        self.assertIn("task_description_fts_idx", self.explain(tasks))
@@ -0,0 +1,139 @@
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+    TrigramWordSimilarity,
+)
+from django.db.models import F, IntegerField, Q, Value
+from django.db.models.functions import Greatest, Left
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, OpenApiResponse, extend_schema
+from rest_framework import status
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from campaign.models import Campaign
+from dao.models import DAO
+from task.models import Task
+from utils.conditional import ConditionalGetMixin
+from utils.edge_cache import EdgeCacheMixin
+from utils.exception_handler import ErrorHandlingMixin
+from .serializers import SearchHitSerializer, SearchQuerySerializer
+
+# Task hits have no name, so they are titled with the start of the description
+TASK_TITLE_LENGTH = 120
+# rank / (rank + 1), which keeps full-text ranks in [0, 1) like trigram scores
+RANK_NORMALIZATION = 32
+
+
+def description_vector():
+    # Must match the expression of the *_description_fts_idx indexes
+    return SearchVector("description", config="english")
+
+
+@extend_schema(
+    tags=["search"],
+    summary="Search DAOs, campaigns and tasks",
+    description="Returns ranked hits across DAOs, campaigns and tasks. DAO and campaign names are matched by trigram word similarity, so partial and misspelt names still match; campaign and task descriptions are matched by full-text search (web search syntax). Each type contributes at most `limit` hits before they are merged by score. Only listed DAOs and ongoing tasks are returned.",
+    parameters=[
+        OpenApiParameter(
+            name="q",
+            description="Search text, at least 2 characters.",
+            required=True,
+            type=OpenApiTypes.STR,
+        ),
+        OpenApiParameter(
+            name="types",
+            description="Comma-separated subset of dao, campaign and task. Defaults to all.",
+            required=False,
+            type=OpenApiTypes.STR,
+        ),
+        OpenApiParameter(
+            name="limit",
+            description="Maximum number of hits (1-50, default 20).",
+            required=False,
+            type=OpenApiTypes.INT,
+        ),
+    ],
+    responses={
+        200: OpenApiResponse(
+            response=SearchHitSerializer(many=True),
+            description="Hits ordered by score, best first.",
+        ),
+        400: OpenApiResponse(description="Invalid query parameters."),
+    },
+)
+class SearchView(ConditionalGetMixin, EdgeCacheMixin, ErrorHandlingMixin, APIView):
+    serializer_class = SearchHitSerializer
+    permission_classes = [AllowAny]
+    etag_versions = ("dao", "campaign", "task")
+
+    def get(self, request, *args, **kwargs):
+        query = SearchQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+
+        hits = self.search(**query.validated_data)
+
+        serializer = self.serializer_class(hits, many=True)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+    def search(self, q, types, limit):
+        searches = {
+            "dao": self.search_daos,
+            "campaign": self.search_campaigns,
+            "task": self.search_tasks,
+        }
+        hits = []
+        for type_ in types:
+            hits.extend(dict(hit, type=type_) for hit in searches[type_](q, limit))
+        hits.sort(key=lambda hit: hit["score"], reverse=True)
+        return hits[:limit]
+
+    def search_daos(self, q, limit):
+        return (
+            DAO.objects.filter(campaign_count__gt=0, name__trigram_word_similar=q)
+            .annotate(
+                title=F("name"),
+                score=TrigramWordSimilarity(q, "name"),
+                dao_id=Value(None, output_field=IntegerField()),
+                campaign_id=Value(None, output_field=IntegerField()),
+            )
+            .order_by("-score", "-id")
+            .values("id", "title", "score", "dao_id", "campaign_id")[:limit]
+        )
+
+    def search_campaigns(self, q, limit):
+        query = SearchQuery(q, config="english", search_type="websearch")
+        return (
+            Campaign.objects.annotate(document=description_vector())
+            .filter(Q(name__trigram_word_similar=q) | Q(document=query))
+            .annotate(
+                title=F("name"),
+                score=Greatest(
+                    TrigramWordSimilarity(q, "name"),
+                    SearchRank(
+                        F("document"), query, normalization=Value(RANK_NORMALIZATION)
+                    ),
+                ),
+                campaign_id=Value(None, output_field=IntegerField()),
+            )
+            .order_by("-score", "-id")
+            .values("id", "title", "score", "dao_id", "campaign_id")[:limit]
+        )
+
+    def search_tasks(self, q, limit):
+        query = SearchQuery(q, config="english", search_type="websearch")
+        return (
+            Task.objects.filter(status=1)
+            .annotate(document=description_vector())
+            .filter(document=query)
+            .annotate(
+                title=Left("description", TASK_TITLE_LENGTH),
+                score=SearchRank(
+                    F("document"), query, normalization=Value(RANK_NORMALIZATION)
+                ),
+                dao_id=F("campaign__dao_id"),
+            )
+            .order_by("-score", "-id")
+            .values("id", "title", "score", "dao_id", "campaign_id")[:limit]
+        )
@@ -0,0 +1,102 @@
+from collections import defaultdict
+from django.db.models import F
+from core.models import User
+from task.models import Task
+from .totals import record_status_totals
+from .overview import invalidate_submissions_overview
+from metrics.leaderboard import record_approval_deltas
+from utils.conditional import bump_data_version
+
+# Submission.STATUS_CHOICES -> denormalized counter on core.User
+STATUS_COUNTER_FIELDS = {
+    1: "pending_submissions",
+    2: "approved_submissions",
+    3: "rejected_submissions",
+}
+# Pending and approved submissions hold one of their task's slots
+SLOT_HOLDING_STATUSES = {1, 2}
+
+
+def record_status_changes(changes):
+    """
+    Applies submission status transitions to the per-user counters and
+    re-evaluates the tier of users whose existing submissions moved into or out
+    of the approved state (the same trigger the tier signal always used). The
+    global per-status totals, the approvals leaderboard, the affected users'
+    cached overviews and the submission data version are updated for the same
+    transitions.
+
+    `changes` is an iterable of (user_id, old_status, new_status) tuples where
+    old_status is None for new submissions and new_status is None for deleted ones.
+    """
+    deltas = defaultdict(lambda: defaultdict(int))
+    status_deltas = defaultdict(int)
+    tier_user_ids = set()
+    for user_id, old_status, new_status in changes:
+        if old_status == new_status:
+            continue
+        if old_status is not None:
+            status_deltas[old_status] -= 1
+        if new_status is not None:
+            status_deltas[new_status] += 1
+        if user_id is None:
+            continue
+        if old_status is not None and 2 in (old_status, new_status):
+            tier_user_ids.add(user_id)
+        user_deltas = deltas[user_id]
+        if old_status is None:
+            user_deltas["total_submissions"] += 1
+        else:
+            user_deltas[STATUS_COUNTER_FIELDS[old_status]] -= 1
+        if new_status is None:
+            user_deltas["total_submissions"] -= 1
+        else:
+            user_deltas[STATUS_COUNTER_FIELDS[new_status]] += 1
+
+    for user_id, user_deltas in deltas.items():
+        updates = {
+            field: F(field) + delta for field, delta in user_deltas.items() if delta
+        }
+        if updates:
+            User.objects.filter(pk=user_id).update(**updates)
+
+    if tier_user_ids:
+        User.objects.refresh_tiers(tier_user_ids)
+
+    record_status_totals(status_deltas)
+    record_approval_deltas(
+        {
+            user_id: user_deltas["approved_submissions"]
+            for user_id, user_deltas in deltas.items()
+        }
+    )
+    invalidate_submissions_overview(deltas.keys())
+    if any(status_deltas.values()):
+        bump_data_version("submission")
+
+
+def update_task_slots(changes):
+    """
+    Gives back the task slot of submissions that held one and were rejected or
+    deleted, and takes a slot again, while the task has room, when a rejection is
+    reverted. Updates `holds_slot` on the given instances; saving it is left to
+    the caller.
+
+    `changes` is an iterable of (submission, old_status, new_status) tuples where
+    new_status is None for deleted submissions. New submissions are skipped:
+    SubmitTaskView reserves their slot before they are saved.
+    """
+    releases = defaultdict(int)
+    for submission, old_status, new_status in changes:
+        if submission.task_id is None or old_status is None:
+            continue
+        if submission.holds_slot and new_status not in SLOT_HOLDING_STATUSES:
+            releases[submission.task_id] += 1
+            submission.holds_slot = False
+        elif (
+            not submission.holds_slot
+            and old_status not in SLOT_HOLDING_STATUSES
+            and new_status in SLOT_HOLDING_STATUSES
+        ):
+            submission.holds_slot = Task.objects.retake_slot(submission.task_id)
+    Task.objects.release_slots(releases)
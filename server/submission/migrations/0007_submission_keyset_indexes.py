@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-16 23:24
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("submission", "0006_submission_claim_lease"),
+        ("task", "0003_alter_task_deadline"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="submission",
+            index=models.Index(
+                fields=["status", "created_at", "id"],
+                name="submission_status_created_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="submission",
+            index=models.Index(
+                fields=["user", "created_at", "id"], name="submission_user_created_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-16 23:30
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("submission", "0007_submission_keyset_indexes"),
+        ("task", "0004_task_filled"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="submission",
+            index=models.Index(
+                fields=["status", "updated_at"], name="submission_status_updated_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.18 on 2026-10-17 00:09
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import F
+
+
+def backfill_approved_at(apps, schema_editor):
+    Submission = apps.get_model("submission", "Submission")
+    # The last update is the closest record of when existing approvals happened
+    Submission.objects.filter(status=2).update(approved_at=F("updated_at"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("submission", "0008_submission_status_updated_idx"),
+        ("task", "0006_recount_task_filled"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="submission",
+            name="submission_status_updated_idx",
+        ),
+        migrations.AddField(
+            model_name="submission",
+            name="approved_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.RunPython(backfill_approved_at, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="submission",
+            index=models.Index(
+                fields=["status", "approved_at"], name="submission_status_approved_idx"
+            ),
+        ),
+    ]
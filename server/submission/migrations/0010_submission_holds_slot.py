@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-17 00:20
+
+from django.db import migrations, models
+
+
+def backfill_holds_slot(apps, schema_editor):
+    Task = apps.get_model("task", "Task")
+    Submission = apps.get_model("submission", "Submission")
+    # task.0006 counted each task's pending and approved submissions up to its
+    # quantity as filled; the earliest of them are the ones holding those slots
+    for task in Task.objects.only("id", "quantity").iterator():
+        holding = (
+            Submission.objects.filter(task=task, status__in=[1, 2])
+            .order_by("created_at", "id")
+            .values_list("id", flat=True)[: task.quantity]
+        )
+        Submission.objects.filter(pk__in=list(holding)).update(holds_slot=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("submission", "0009_submission_approved_at"),
+        ("task", "0007_task_closed_when_full"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="submission",
+            name="holds_slot",
+            field=models.BooleanField(default=False),
+        ),
+        migrations.RunPython(backfill_holds_slot, migrations.RunPython.noop),
+    ]
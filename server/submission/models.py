@@ -56,8 +56,55 @@ class Submission(models.Model):
     # choices=MULTIPLIER_CHOICES, null=True, blank=True
     # )
     feedback = models.TextField(null=True, blank=True)
+    # grading queue lease: a moderator owns the submission until the lease expires
+    claimed_by = models.ForeignKey(
+        "core.User",
+        on_delete=models.SET_NULL,
+        related_name="claimed_submissions",
+        null=True,
+        blank=True,
+    )
+    claim_expires_at = models.DateTimeField(null=True, blank=True)
+    # whether the submission took one of its task's slots (see TaskManager)
+    holds_slot = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True, db_index=True)
     updated_at = models.DateTimeField(auto_now=True)
+    # set when the submission last moved into the approved status
+    approved_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            # Only pending rows are ever claimed, so the queue index stays small
+            # no matter how many graded submissions accumulate.
+            models.Index(
+                fields=["created_at", "id"],
+                condition=models.Q(status=1),
+                name="submission_pending_queue_idx",
+            ),
+            # Keyset pagination of the moderation queue and of a user's history
+            models.Index(
+                fields=["status", "created_at", "id"],
+                name="submission_status_created_idx",
+            ),
+            models.Index(
+                fields=["user", "created_at", "id"],
+                name="submission_user_created_idx",
+            ),
+            # Approvals by day for the metrics rollups
+            models.Index(
+                fields=["status", "approved_at"],
+                name="submission_status_approved_idx",
+            ),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the persisted owner/status so signal handlers can tell real
+        # status transitions apart from saves that only touch feedback or proofs.
+        instance._loaded_user_id = instance.__dict__.get("user_id")
+        instance._loaded_status = instance.__dict__.get("status")
+        return instance
 
     def clean(self):
         if not any([self.proof_text, self.proof_image, self.proof_video]):
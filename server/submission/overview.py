@@ -0,0 +1,60 @@
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Q
+from .models import Submission
+
+OVERVIEW_CACHE_TIMEOUT = 60 * 5
+
+PROOF_TYPE_KEYS = {
+    1: "textSubmissions",
+    2: "imageSubmissions",
+    3: "videoSubmissions",
+}
+
+
+def _cache_key(user_id):
+    return f"submissions_overview:{user_id}"
+
+
+def get_submissions_overview(user_id):
+    """
+    The user's submission counts by status and by proof type, computed in a
+    single conditional aggregate and cached until their submissions change.
+    """
+    cache_key = _cache_key(user_id)
+    overview = cache.get(cache_key)
+    if overview is not None:
+        return overview
+
+    aggregates = {
+        "pending": Count("id", filter=Q(status=1)),
+        "approved": Count("id", filter=Q(status=2)),
+        "rejected": Count("id", filter=Q(status=3)),
+    }
+    for proof_type in PROOF_TYPE_KEYS:
+        aggregates[f"total_{proof_type}"] = Count("id", filter=Q(proof_type=proof_type))
+        aggregates[f"approved_{proof_type}"] = Count(
+            "id", filter=Q(proof_type=proof_type, status=2)
+        )
+    counts = Submission.objects.filter(user_id=user_id).aggregate(**aggregates)
+
+    overview = {
+        "pendingSubmissions": counts["pending"],  # Keep camelCase for frontend
+        "approvedSubmissions": counts["approved"],
+        "rejectedSubmissions": counts["rejected"],
+    }
+    for proof_type, key in PROOF_TYPE_KEYS.items():
+        overview[key] = {
+            "total": counts[f"total_{proof_type}"],
+            "approved": counts[f"approved_{proof_type}"],
+        }
+
+    cache.set(cache_key, overview, timeout=OVERVIEW_CACHE_TIMEOUT)
+    return overview
+
+
+def invalidate_submissions_overview(user_ids):
+    """Drops the cached overviews once the current transaction commits."""
+    keys = [_cache_key(user_id) for user_id in user_ids if user_id is not None]
+    if keys:
+        transaction.on_commit(lambda: cache.delete_many(keys))
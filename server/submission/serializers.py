@@ -1,9 +1,18 @@
+from collections import defaultdict
+from decimal import Decimal
 from .models import Submission
 from rest_framework import serializers
 from task.serializers import TaskLiteSerializer  # Added import
 from core.models import User
 from reward.models import Reward
+from django.conf import settings
 from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from datetime import timedelta
+from campaign.models import Campaign
+from campaign.progress import schedule_progress_update
+from .counters import record_status_changes, update_task_slots
 
 
 def drop_proof(representation, instance):
@@ -195,6 +204,9 @@ class GradeSubmissionSerializer(serializers.ModelSerializer):
 
         with transaction.atomic():
             old_status = instance.status
+            # Grading releases any queue claim on the submission
+            validated_data["claimed_by"] = None
+            validated_data["claim_expires_at"] = None
             instance = super().update(instance, validated_data)
             new_status = instance.status
             if (
@@ -203,9 +215,178 @@ class GradeSubmissionSerializer(serializers.ModelSerializer):
                 and not Reward.objects.filter(submission=instance).exists()
             ):
                 task_reward = instance.task.reward
-                Reward.objects.get_or_create(
+                _, created = Reward.objects.get_or_create(
                     user=instance.user,
                     submission=instance,
                     defaults={"reward": task_reward},
                 )
+                if created:
+                    Campaign.objects.adjust_budgets(
+                        "spent_budget", {instance.task.campaign_id: task_reward}
+                    )
         return instance
+
+
+class BulkGradeItemSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    status = serializers.ChoiceField(choices=Submission.STATUS_CHOICES)
+    feedback = serializers.CharField(required=False, allow_blank=True, allow_null=True)
+
+
+class BulkGradeSubmissionsSerializer(serializers.Serializer):
+    MAX_ITEMS = 500
+
+    items = BulkGradeItemSerializer(many=True, allow_empty=False, max_length=MAX_ITEMS)
+
+    def validate_items(self, items):
+        ids = [item["id"] for item in items]
+        if len(ids) != len(set(ids)):
+            raise serializers.ValidationError("Each submission can be graded once.")
+
+        missing = set(ids) - set(
+            Submission.objects.filter(pk__in=ids).values_list("id", flat=True)
+        )
+        if missing:
+            raise serializers.ValidationError(
+                f"Submissions not found: {sorted(missing)}"
+            )
+        return items
+
+    def create(self, validated_data):
+        items = {item["id"]: item for item in validated_data["items"]}
+        now = timezone.now()
+
+        with transaction.atomic():
+            submissions = list(
+                Submission.objects.select_for_update(of=("self",))
+                .select_related("task")
+                .filter(pk__in=items)
+                .order_by("pk")
+            )
+
+            changes = []
+            slot_changes = []
+            rewards = []
+            campaign_ids = set()
+            for submission in submissions:
+                item = items[submission.pk]
+                old_status = submission.status
+                submission.status = item["status"]
+                if "feedback" in item:
+                    submission.feedback = item["feedback"]
+                submission.updated_at = now
+                if submission.status == 2 and old_status != 2:
+                    submission.approved_at = now
+                submission.claimed_by = None
+                submission.claim_expires_at = None
+
+                changes.append((submission.user_id, old_status, submission.status))
+                slot_changes.append((submission, old_status, submission.status))
+                if (old_status == 2) != (submission.status == 2):
+                    campaign_ids.add(submission.task.campaign_id)
+                if submission.status == 2 and old_status != 2:
+                    rewards.append(
+                        Reward(
+                            user_id=submission.user_id,
+                            submission=submission,
+                            reward=submission.task.reward,
+                        )
+                    )
+
+            # Re-approvals keep their first reward. The submission rows are
+            # locked, so nothing can issue these rewards concurrently.
+            issued = set(
+                Reward.objects.filter(
+                    submission__in=[reward.submission_id for reward in rewards]
+                ).values_list("submission_id", flat=True)
+            )
+            rewards = [r for r in rewards if r.submission_id not in issued]
+            spent = defaultdict(Decimal)
+            for reward in rewards:
+                spent[reward.submission.task.campaign_id] += reward.reward
+
+            # bulk_update skips the Submission signals, so counters, tiers and
+            # progress are brought up to date once for the whole batch below.
+            update_task_slots(slot_changes)
+            Submission.objects.bulk_update(
+                submissions,
+                [
+                    "status",
+                    "feedback",
+                    "updated_at",
+                    "approved_at",
+                    "holds_slot",
+                    "claimed_by",
+                    "claim_expires_at",
+                ],
+            )
+            Reward.objects.bulk_create(rewards, ignore_conflicts=True)
+            Campaign.objects.adjust_budgets("spent_budget", spent)
+            record_status_changes(changes)
+            for campaign_id in campaign_ids:
+                schedule_progress_update(campaign_id)
+
+        return submissions
+
+    def to_representation(self, submissions):
+        return {
+            "items": [
+                {
+                    "id": submission.id,
+                    "status": submission.get_status_display(),
+                    "feedback": submission.feedback,
+                }
+                for submission in submissions
+            ]
+        }
+
+
+class ClaimSubmissionsSerializer(serializers.Serializer):
+    MAX_LIMIT = 50
+
+    limit = serializers.IntegerField(min_value=1, max_value=MAX_LIMIT, default=10)
+
+    def create(self, validated_data):
+        """
+        Leases the oldest pending submissions that nobody else currently holds.
+        Rows locked by a concurrent claim are skipped rather than waited on, so
+        moderators claiming at the same time always get disjoint batches.
+        """
+        moderator = self.context["request"].user
+        now = timezone.now()
+        expires_at = now + timedelta(seconds=settings.SUBMISSION_CLAIM_LEASE_SECONDS)
+
+        with transaction.atomic():
+            claimed_ids = list(
+                Submission.objects.select_for_update(skip_locked=True)
+                .filter(status=1)
+                .filter(
+                    Q(claimed_by__isnull=True)
+                    | Q(claim_expires_at__lt=now)
+                    | Q(claimed_by=moderator)
+                )
+                .order_by("created_at", "id")
+                .values_list("id", flat=True)[: validated_data["limit"]]
+            )
+            Submission.objects.filter(pk__in=claimed_ids).update(
+                claimed_by=moderator, claim_expires_at=expires_at
+            )
+
+        return {
+            "claim_expires_at": expires_at,
+            "submissions": Submission.objects.select_related(
+                "task__campaign__dao", "user"
+            )
+            .filter(pk__in=claimed_ids)
+            .order_by("created_at", "id"),
+        }
+
+    def to_representation(self, claim):
+        return {
+            "claim_expires_at": serializers.DateTimeField().to_representation(
+                claim["claim_expires_at"]
+            ),
+            "results": GradeSubmissionSerializer(
+                claim["submissions"], many=True, context=self.context
+            ).data,
+        }
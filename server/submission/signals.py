@@ -1,23 +1,108 @@
-from django.db.models.signals import post_save
+from django.db.models.signals import post_save, post_delete, pre_save
 from django.dispatch import receiver
+from django.utils import timezone
+from campaign.progress import schedule_progress_update
 from .models import Submission
+from .counters import record_status_changes, update_task_slots
+
+APPROVED_STATUS = 2
 
 
 @receiver(post_save, sender=Submission)
 def update_campaign_progress_on_submission_save(sender, instance, created, **kwargs):
     """
-    Updates the campaign progress when a submission is saved.
+    Queues a campaign progress update when a submission enters or leaves the
+    approved status. Saves that don't change approval (e.g. feedback) are ignored.
+    """
+    if created:
+        affects_progress = instance.status == APPROVED_STATUS
+    else:
+        old_status = getattr(instance, "_loaded_status", None)
+        affects_progress = (old_status == APPROVED_STATUS) != (
+            instance.status == APPROVED_STATUS
+        )
+
+    if affects_progress and instance.task_id:
+        schedule_progress_update(instance.task.campaign_id)
+
+
+@receiver(pre_save, sender=Submission)
+def load_persisted_submission_state(sender, instance, raw, **kwargs):
     """
-    if instance.task and instance.task.campaign:
+    Falls back to reading the stored owner/status for instances that were not
+    loaded from the database (or had those fields deferred).
+    """
+    if raw or instance._state.adding or instance.pk is None:
+        return
+    if getattr(instance, "_loaded_status", None) is None or not hasattr(
+        instance, "_loaded_user_id"
+    ):
+        persisted = (
+            Submission.objects.filter(pk=instance.pk)
+            .values("user_id", "status")
+            .first()
+        )
+        if persisted:
+            instance._loaded_user_id = persisted["user_id"]
+            instance._loaded_status = persisted["status"]
+
+
+@receiver(pre_save, sender=Submission)
+def update_task_slot(sender, instance, raw, **kwargs):
+    """Releases or retakes the task slot before holds_slot is written."""
+    if raw or instance._state.adding:
+        return
+    update_task_slots(
+        [(instance, getattr(instance, "_loaded_status", None), instance.status)]
+    )
+
 
-        instance.task.campaign.update_progress()
+@receiver(pre_save, sender=Submission)
+def stamp_approval_time(sender, instance, raw, **kwargs):
+    """
+    Dates approvals for the daily metrics rollups, which must not move when an
+    approved submission is saved again (updated_at would).
+    """
+    if raw or instance.status != APPROVED_STATUS:
+        return
+    if instance._state.adding:
+        if instance.approved_at is None:
+            instance.approved_at = timezone.now()
+    elif getattr(instance, "_loaded_status", None) != APPROVED_STATUS:
+        instance.approved_at = timezone.now()
 
 
 @receiver(post_save, sender=Submission)
-def update_user_tier_on_submission_approval(
-    sender, instance, created, update_fields, **kwargs
-):
-    if not created and instance.status == 2:  # Check if the new status is 'Approved'
-        user = instance.user
-        if user:
-            user.save()
+def update_user_counters_on_submission_save(sender, instance, created, **kwargs):
+    """
+    Keeps the denormalized per-user submission counters (and thus the user's tier)
+    in sync with the submission's owner and status.
+    """
+    if created:
+        changes = [(instance.user_id, None, instance.status)]
+    else:
+        old_user_id = getattr(instance, "_loaded_user_id", None)
+        old_status = getattr(instance, "_loaded_status", None)
+        if old_user_id == instance.user_id:
+            changes = [(instance.user_id, old_status, instance.status)]
+        else:
+            changes = [
+                (old_user_id, old_status, None),
+                (instance.user_id, None, instance.status),
+            ]
+
+    record_status_changes(changes)
+
+    instance._loaded_user_id = instance.user_id
+    instance._loaded_status = instance.status
+
+
+@receiver(post_delete, sender=Submission)
+def update_user_counters_on_submission_delete(sender, instance, **kwargs):
+    user_id = getattr(instance, "_loaded_user_id", instance.user_id)
+    status = getattr(instance, "_loaded_status", None) or instance.status
+    record_status_changes([(user_id, status, None)])
+    update_task_slots([(instance, status, None)])
+
+    if status == APPROVED_STATUS and instance.task_id:
+        schedule_progress_update(instance.task.campaign_id)
@@ -1,4 +1,6 @@
 from django.test import TestCase
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.core.exceptions import ValidationError
 from decimal import Decimal
 
@@ -8,6 +10,14 @@ from campaign.models import Campaign
 from dao.models import DAO
 from core.models import User
 from django.core.files.uploadedfile import SimpleUploadedFile  # For image/video tests
+from unittest.mock import patch
+from campaign.progress import flush_dirty_campaigns
+from utils.redis_client import get_redis_client
+from submission.totals import (
+    TOTALS_KEY,
+    get_status_totals,
+    reconcile_status_totals,
+)
 
 
 # Mock file for size validation tests
@@ -32,6 +42,12 @@ class SubmissionModelTests(TestCase):
             campaign=cls.campaign, description="Sub Task", type=1, reward=10, quantity=1
         )
 
+    def setUp(self):
+        get_redis_client().flushdb()
+        patcher = patch("celery_tasks.tasks.flush_campaign_progress.apply_async")
+        self.mock_schedule_flush = patcher.start()
+        self.addCleanup(patcher.stop)
+
     def test_submission_creation_minimal_with_link_and_text_proof(self):
         submission = Submission.objects.create(
             task=self.task,
@@ -110,13 +126,16 @@ class SubmissionModelTests(TestCase):
         self.campaign.progress = Decimal("0.0")  # Ensure clean start
         self.campaign.save()
 
-        Submission.objects.create(
-            task=self.task,
-            user=self.user,
-            link="http://approved.com",
-            status=2,  # Approved
-        )
-        # Signal should call campaign.update_progress()
+        with self.captureOnCommitCallbacks(execute=True):
+            Submission.objects.create(
+                task=self.task,
+                user=self.user,
+                link="http://approved.com",
+                status=2,  # Approved
+            )
+        # Signal marks the campaign dirty; the debounced flush recomputes it once
+        self.mock_schedule_flush.assert_called_once()
+        flush_dirty_campaigns()
         # Task quantity is 1, 1 approved submission. Progress = (1/1)*100 = 100.0
         self.campaign.refresh_from_db()
         self.assertEqual(self.campaign.progress, Decimal("100.0"))
@@ -125,13 +144,16 @@ class SubmissionModelTests(TestCase):
         self.campaign.progress = Decimal("0.0")
         self.campaign.save()
 
-        Submission.objects.create(
-            task=self.task,
-            user=self.user,
-            link="http://pending.com",
-            status=1,  # Pending
-        )
-        # Signal calls update_progress. 0 approved submissions. Progress = (0/1)*100 = 0.0
+        with self.captureOnCommitCallbacks(execute=True):
+            Submission.objects.create(
+                task=self.task,
+                user=self.user,
+                link="http://pending.com",
+                status=1,  # Pending
+            )
+        # A pending submission can't change progress, so nothing is queued
+        self.mock_schedule_flush.assert_not_called()
+        flush_dirty_campaigns()
         self.campaign.refresh_from_db()
         self.assertEqual(self.campaign.progress, Decimal("0.0"))
 
@@ -147,7 +169,9 @@ class SubmissionModelTests(TestCase):
         self.assertEqual(self.campaign.progress, Decimal("0.0"))
 
         submission.status = 2  # Change to Approved
-        submission.save()  # Signal should fire and update progress
+        with self.captureOnCommitCallbacks(execute=True):
+            submission.save()  # Signal should fire and queue a progress update
+        flush_dirty_campaigns()
 
         self.campaign.refresh_from_db()
         self.assertEqual(self.campaign.progress, Decimal("100.0"))
@@ -166,7 +190,9 @@ class SubmissionModelTests(TestCase):
         self.assertEqual(self.campaign.progress, Decimal("100.0"))
 
         submission.status = 1  # Change to Pending
-        submission.save()  # Signal should fire and update progress
+        with self.captureOnCommitCallbacks(execute=True):
+            submission.save()  # Signal should fire and queue a progress update
+        flush_dirty_campaigns()
 
         self.campaign.refresh_from_db()
         self.assertEqual(self.campaign.progress, Decimal("0.0"))  # 0 approved
@@ -184,7 +210,235 @@ class SubmissionModelTests(TestCase):
         # To properly test this, we'd ideally mock campaign.update_progress and assert it wasn't called.
         # For now, we'll check if progress value remains the same, assuming no other changes.
         submission.feedback = "Great work!"  # Update a non-status field
-        submission.save()
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            submission.save()
+        self.assertEqual(len(callbacks), 0)
 
         self.campaign.refresh_from_db()
         self.assertEqual(self.campaign.progress, initial_progress)  # Should not change
+
+    def test_signal_campaign_progress_coalesces_burst_of_approvals(self):
+        task = Task.objects.create(
+            campaign=self.campaign, description="Burst", type=1, reward=1, quantity=9
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            for i in range(5):
+                Submission.objects.create(
+                    task=task, user=self.user, link=f"http://burst{i}.com", status=2
+                )
+
+        # One flush is scheduled for the whole burst and recomputes the campaign once
+        self.mock_schedule_flush.assert_called_once()
+        self.assertEqual(flush_dirty_campaigns(), 1)
+        self.assertEqual(flush_dirty_campaigns(), 0)
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.progress, Decimal("50.0"))  # 5 of (1 + 9)
+
+
+class UserSubmissionCounterTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.dao = DAO.objects.create(name="Counter DAO")
+        cls.campaign = Campaign.objects.create(
+            name="Counter Camp", description="C", budget=1000, dao=cls.dao
+        )
+        cls.task = Task.objects.create(
+            campaign=cls.campaign, description="Counter Task", reward=1, quantity=50
+        )
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="counter_us", eth_address="0xCounterUser"
+        )
+
+    def _create_submission(self, status=1, user=None):
+        return Submission.objects.create(
+            task=self.task,
+            user=user or self.user,
+            link="http://counter.com",
+            proof_text="proof",
+            status=status,
+        )
+
+    def test_counters_incremented_on_create(self):
+        self._create_submission(status=1)
+        self._create_submission(status=2)
+        self._create_submission(status=3)
+
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.total_submissions, 3)
+        self.assertEqual(self.user.pending_submissions, 1)
+        self.assertEqual(self.user.approved_submissions, 1)
+        self.assertEqual(self.user.rejected_submissions, 1)
+
+    def test_counters_follow_status_transitions(self):
+        submission = self._create_submission(status=1)
+
+        submission = Submission.objects.get(pk=submission.pk)
+        submission.status = 2
+        submission.save()
+        submission.status = 3
+        submission.save()
+
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.total_submissions, 1)
+        self.assertEqual(self.user.pending_submissions, 0)
+        self.assertEqual(self.user.approved_submissions, 0)
+        self.assertEqual(self.user.rejected_submissions, 1)
+
+    def test_feedback_only_save_does_not_touch_counters(self):
+        submission = self._create_submission(status=2)
+        submission.feedback = "Nice"
+        submission.save()
+
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.total_submissions, 1)
+        self.assertEqual(self.user.approved_submissions, 1)
+
+    def test_counters_decremented_on_delete(self):
+        submission = self._create_submission(status=2)
+        submission.delete()
+
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.total_submissions, 0)
+        self.assertEqual(self.user.approved_submissions, 0)
+
+    def test_tier_updated_from_counters(self):
+        for _ in range(20):
+            submission = self._create_submission(status=1)
+            submission.status = 2
+            submission.save()
+
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.tier, 2)  # Silver
+
+    def test_tier_evaluation_uses_no_queries(self):
+        self._create_submission(status=2)
+        self.user.refresh_from_db()
+
+        with self.assertNumQueries(0):
+            self.user.determine_actual_tier_id()
+            self.user.get_progress_to_next_tier_percentage()
+
+    def test_full_user_save_does_not_overwrite_counters(self):
+        stale_user = User.objects.get(pk=self.user.pk)
+        self._create_submission(status=2)
+
+        stale_user.username = "renamed_us"
+        stale_user.save()
+
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.username, "renamed_us")
+        self.assertEqual(self.user.approved_submissions, 1)
+
+    def test_full_user_save_does_not_lower_tier(self):
+        stale_user = User.objects.get(pk=self.user.pk)
+        for _ in range(20):
+            submission = self._create_submission(status=1)
+            submission.status = 2
+            submission.save()
+
+        stale_user.username = "renamed_us"
+        stale_user.save()
+
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.tier, 2)  # Silver, from the real counters
+
+    def test_recompute_tiers_rebuilds_drifted_counters(self):
+        for _ in range(20):
+            self._create_submission(status=2)
+        User.objects.filter(pk=self.user.pk).update(
+            total_submissions=0, approved_submissions=0, tier=1
+        )
+
+        updated = User.objects.recompute_tiers(batch_size=1)
+
+        self.assertGreaterEqual(updated, 1)
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.total_submissions, 20)
+        self.assertEqual(self.user.approved_submissions, 20)
+        self.assertEqual(self.user.tier, 2)  # Silver
+        self.assertEqual(User.objects.recompute_tiers(), 0)
+
+    def test_recompute_tiers_counts_each_batch_under_row_locks(self):
+        self._create_submission(status=2)
+        with CaptureQueriesContext(connection) as ctx:
+            User.objects.recompute_tiers(batch_size=1)
+
+        sql = [query["sql"] for query in ctx.captured_queries]
+        locks = [i for i, q in enumerate(sql) if "FOR UPDATE" in q]
+        counts = [i for i, q in enumerate(sql) if "COUNT(" in q]
+        self.assertEqual(len(locks), User.objects.count())
+        # Every batch is counted after its users are locked
+        self.assertEqual(len(counts), len(locks))
+        self.assertTrue(all(lock < count for lock, count in zip(locks, counts)))
+
+
+class SubmissionStatusTotalsTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username="totals_us", eth_address="0xTotalsUser"
+        )
+        cls.dao = DAO.objects.create(name="Totals DAO")
+        cls.campaign = Campaign.objects.create(
+            name="Totals Camp", description="C", budget=100, dao=cls.dao
+        )
+        cls.task = Task.objects.create(
+            campaign=cls.campaign, description="Totals Task", reward=1, quantity=10
+        )
+        Submission.objects.create(
+            task=cls.task, user=cls.user, link="http://totals.com", status=1
+        )
+
+    def setUp(self):
+        get_redis_client().flushdb()
+        patcher = patch("celery_tasks.tasks.flush_campaign_progress.apply_async")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_cold_totals_are_loaded_from_database(self):
+        self.assertEqual(
+            get_status_totals(),
+            {
+                "pending_submissions": 1,
+                "approved_submissions": 0,
+                "rejected_submissions": 0,
+            },
+        )
+        # Served from Redis afterwards
+        with self.assertNumQueries(0):
+            self.assertEqual(get_status_totals()["pending_submissions"], 1)
+
+    def test_totals_follow_status_transitions_after_commit(self):
+        get_status_totals()
+        with self.captureOnCommitCallbacks(execute=True):
+            submission = Submission.objects.create(
+                task=self.task, user=self.user, link="http://totals2.com", status=1
+            )
+        with self.captureOnCommitCallbacks(execute=True):
+            submission.status = 3
+            submission.save()
+
+        totals = get_status_totals()
+        self.assertEqual(totals["pending_submissions"], 1)
+        self.assertEqual(totals["rejected_submissions"], 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            submission.delete()
+        self.assertEqual(get_status_totals()["rejected_submissions"], 0)
+
+    def test_reconcile_corrects_drift(self):
+        get_redis_client().hset(
+            TOTALS_KEY,
+            mapping={
+                "pending_submissions": 7,
+                "approved_submissions": 7,
+                "rejected_submissions": 7,
+            },
+        )
+        reconcile_status_totals()
+        self.assertEqual(get_status_totals()["pending_submissions"], 1)
+        self.assertEqual(get_status_totals()["approved_submissions"], 0)
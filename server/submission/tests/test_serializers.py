@@ -297,6 +297,9 @@ class SubmissionSerializerTests(TestCase):
         self.assertEqual(
             reward.reward, self.task_ongoing.reward
         )  # Reward should match task reward
+        campaign = self.task_ongoing.campaign
+        campaign.refresh_from_db()
+        self.assertEqual(campaign.spent_budget, self.task_ongoing.reward)
 
     def test_grade_submission_serializer_update_does_not_create_reward_if_already_approved(
         self,
@@ -9,6 +9,15 @@ from task.models import Task
 from campaign.models import Campaign
 from dao.models import DAO
 from core.models import User
+from reward.models import Reward
+from django.utils import timezone
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from datetime import timedelta
+from unittest.mock import patch
+from campaign.progress import flush_dirty_campaigns
+from utils.redis_client import get_redis_client
 
 
 class SubmissionViewTests(APITestCase):
@@ -76,6 +85,15 @@ class SubmissionViewTests(APITestCase):
             proof_type=1,
             status=3,
         )
+        # Progress updates from signals are deferred to Celery; settle the fixture
+        cls.campaign.update_progress()
+
+    def setUp(self):
+        get_redis_client().flushdb()
+        cache.clear()
+        patcher = patch("celery_tasks.tasks.flush_campaign_progress.apply_async")
+        patcher.start()
+        self.addCleanup(patcher.stop)
 
     # --- SubmitTaskView Tests ---
     def test_submit_task_authenticated_success(self):
@@ -118,6 +136,29 @@ class SubmissionViewTests(APITestCase):
         fresh_task.refresh_from_db()
         self.assertEqual(fresh_task.status, 2)  # Should be completed
 
+    def test_submit_task_rejected_when_slots_taken(self):
+        # Another request reserved the last slot after this one passed validation
+        full_task = Task.objects.create(
+            campaign=self.campaign,
+            description="Full Task",
+            type=1,
+            reward=5,
+            quantity=1,
+            status=1,
+            filled=1,
+        )
+        self.client.force_authenticate(user=self.user1)
+        url = reverse("submit-task")
+        data = {
+            "task": full_task.id,
+            "link": "http://late.com",
+            "proof_text": "L",
+            "proof_type": 1,
+        }
+        response = self.client.post(url, data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Submission.objects.filter(task=full_task).exists())
+
     def test_submit_task_to_completed_task_fails(self):
         self.client.force_authenticate(user=self.user1)
         url = reverse("submit-task")
@@ -264,6 +305,43 @@ class SubmissionViewTests(APITestCase):
         self.assertEqual(len(results), 1)
         self.assertEqual(results[0]["id"], self.sub1_user1_pending.id)
 
+    def test_submissions_history_cursor_pagination(self):
+        self.client.force_authenticate(user=self.user1)
+        url = reverse("submissions-history")
+        response = self.client.get(url, {"pagination": "cursor", "page_size": 1})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("count", response.data)
+        self.assertEqual(len(response.data["results"]), 1)
+        self.assertIsNotNone(response.data["next"])
+
+        next_page = self.client.get(response.data["next"])
+        self.assertEqual(next_page.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(next_page.data["results"]), 1)
+        self.assertIsNone(next_page.data["next"])
+        seen_ids = {
+            response.data["results"][0]["id"],
+            next_page.data["results"][0]["id"],
+        }
+        self.assertEqual(
+            seen_ids, {self.sub1_user1_pending.id, self.sub2_user1_approved.id}
+        )
+
+    def test_submissions_history_cursor_ordering_keeps_id_tiebreak(self):
+        self.client.force_authenticate(user=self.user1)
+        url = reverse("submissions-history")
+        params = {"pagination": "cursor", "ordering": "created_at"}
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        page_sql = next(
+            q["sql"] for q in queries if 'FROM "submission_submission"' in q["sql"]
+        )
+        self.assertIn(
+            'ORDER BY "submission_submission"."created_at" ASC, '
+            '"submission_submission"."id" ASC',
+            page_sql,
+        )
+
     def test_submissions_history_unauthenticated(self):
         url = reverse("submissions-history")
         response = self.client.get(url)
@@ -294,6 +372,29 @@ class SubmissionViewTests(APITestCase):
         self.assertEqual(response.data["approvedSubmissions"], 1)
         self.assertEqual(response.data["rejectedSubmissions"], 0)
 
+    def test_submissions_overview_cached_until_regraded(self):
+        self.client.force_authenticate(user=self.user1)
+        url = reverse("submissions-overview")
+        response = self.client.get(url)
+        self.assertEqual(response.data["textSubmissions"], {"total": 2, "approved": 1})
+
+        # A second read is served from the cache without touching submissions
+        with self.assertNumQueries(0):
+            self.client.get(url)
+
+        self.client.force_authenticate(user=self.moderator_user)
+        grade_url = reverse(
+            "grade-submission", kwargs={"pk": self.sub1_user1_pending.id}
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.patch(grade_url, {"status": 2}, format="json")
+
+        self.client.force_authenticate(user=self.user1)
+        response = self.client.get(url)
+        self.assertEqual(response.data["pendingSubmissions"], 0)
+        self.assertEqual(response.data["approvedSubmissions"], 2)
+        self.assertEqual(response.data["textSubmissions"], {"total": 2, "approved": 2})
+
     def test_submissions_overview_unauthenticated(self):
         url = reverse("submissions-overview")
         response = self.client.get(url)
@@ -308,6 +409,25 @@ class SubmissionViewTests(APITestCase):
         results = response.data.get("results", [])
         self.assertEqual(len(results), 3)  # All submissions
 
+    def test_grade_submissions_list_cursor_pagination(self):
+        # Same created_at for every row: ties are broken by id, never repeated
+        Submission.objects.update(created_at=timezone.now())
+        self.client.force_authenticate(user=self.moderator_user)
+        url = reverse("submissions-moderation")
+
+        seen_ids = []
+        response = self.client.get(url, {"pagination": "cursor", "page_size": 2})
+        while True:
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            seen_ids += [item["id"] for item in response.data["results"]]
+            if not response.data["next"]:
+                break
+            response = self.client.get(response.data["next"])
+
+        self.assertEqual(seen_ids, sorted(seen_ids, reverse=True))
+        self.assertEqual(len(seen_ids), 3)
+        self.assertEqual(response.data["pending_submissions"], 1)
+
     def test_grade_submissions_list_as_non_moderator(self):
         self.client.force_authenticate(user=self.user1)
         url = reverse("submissions-moderation")
@@ -377,7 +497,9 @@ class SubmissionViewTests(APITestCase):
         self.client.force_authenticate(user=self.moderator_user)
         url = reverse("grade-submission", kwargs={"pk": self.sub1_user1_pending.id})
         data = {"status": 2, "feedback": "Approved by moderator."}  # Approve
-        response = self.client.patch(url, data, format="json")
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.patch(url, data, format="json")
+        flush_dirty_campaigns()
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.sub1_user1_pending.refresh_from_db()
         self.assertEqual(self.sub1_user1_pending.status, 2)
@@ -393,6 +515,7 @@ class SubmissionViewTests(APITestCase):
         # Total completed = 2, Total quantity = 2+1=3. Progress = (2/3)*100 = 66.7
         self.campaign.refresh_from_db()
         self.assertAlmostEqual(self.campaign.progress, Decimal("66.7"), places=1)
+        self.assertEqual(self.campaign.spent_budget, self.task1.reward)
 
     def test_grade_submission_patch_as_moderator_reject(self):
         self.client.force_authenticate(user=self.moderator_user)
@@ -400,7 +523,9 @@ class SubmissionViewTests(APITestCase):
             "grade-submission", kwargs={"pk": self.sub1_user2_rejected.id}
         )  # Use the rejected submission
         data = {"status": 3, "feedback": "Still rejected."}  # Reject
-        response = self.client.patch(url, data, format="json")
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.patch(url, data, format="json")
+        flush_dirty_campaigns()
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.sub1_user2_rejected.refresh_from_db()
         self.assertEqual(self.sub1_user2_rejected.status, 3)
@@ -415,12 +540,50 @@ class SubmissionViewTests(APITestCase):
         # After rejecting an already rejected submission, progress remains 33.3
         self.assertAlmostEqual(self.campaign.progress, Decimal("33.3"), places=1)
 
+    def test_rejecting_or_deleting_submission_releases_task_slot(self):
+        Task.objects.filter(pk=self.task1.pk).update(
+            filled=2, status=2, closed_when_full=True
+        )
+        Submission.objects.filter(
+            pk__in=[self.sub1_user1_pending.pk, self.sub2_user1_approved.pk]
+        ).update(holds_slot=True)
+        self.client.force_authenticate(user=self.moderator_user)
+        url = reverse("grade-submission", kwargs={"pk": self.sub1_user1_pending.id})
+        response = self.client.patch(url, {"status": 3}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.task1.refresh_from_db()
+        self.assertEqual((self.task1.filled, self.task1.status), (1, 1))
+
+        Submission.objects.get(pk=self.sub2_user1_approved.pk).delete()
+        self.task1.refresh_from_db()
+        self.assertEqual(self.task1.filled, 0)
+
+    def test_submission_without_slot_releases_nothing(self):
+        # Created outside the submit endpoint, so it never reserved a slot
+        Task.objects.filter(pk=self.task1.pk).update(filled=1)
+        self.sub1_user1_pending.delete()
+        self.task1.refresh_from_db()
+        self.assertEqual(self.task1.filled, 1)
+
+    def test_reverting_rejection_does_not_overfill_task(self):
+        Task.objects.filter(pk=self.task1.pk).update(filled=2)
+        self.client.force_authenticate(user=self.moderator_user)
+        url = reverse("grade-submission", kwargs={"pk": self.sub1_user2_rejected.id})
+        response = self.client.patch(url, {"status": 1}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.task1.refresh_from_db()
+        self.assertEqual(self.task1.filled, 2)
+        self.sub1_user2_rejected.refresh_from_db()
+        self.assertFalse(self.sub1_user2_rejected.holds_slot)
+
     def test_grade_submission_patch_as_moderator_change_from_approved_to_pending(self):
         # Use sub2_user1_approved which is initially approved
         self.client.force_authenticate(user=self.moderator_user)
         url = reverse("grade-submission", kwargs={"pk": self.sub2_user1_approved.id})
         data = {"status": 1, "feedback": "Needs revision."}  # Change to Pending
-        response = self.client.patch(url, data, format="json")
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.patch(url, data, format="json")
+        flush_dirty_campaigns()
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.sub2_user1_approved.refresh_from_db()
         self.assertEqual(self.sub2_user1_approved.status, 1)
@@ -443,3 +606,162 @@ class SubmissionViewTests(APITestCase):
             "permission denied: You do not have permission to perform this action as you are not a moderator.",
             str(response.data["error"]),
         )
+
+    # --- BulkGradeSubmissionsView Tests ---
+
+    def test_bulk_grade_as_moderator(self):
+        self.client.force_authenticate(user=self.moderator_user)
+        url = reverse("grade-submissions-bulk")
+        data = {
+            "items": [
+                {"id": self.sub1_user1_pending.id, "status": 2, "feedback": "Good"},
+                {"id": self.sub1_user2_rejected.id, "status": 2},
+                {"id": self.sub2_user1_approved.id, "status": 2, "feedback": "Still"},
+            ]
+        }
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(url, data, format="json")
+        flush_dirty_campaigns()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["items"]), 3)
+        self.assertTrue(
+            all(item["status"] == "Approved" for item in response.data["items"])
+        )
+        self.sub1_user1_pending.refresh_from_db()
+        self.assertEqual(self.sub1_user1_pending.feedback, "Good")
+        self.assertIsNotNone(self.sub1_user1_pending.approved_at)
+
+        # Rewards only for the two newly approved submissions
+        self.assertEqual(
+            Reward.objects.filter(
+                submission__in=[self.sub1_user1_pending, self.sub1_user2_rejected]
+            ).count(),
+            2,
+        )
+        self.assertFalse(
+            Reward.objects.filter(submission=self.sub2_user1_approved).exists()
+        )
+
+        self.user1.refresh_from_db()
+        self.user2.refresh_from_db()
+        self.assertEqual(self.user1.approved_submissions, 2)
+        self.assertEqual(self.user1.pending_submissions, 0)
+        self.assertEqual(self.user2.approved_submissions, 1)
+        self.assertEqual(self.user2.rejected_submissions, 0)
+
+        # task1: 3 approved capped at quantity 2, task2: 0 of 1 -> 2/3
+        self.campaign.refresh_from_db()
+        self.assertAlmostEqual(self.campaign.progress, Decimal("66.7"), places=1)
+        # Task rewards of the two rewards issued
+        self.assertEqual(self.campaign.spent_budget, Decimal("20.00"))
+
+    def test_bulk_grade_skips_existing_rewards(self):
+        Reward.objects.create(
+            user=self.user1, submission=self.sub1_user1_pending, reward=10
+        )
+        self.client.force_authenticate(user=self.moderator_user)
+        url = reverse("grade-submissions-bulk")
+        data = {"items": [{"id": self.sub1_user1_pending.id, "status": 2}]}
+        response = self.client.post(url, data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            Reward.objects.filter(submission=self.sub1_user1_pending).count(), 1
+        )
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.spent_budget, Decimal("0.00"))
+
+    def test_bulk_grade_unknown_submission_fails(self):
+        self.client.force_authenticate(user=self.moderator_user)
+        url = reverse("grade-submissions-bulk")
+        data = {
+            "items": [
+                {"id": self.sub1_user1_pending.id, "status": 2},
+                {"id": 999999, "status": 2},
+            ]
+        }
+        response = self.client.post(url, data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.sub1_user1_pending.refresh_from_db()
+        self.assertEqual(self.sub1_user1_pending.status, 1)
+
+    def test_bulk_grade_as_non_moderator(self):
+        self.client.force_authenticate(user=self.user1)
+        url = reverse("grade-submissions-bulk")
+        data = {"items": [{"id": self.sub1_user1_pending.id, "status": 2}]}
+        response = self.client.post(url, data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    # --- ClaimSubmissionsView Tests ---
+
+    def _create_pending(self, count):
+        return [
+            Submission.objects.create(
+                task=self.task1,
+                user=self.user2,
+                link=f"http://queue{i}.com",
+                proof_text="Queue Proof",
+                proof_type=1,
+            )
+            for i in range(count)
+        ]
+
+    def test_claim_submissions_gives_moderators_disjoint_batches(self):
+        self._create_pending(3)
+        other_moderator = User.objects.create_user(
+            username="moduser2", eth_address="0xModUser2", role=2
+        )
+        url = reverse("claim-submissions")
+
+        self.client.force_authenticate(user=self.moderator_user)
+        first = self.client.post(url, {"limit": 2}, format="json")
+        self.client.force_authenticate(user=other_moderator)
+        second = self.client.post(url, {"limit": 10}, format="json")
+
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        self.assertEqual(second.status_code, status.HTTP_200_OK)
+        first_ids = [item["id"] for item in first.data["results"]]
+        second_ids = [item["id"] for item in second.data["results"]]
+        # 4 pending in total (one from setUpTestData), oldest first
+        self.assertEqual(first_ids[0], self.sub1_user1_pending.id)
+        self.assertEqual(len(first_ids), 2)
+        self.assertEqual(len(second_ids), 2)
+        self.assertFalse(set(first_ids) & set(second_ids))
+        self.assertIsNotNone(first.data["claim_expires_at"])
+
+    def test_claim_submissions_reclaims_expired_leases(self):
+        other_moderator = User.objects.create_user(
+            username="moduser3", eth_address="0xModUser3", role=2
+        )
+        Submission.objects.filter(pk=self.sub1_user1_pending.pk).update(
+            claimed_by=other_moderator,
+            claim_expires_at=timezone.now() - timedelta(seconds=1),
+        )
+        self.client.force_authenticate(user=self.moderator_user)
+        response = self.client.post(reverse("claim-submissions"), {}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [item["id"] for item in response.data["results"]],
+            [self.sub1_user1_pending.id],
+        )
+        self.sub1_user1_pending.refresh_from_db()
+        self.assertEqual(self.sub1_user1_pending.claimed_by, self.moderator_user)
+
+    def test_grading_releases_claim(self):
+        self.client.force_authenticate(user=self.moderator_user)
+        self.client.post(reverse("claim-submissions"), {"limit": 1}, format="json")
+        url = reverse("grade-submission", kwargs={"pk": self.sub1_user1_pending.id})
+        response = self.client.patch(url, {"status": 3}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.sub1_user1_pending.refresh_from_db()
+        self.assertIsNone(self.sub1_user1_pending.claimed_by)
+        self.assertIsNone(self.sub1_user1_pending.claim_expires_at)
+
+    def test_claim_submissions_as_non_moderator(self):
+        self.client.force_authenticate(user=self.user1)
+        response = self.client.post(reverse("claim-submissions"), {}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
@@ -0,0 +1,74 @@
+import logging
+from django.db import transaction
+from django.db.models import Count, Q
+from redis.exceptions import RedisError
+from utils.redis_client import get_redis_client
+from .models import Submission
+
+logger = logging.getLogger(__name__)
+
+TOTALS_KEY = "submission_totals"
+
+TOTAL_FIELDS = {
+    1: "pending_submissions",
+    2: "approved_submissions",
+    3: "rejected_submissions",
+}
+
+# Increments are only applied to an already-populated hash; a missing hash is
+# rebuilt from the database on the next read instead of starting from zero.
+_INCREMENT_IF_EXISTS = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    for i = 1, #ARGV, 2 do
+        redis.call('HINCRBY', KEYS[1], ARGV[i], ARGV[i + 1])
+    end
+end
+"""
+
+
+def count_status_totals():
+    return Submission.objects.aggregate(
+        **{
+            field: Count("id", filter=Q(status=status))
+            for status, field in TOTAL_FIELDS.items()
+        }
+    )
+
+
+def record_status_totals(status_deltas):
+    """Applies {status: delta} to the global totals once the transaction commits."""
+    args = []
+    for submission_status, delta in status_deltas.items():
+        if delta:
+            args += [TOTAL_FIELDS[submission_status], delta]
+    if args:
+        transaction.on_commit(lambda: _increment_totals(args))
+
+
+def _increment_totals(args):
+    try:
+        get_redis_client().eval(_INCREMENT_IF_EXISTS, 1, TOTALS_KEY, *args)
+    except RedisError as e:
+        logger.warning("Could not update submission totals (%s)", e)
+
+
+def get_status_totals():
+    """Global submission totals by status, served from Redis without a table scan."""
+    try:
+        client = get_redis_client()
+        cached = client.hgetall(TOTALS_KEY)
+        if len(cached) == len(TOTAL_FIELDS):
+            return {field: int(value) for field, value in cached.items()}
+        totals = count_status_totals()
+        client.hset(TOTALS_KEY, mapping=totals)
+        return totals
+    except RedisError as e:
+        logger.warning("Submission totals unavailable in Redis (%s)", e)
+        return count_status_totals()
+
+
+def reconcile_status_totals():
+    """Overwrites the Redis totals with a fresh count from the database."""
+    totals = count_status_totals()
+    get_redis_client().hset(TOTALS_KEY, mapping=totals)
+    return totals
@@ -5,6 +5,8 @@ from .views import (
     SubmissionsOverviewView,
     GradeSubmissionView,
     GradeSubmissionsListView,
+    BulkGradeSubmissionsView,
+    ClaimSubmissionsView,
 )
 
 urlpatterns = [
@@ -29,4 +31,14 @@ urlpatterns = [
         GradeSubmissionView.as_view(),
         name="grade-submission",
     ),
+    path(
+        "moderation/grade-submissions/bulk",
+        BulkGradeSubmissionsView.as_view(),
+        name="grade-submissions-bulk",
+    ),
+    path(
+        "moderation/submissions/claim",
+        ClaimSubmissionsView.as_view(),
+        name="claim-submissions",
+    ),
 ]
@@ -3,6 +3,8 @@ from .serializers import (
     SubmitTaskSerializer,
     SubmissionsHistorySerializer,
     GradeSubmissionSerializer,
+    BulkGradeSubmissionsSerializer,
+    ClaimSubmissionsSerializer,
 )
 from utils.exception_handler import ErrorHandlingMixin
 from drf_spectacular.utils import (
@@ -13,13 +15,18 @@ from drf_spectacular.utils import (
 )  # Added
 from drf_spectacular.types import OpenApiTypes  # Added
 from .models import Submission
+from task.models import Task
+from .totals import get_status_totals
+from .overview import get_submissions_overview
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework import filters
+from rest_framework.exceptions import ValidationError
+from django.db import transaction
 from .permissions import IsModerator
 from django.db.models import Count, Q
 from django_filters.rest_framework import DjangoFilterBackend
-from utils.pagination import TenResultsSetPagination
+from utils.pagination import TenResultsSetPagination, OptionalCursorPaginationMixin
 
 
 @extend_schema(
@@ -43,11 +50,15 @@ class SubmitTaskView(ErrorHandlingMixin, generics.CreateAPIView):
     # permission_classes = [IsAuthenticated] # Implicitly required by perform_create
 
     def perform_create(self, serializer):
-        submission = serializer.save(user=self.request.user)
-        task = submission.task
-        if task.submissions.count() >= task.quantity and task.status != 2:
-            task.status = 2
-            task.save()
+        task = serializer.validated_data["task"]
+        with transaction.atomic():
+            # Take the slot before any proof media is written; the same UPDATE
+            # closes the task when the last slot goes.
+            if not Task.objects.reserve_slot(task.pk):
+                raise ValidationError(
+                    {"task": "Task is completed, no more submissions allowed."}
+                )
+            serializer.save(user=self.request.user, holds_slot=True)
 
 
 @extend_schema(
@@ -61,6 +72,19 @@ class SubmitTaskView(ErrorHandlingMixin, generics.CreateAPIView):
             required=False,
             type=OpenApiTypes.INT,
         ),
+        OpenApiParameter(
+            name="pagination",
+            description='Set to "cursor" for keyset pagination on (created_at, id). Cursor pages follow the `next`/`previous` links and do not include a total count.',
+            required=False,
+            type=OpenApiTypes.STR,
+            enum=["cursor"],
+        ),
+        OpenApiParameter(
+            name="cursor",
+            description="Opaque cursor from a previous cursor-paginated response.",
+            required=False,
+            type=OpenApiTypes.STR,
+        ),
         OpenApiParameter(
             name="page_size",
             description="Number of results to return per page.",
@@ -90,7 +114,9 @@ class SubmitTaskView(ErrorHandlingMixin, generics.CreateAPIView):
         ),
     },
 )
-class SubmissionsHistoryView(ErrorHandlingMixin, generics.ListAPIView):
+class SubmissionsHistoryView(
+    OptionalCursorPaginationMixin, ErrorHandlingMixin, generics.ListAPIView
+):
     serializer_class = SubmissionsHistorySerializer
     pagination_class = TenResultsSetPagination
     # permission_classes = [IsAuthenticated] # Implicitly required by get_queryset
@@ -133,41 +159,7 @@ class SubmissionsOverviewView(ErrorHandlingMixin, APIView):
     # permission_classes = [IsAuthenticated] # Implicitly required by get method logic
 
     def get(self, request, *args, **kwargs):
-        user_submissions = Submission.objects.filter(user=request.user)
-
-        # Overall counts
-        pending_submissions = user_submissions.filter(status=1).count()  # 1 for Pending
-        approved_submissions = user_submissions.filter(
-            status=2
-        ).count()  # 2 for Approved
-        rejected_submissions = user_submissions.filter(
-            status=3
-        ).count()  # 3 for Rejected
-
-        # Counts per proof type
-        text_total = user_submissions.filter(proof_type=1).count()  # 1 for Text
-        text_approved = user_submissions.filter(
-            proof_type=1, status=2  # Text, Approved
-        ).count()
-
-        image_total = user_submissions.filter(proof_type=2).count()  # 2 for Image
-        image_approved = user_submissions.filter(
-            proof_type=2, status=2  # Image, Approved
-        ).count()
-
-        video_total = user_submissions.filter(proof_type=3).count()  # 3 for Video
-        video_approved = user_submissions.filter(
-            proof_type=3, status=2  # Video, Approved
-        ).count()
-
-        overview = {
-            "pendingSubmissions": pending_submissions,  # Keep camelCase for frontend
-            "approvedSubmissions": approved_submissions,  # Keep camelCase for frontend
-            "rejectedSubmissions": rejected_submissions,  # Keep camelCase for frontend
-            "textSubmissions": {"total": text_total, "approved": text_approved},
-            "imageSubmissions": {"total": image_total, "approved": image_approved},
-            "videoSubmissions": {"total": video_total, "approved": video_approved},
-        }
+        overview = get_submissions_overview(request.user.id)
 
         return Response(overview, status=status.HTTP_200_OK)
 
@@ -189,6 +181,19 @@ class GradeSubmissionAbstract(ErrorHandlingMixin, APIView):
             required=False,
             type=OpenApiTypes.INT,
         ),
+        OpenApiParameter(
+            name="pagination",
+            description='Set to "cursor" for keyset pagination on (created_at, id). Cursor pages follow the `next`/`previous` links and do not include a total count.',
+            required=False,
+            type=OpenApiTypes.STR,
+            enum=["cursor"],
+        ),
+        OpenApiParameter(
+            name="cursor",
+            description="Opaque cursor from a previous cursor-paginated response.",
+            required=False,
+            type=OpenApiTypes.STR,
+        ),
         OpenApiParameter(
             name="page_size",
             description="Number of results to return per page.",
@@ -225,7 +230,9 @@ class GradeSubmissionAbstract(ErrorHandlingMixin, APIView):
         403: OpenApiResponse(description="User is not a moderator."),
     },
 )
-class GradeSubmissionsListView(GradeSubmissionAbstract, generics.ListAPIView):
+class GradeSubmissionsListView(
+    OptionalCursorPaginationMixin, GradeSubmissionAbstract, generics.ListAPIView
+):
     pagination_class = TenResultsSetPagination
     filter_backends = [
         DjangoFilterBackend,
@@ -243,11 +250,7 @@ class GradeSubmissionsListView(GradeSubmissionAbstract, generics.ListAPIView):
         response = super().list(request, *args, **kwargs)
 
         if isinstance(response.data, dict) and "results" in response.data:
-            totals = Submission.objects.aggregate(
-                pending_submissions=Count("id", filter=Q(status=1)),
-                approved_submissions=Count("id", filter=Q(status=2)),
-                rejected_submissions=Count("id", filter=Q(status=3)),
-            )
+            totals = get_status_totals()
             response.data["pending_submissions"] = totals["pending_submissions"]
             response.data["approved_submissions"] = totals["approved_submissions"]
             response.data["rejected_submissions"] = totals["rejected_submissions"]
@@ -326,3 +329,75 @@ class GradeSubmissionView(GradeSubmissionAbstract):
         serializer.save()
 
         return Response(serializer.data, status=status.HTTP_200_OK)
+
+
+@extend_schema(
+    tags=["grading"],
+    summary="Grade Submissions in Bulk",
+    description="For moderators: Update the status (and optionally feedback) of many submissions in one transaction. Rewards are issued for newly approved submissions, and user tiers and campaign progress are updated once per batch.",
+    request=BulkGradeSubmissionsSerializer,
+    responses={
+        200: OpenApiResponse(
+            response=BulkGradeSubmissionsSerializer,
+            description="Submissions graded successfully.",
+            examples=[
+                OpenApiExample(
+                    "Bulk Grade Result",
+                    value={
+                        "items": [
+                            {"id": 1, "status": "Approved", "feedback": "Nice"},
+                            {"id": 2, "status": "Rejected", "feedback": None},
+                        ]
+                    },
+                    response_only=True,
+                )
+            ],
+        ),
+        400: OpenApiResponse(description="Invalid input or unknown submission ids."),
+        401: OpenApiResponse(
+            description="Authentication credentials were not provided."
+        ),
+        403: OpenApiResponse(description="User is not a moderator."),
+    },
+)
+class BulkGradeSubmissionsView(GradeSubmissionAbstract):
+    serializer_class = BulkGradeSubmissionsSerializer
+
+    def post(self, request):
+        serializer = self.serializer_class(
+            data=request.data, context={"request": request}
+        )
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+
+@extend_schema(
+    tags=["grading"],
+    summary="Claim Pending Submissions",
+    description="For moderators: Lease the next N oldest pending submissions that are not held by another moderator. Claims expire after a fixed lease so abandoned items return to the queue; grading a submission releases its claim. Concurrent callers always receive disjoint batches.",
+    request=ClaimSubmissionsSerializer,
+    responses={
+        200: OpenApiResponse(
+            response=GradeSubmissionSerializer(many=True),
+            description="Claimed submissions, oldest first, with the lease expiry time.",
+        ),
+        400: OpenApiResponse(description="Invalid limit."),
+        401: OpenApiResponse(
+            description="Authentication credentials were not provided."
+        ),
+        403: OpenApiResponse(description="User is not a moderator."),
+    },
+)
+class ClaimSubmissionsView(GradeSubmissionAbstract):
+    serializer_class = ClaimSubmissionsSerializer
+
+    def post(self, request):
+        serializer = self.serializer_class(
+            data=request.data, context={"request": request}
+        )
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+
+        return Response(serializer.data, status=status.HTTP_200_OK)
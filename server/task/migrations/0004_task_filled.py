@@ -0,0 +1,41 @@
+# Generated by Django 5.2.18 on 2026-10-16 23:26
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce, Least
+
+
+def backfill_filled_slots(apps, schema_editor):
+    Task = apps.get_model("task", "Task")
+    Submission = apps.get_model("submission", "Submission")
+    submission_count = (
+        Submission.objects.filter(task=OuterRef("pk"))
+        .values("task")
+        .annotate(count=Count("id"))
+        .values("count")
+    )
+    # Overfilled tasks are capped at their quantity
+    Task.objects.update(
+        filled=Least(
+            Coalesce(Subquery(submission_count), 0),
+            "quantity",
+            output_field=models.PositiveSmallIntegerField(),
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("task", "0003_alter_task_deadline"),
+        ("submission", "0007_submission_keyset_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="task",
+            name="filled",
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_filled_slots, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-16 23:47
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("campaign", "0006_description_search_indexes"),
+        ("task", "0004_task_filled"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="task",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.search.SearchVector(
+                    "description", config="english"
+                ),
+                name="task_description_fts_idx",
+            ),
+        ),
+    ]
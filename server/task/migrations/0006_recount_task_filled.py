@@ -0,0 +1,34 @@
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce, Least
+
+
+def recount_filled_slots(apps, schema_editor):
+    Task = apps.get_model("task", "Task")
+    Submission = apps.get_model("submission", "Submission")
+    # Rejected submissions no longer hold a slot
+    holding_count = (
+        Submission.objects.filter(task=OuterRef("pk"), status__in=[1, 2])
+        .values("task")
+        .annotate(count=Count("id"))
+        .values("count")
+    )
+    Task.objects.update(
+        filled=Least(
+            Coalesce(Subquery(holding_count), 0),
+            "quantity",
+            output_field=models.PositiveSmallIntegerField(),
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("task", "0005_description_search_indexes"),
+        ("submission", "0008_submission_status_updated_idx"),
+    ]
+
+    operations = [
+        migrations.RunPython(recount_filled_slots, migrations.RunPython.noop),
+    ]
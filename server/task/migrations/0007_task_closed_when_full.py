@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-17 00:20
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def backfill_closed_when_full(apps, schema_editor):
+    Task = apps.get_model("task", "Task")
+    # Submitting used to complete a task as soon as it was full, so full
+    # completed tasks are taken to have been closed that way
+    Task.objects.filter(status=2, filled__gte=F("quantity")).update(
+        closed_when_full=True
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("task", "0006_recount_task_filled"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="task",
+            name="closed_when_full",
+            field=models.BooleanField(default=False),
+        ),
+        migrations.RunPython(backfill_closed_when_full, migrations.RunPython.noop),
+    ]
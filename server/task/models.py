@@ -1,4 +1,84 @@
+from decimal import Decimal
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector
 from django.db import models
+from django.db.models import Case, F, Q, Value, When
+from django.db.models.functions import Greatest
+from utils.conditional import bump_data_version
+
+
+class TaskManager(models.Manager):
+    def reserve_slot(self, task_id) -> bool:
+        """
+        Atomically takes one submission slot on an ongoing task, closing the task
+        when the last slot is taken. Returns False when the task is full or closed.
+        The row stays locked until the caller's transaction ends.
+        """
+        return self._take_slot(self.filter(pk=task_id, status=1))
+
+    def retake_slot(self, task_id) -> bool:
+        """
+        Takes a slot back for a submission whose rejection is reverted, whether or
+        not the task is still ongoing. Returns False when the task is full.
+        """
+        return self._take_slot(self.filter(pk=task_id))
+
+    def _take_slot(self, queryset) -> bool:
+        # Evaluated against the pre-update row: this reservation takes the last
+        # slot of an ongoing task
+        closes = Q(status=1, filled__gte=F("quantity") - 1)
+        taken = queryset.filter(filled__lt=F("quantity")).update(
+            filled=F("filled") + 1,
+            status=Case(
+                When(closes, then=Value(2)),
+                default=F("status"),
+                output_field=models.PositiveSmallIntegerField(),
+            ),
+            closed_when_full=Case(
+                When(closes, then=Value(True)),
+                default=F("closed_when_full"),
+                output_field=models.BooleanField(),
+            ),
+        )
+        if taken:
+            self._slots_changed()
+        return taken == 1
+
+    def release_slots(self, counts):
+        """
+        Gives back {task_id: count} slots of rejected or deleted submissions. A
+        task closed by taking its last slot reopens; one closed by hand does not.
+        """
+        released = False
+        for task_id, count in counts.items():
+            if not count:
+                continue
+            # Evaluated against the pre-update row
+            reopens = Q(closed_when_full=True, filled__lt=F("quantity") + count)
+            released |= bool(
+                self.filter(pk=task_id).update(
+                    filled=Greatest(F("filled") - count, 0),
+                    status=Case(
+                        When(reopens, then=Value(1)),
+                        default=F("status"),
+                        output_field=models.PositiveSmallIntegerField(),
+                    ),
+                    closed_when_full=Case(
+                        When(reopens, then=Value(False)),
+                        default=F("closed_when_full"),
+                        output_field=models.BooleanField(),
+                    ),
+                )
+            )
+        if released:
+            self._slots_changed()
+
+    def _slots_changed(self):
+        from campaign.overview import invalidate_campaign_overview
+
+        # filled/status changed without a save signal
+        bump_data_version("task")
+        invalidate_campaign_overview()
 
 
 class Task(models.Model):
@@ -19,9 +99,67 @@ class Task(models.Model):
     )
     reward = models.DecimalField(max_digits=10, decimal_places=2, db_index=True)
     quantity = models.PositiveSmallIntegerField()
+    # slots held by submissions, see TaskManager.reserve_slot and Submission.holds_slot
+    filled = models.PositiveSmallIntegerField(default=0)
+    # the task was completed by its last slot being taken, so it reopens when a
+    # slot is given back
+    closed_when_full = models.BooleanField(default=False)
 
     deadline = models.DateField(null=True, blank=True)
     status = models.PositiveSmallIntegerField(
         choices=STATUS_CHOICES, default=1, db_index=True
     )
     created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    objects = TaskManager()
+
+    class Meta:
+        indexes = [
+            # Used by the search endpoint (search.views)
+            GinIndex(
+                SearchVector("description", config="english"),
+                name="task_description_fts_idx",
+            ),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Lets the budget signals take back what the task had allocated
+        if "reward" in instance.__dict__ and "quantity" in instance.__dict__:
+            instance._loaded_campaign_id = instance.__dict__.get("campaign_id")
+            instance._loaded_cost = instance.cost
+        instance._loaded_status = instance.__dict__.get("status")
+        return instance
+
+    def save(self, *args, **kwargs):
+        if (
+            not self._state.adding
+            and kwargs.get("update_fields") is None
+            and not kwargs.get("force_insert")
+        ):
+            # filled is only ever written with F() updates (see TaskManager), and
+            # so is status unless the caller changed it, so a full save must not
+            # overwrite them with stale in-memory values.
+            skipped = {"filled", "closed_when_full"}
+            if self.status == getattr(self, "_loaded_status", None):
+                skipped.add("status")
+            else:
+                # Opened or closed by hand
+                self.closed_when_full = False
+                skipped.discard("closed_when_full")
+            deferred_fields = self.get_deferred_fields()
+            kwargs["update_fields"] = [
+                field.attname
+                for field in self._meta.concrete_fields
+                if not field.primary_key
+                and field.attname not in deferred_fields
+                and field.name not in skipped
+            ]
+        super().save(*args, **kwargs)
+        self._loaded_status = self.status
+
+    @property
+    def cost(self):
+        """The share of the campaign budget this task takes."""
+        return Decimal(str(self.reward)) * int(self.quantity)
@@ -2,7 +2,7 @@ from rest_framework import serializers
 from .models import Task
 from campaign.serializers import CampaignSerializer
 from campaign.models import Campaign
-from django.db import models
+from django.db import transaction
 from django.utils import timezone
 from datetime import datetime
 
@@ -20,6 +20,7 @@ class TaskSerializer(serializers.ModelSerializer):
     class Meta:
         model = Task
         fields = "__all__"
+        read_only_fields = ("filled", "closed_when_full")
 
     def to_representation(self, instance):
         representation = super().to_representation(instance)
@@ -88,35 +89,37 @@ class TaskCreateSerializer(serializers.ModelSerializer):
                 "Reward and quantity must be positive numbers."
             )
 
-        # Calculate the total budget already allocated to existing tasks for this campaign
-        # Exclude the current task if it's an update operation
-        existing_tasks_total_cost = 0
-        if self.instance:  # If it's an update operation
-            existing_tasks_total_cost = (
-                campaign.tasks.exclude(pk=self.instance.pk)
-                .aggregate(
-                    total_cost=models.Sum(models.F("reward") * models.F("quantity"))
-                )
-                .get("total_cost")
-                or 0
-            )
-        else:  # If it's a create operation
-            existing_tasks_total_cost = (
-                campaign.tasks.aggregate(
-                    total_cost=models.Sum(models.F("reward") * models.F("quantity"))
-                ).get("total_cost")
-                or 0
-            )
+        self.check_budget(campaign, reward * quantity)
+        return data
 
-        new_task_total_cost = reward * quantity
-        total_allocated_budget = existing_tasks_total_cost + new_task_total_cost
+    def check_budget(self, campaign, cost):
+        """Raises if `cost` does not fit in what the campaign has left to allocate."""
+        allocated = campaign.allocated_budget
+        if self.instance and self.instance.campaign_id == campaign.pk:
+            allocated -= self.instance.cost  # the task being edited is replaced
 
+        total_allocated_budget = allocated + cost
         if total_allocated_budget > campaign.budget:
             raise serializers.ValidationError(
-                f"Total reward for all tasks ({total_allocated_budget}) exceeds the campaign budget ({campaign.budget}). Remaining budget: {campaign.budget - existing_tasks_total_cost}"
+                f"Total reward for all tasks ({total_allocated_budget}) exceeds the campaign budget ({campaign.budget}). Remaining budget: {campaign.budget - allocated}"
             )
 
-        return data
+    def recheck_budget_locked(self, validated_data):
+        # validate() read a possibly stale campaign row. Check again with the row
+        # locked until the caller's transaction commits the task and, through
+        # the task signals, its allocation, so concurrent writes to one
+        # campaign are checked one after another.
+        campaign = Campaign.objects.select_for_update().get(
+            pk=validated_data["campaign"].pk
+        )
+        self.check_budget(
+            campaign, validated_data["reward"] * validated_data["quantity"]
+        )
+
+    def create(self, validated_data):
+        with transaction.atomic():
+            self.recheck_budget_locked(validated_data)
+            return super().create(validated_data)
 
     # to_internal_value method removed as model field is now DateField
     # and serializer field is DateField, so direct assignment works.
@@ -1,21 +1,50 @@
+from collections import defaultdict
+from decimal import Decimal
 from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
+from campaign.models import Campaign
+from campaign.overview import invalidate_campaign_overview
+from campaign.progress import schedule_progress_update
+from utils.conditional import bump_data_version
 from .models import Task
 
 
 @receiver(post_save, sender=Task)
 def update_campaign_progress_on_task_save(sender, instance, **kwargs):
     """
-    Updates the campaign progress when a task is saved (created or updated).
+    Queues a campaign progress update when a task is saved (created or updated).
     """
-    if instance.campaign:
-        instance.campaign.update_progress()
+    schedule_progress_update(instance.campaign_id)
+    bump_data_version("task")
+    invalidate_campaign_overview()
 
 
 @receiver(post_delete, sender=Task)
 def update_campaign_progress_on_task_delete(sender, instance, **kwargs):
     """
-    Updates the campaign progress when a task is deleted.
+    Queues a campaign progress update when a task is deleted.
     """
-    if instance.campaign:
-        instance.campaign.update_progress()
+    schedule_progress_update(instance.campaign_id)
+    bump_data_version("task")
+    invalidate_campaign_overview()
+
+
+@receiver(post_save, sender=Task)
+def update_allocated_budget_on_task_save(sender, instance, created, **kwargs):
+    """Keeps Campaign.allocated_budget in sync when a task is created, edited or moved."""
+    if not created and not hasattr(instance, "_loaded_cost"):
+        return
+    deltas = defaultdict(Decimal)
+    deltas[instance.campaign_id] += instance.cost
+    if not created:
+        deltas[instance._loaded_campaign_id] -= instance._loaded_cost
+    Campaign.objects.adjust_budgets("allocated_budget", deltas)
+    instance._loaded_campaign_id = instance.campaign_id
+    instance._loaded_cost = instance.cost
+
+
+@receiver(post_delete, sender=Task)
+def update_allocated_budget_on_task_delete(sender, instance, **kwargs):
+    campaign_id = getattr(instance, "_loaded_campaign_id", instance.campaign_id)
+    cost = getattr(instance, "_loaded_cost", instance.cost)
+    Campaign.objects.adjust_budgets("allocated_budget", {campaign_id: -cost})
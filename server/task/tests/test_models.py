@@ -7,6 +7,9 @@ from campaign.models import Campaign
 from dao.models import DAO
 from submission.models import Submission  # For signal testing context
 from core.models import User  # For Submission.user
+from unittest.mock import patch
+from campaign.progress import flush_dirty_campaigns
+from utils.redis_client import get_redis_client
 
 
 class TaskModelTests(TestCase):
@@ -25,6 +28,12 @@ class TaskModelTests(TestCase):
             username="task_test",
         )
 
+    def setUp(self):
+        get_redis_client().flushdb()
+        patcher = patch("celery_tasks.tasks.flush_campaign_progress.apply_async")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
     def test_task_creation_minimal(self):
         task = Task.objects.create(
             campaign=self.campaign,
@@ -62,6 +71,59 @@ class TaskModelTests(TestCase):
         self.assertEqual(task.deadline, deadline_time)
         self.assertEqual(task.status, 1)
 
+    def test_reserve_slot_closes_task_on_last_slot(self):
+        task = Task.objects.create(
+            campaign=self.campaign, description="Slots", type=1, reward=1, quantity=2
+        )
+        with self.assertNumQueries(1):
+            self.assertTrue(Task.objects.reserve_slot(task.pk))
+        task.refresh_from_db()
+        self.assertEqual((task.filled, task.status), (1, 1))
+
+        self.assertTrue(Task.objects.reserve_slot(task.pk))
+        task.refresh_from_db()
+        self.assertEqual((task.filled, task.status), (2, 2))  # Completed
+
+        self.assertFalse(Task.objects.reserve_slot(task.pk))
+        task.refresh_from_db()
+        self.assertEqual(task.filled, 2)
+
+    def test_released_slot_reopens_only_tasks_closed_by_their_last_slot(self):
+        task = Task.objects.create(
+            campaign=self.campaign, description="Slots", type=1, reward=1, quantity=1
+        )
+        self.assertTrue(Task.objects.reserve_slot(task.pk))
+        Task.objects.release_slots({task.pk: 1})
+        task.refresh_from_db()
+        self.assertEqual((task.filled, task.status), (0, 1))
+
+        # Retaking is capped at the quantity like a reservation
+        self.assertTrue(Task.objects.retake_slot(task.pk))
+        self.assertFalse(Task.objects.retake_slot(task.pk))
+        task.refresh_from_db()
+        self.assertEqual((task.filled, task.status), (1, 2))
+
+        # Closed by hand: a released slot leaves it closed
+        task.status = 1
+        task.save()
+        task.status = 2
+        task.save()
+        Task.objects.release_slots({task.pk: 1})
+        task.refresh_from_db()
+        self.assertEqual((task.filled, task.status), (0, 2))
+
+    def test_full_save_keeps_slot_counters(self):
+        task = Task.objects.create(
+            campaign=self.campaign, description="Slots", type=1, reward=1, quantity=1
+        )
+        stale = Task.objects.get(pk=task.pk)
+        self.assertTrue(Task.objects.reserve_slot(task.pk))
+
+        stale.description = "Edited"
+        stale.save()
+        task.refresh_from_db()
+        self.assertEqual((task.description, task.filled, task.status), ("Edited", 1, 2))
+
     # Signal tests: Test the effect of campaign.update_progress() being called
     # These tests indirectly verify the signals are connected and call update_progress.
     # The direct logic of update_progress is tested in campaign.tests.test_models.
@@ -81,14 +143,16 @@ class TaskModelTests(TestCase):
         self.campaign.progress = Decimal("0.0")  # Reset for clarity
         self.campaign.save()
 
-        Task.objects.create(
-            campaign=self.campaign,
-            description="Signal Test Task Create",
-            type=1,
-            reward=10,
-            quantity=10,
-        )
-        # After task creation, campaign.update_progress() is called by the signal.
+        with self.captureOnCommitCallbacks(execute=True):
+            Task.objects.create(
+                campaign=self.campaign,
+                description="Signal Test Task Create",
+                type=1,
+                reward=10,
+                quantity=10,
+            )
+        flush_dirty_campaigns()
+        # After task creation, the signal queues campaign.update_progress().
         # If there are no submissions for any tasks in this campaign, progress remains 0.
         self.campaign.refresh_from_db()
         self.assertEqual(
@@ -111,9 +175,11 @@ class TaskModelTests(TestCase):
         self.assertEqual(campaign2.progress, Decimal("50.0"))
 
         # 2. Now add a new task to campaign2. Progress should be re-calculated.
-        Task.objects.create(
-            campaign=campaign2, description="T New", type=1, reward=10, quantity=3
-        )
+        with self.captureOnCommitCallbacks(execute=True):
+            Task.objects.create(
+                campaign=campaign2, description="T New", type=1, reward=10, quantity=3
+            )
+        flush_dirty_campaigns()
         # New total quantity = 2 + 3 = 5. Completed = 1. Progress = (1/5)*100 = 20.0
         campaign2.refresh_from_db()
         self.assertEqual(campaign2.progress, Decimal("20.0"))
@@ -136,8 +202,10 @@ class TaskModelTests(TestCase):
         campaign.update_progress()  # Initial progress: (1 approved / (2+3) total quantity) * 100 = (1/5)*100 = 20.0
         self.assertEqual(campaign.progress, Decimal("20.0"))
 
-        task2.delete()  # Deleting task2, which had quantity 3 and 0 approved submissions.
-        # campaign.update_progress() is called by the signal.
+        with self.captureOnCommitCallbacks(execute=True):
+            task2.delete()  # Deleting task2, which had quantity 3 and 0 approved submissions.
+        flush_dirty_campaigns()
+        # campaign.update_progress() is queued by the signal.
         # New total quantity = 2 (from task1). Completed = 1 (from task1).
         # Progress = (1/2)*100 = 50.0
         campaign.refresh_from_db()
@@ -164,7 +232,9 @@ class TaskModelTests(TestCase):
         self.assertEqual(campaign.progress, Decimal("50.0"))
 
         task.quantity = 4  # Change quantity
-        task.save()  # This triggers the post_save signal, calling campaign.update_progress()
+        with self.captureOnCommitCallbacks(execute=True):
+            task.save()  # post_save queues campaign.update_progress()
+        flush_dirty_campaigns()
 
         # New total quantity = 4. Completed = 1. Progress = (1/4)*100 = 25.0
         campaign.refresh_from_db()
@@ -16,6 +16,7 @@ from dao.models import DAO
 from submission.models import Submission  # For submissions_count
 from core.models import User
 from rest_framework.test import APIRequestFactory  # Import APIRequestFactory
+from rest_framework.exceptions import ValidationError
 
 
 class TaskSerializerTests(TestCase):
@@ -333,6 +334,29 @@ class TaskCreateSerializerTests(TestCase):
             str(serializer.errors["non_field_errors"]),
         )
 
+    def test_create_task_rechecks_budget_under_lock(self):
+        data = {
+            "description": "Racing Task",
+            "type": 1,
+            "reward": "100.00",
+            "quantity": 3,
+            "campaign": self.campaign.id,
+        }
+        request = self.factory.post("/")
+        request.user = self.creator_user
+        serializer = self.serializer_class(data=data, context={"request": request})
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+
+        # A concurrent create takes most of the budget after validation passed
+        Task.objects.create(
+            campaign=self.campaign, description="Other", reward=100, quantity=3
+        )
+        with self.assertRaises(ValidationError):
+            serializer.save()
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.allocated_budget, Decimal("300.00"))
+        self.assertEqual(self.campaign.tasks.count(), 1)
+
     def test_create_task_negative_reward_or_quantity(self):
         data_negative_reward = {
             "description": "Negative Reward Task",
@@ -12,6 +12,7 @@ from campaign.models import Campaign
 from dao.models import DAO
 from submission.models import Submission  # For submissions_count context
 from core.models import User  # For submissions
+from django.core.cache import cache
 
 
 class TaskViewTests(APITestCase):
@@ -163,6 +164,10 @@ class TaskViewTests(APITestCase):
         self.assertNotIn(self.task4_c2_ongoing.id, task_ids_in_response)
         self.assertNotIn(self.task3_c2_completed.id, task_ids_in_response)
 
+    def setUp(self):
+        # Favorite DAO sets are cached per user id, which repeats across runs
+        cache.clear()
+
     def test_list_tasks_is_from_favorite_dao_authenticated(self):
         self.client.force_authenticate(user=self.favorite_dao_user)
         response = self.client.get(self.list_url)
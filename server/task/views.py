@@ -11,7 +11,10 @@ from drf_spectacular.types import OpenApiTypes  # Added
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from django.db.models import Count, Case, When, Value, BooleanField, Avg, Sum, F
 from utils.exception_handler import ErrorHandlingMixin
+from utils.conditional import ConditionalGetMixin
+from utils.edge_cache import EdgeCacheMixin
 from utils.pagination import TenResultsSetPagination
+from dao.favorites import get_favorite_dao_ids
 
 
 @extend_schema(
@@ -73,9 +76,13 @@ from utils.pagination import TenResultsSetPagination
         )
     },
 )
-class TaskView(ErrorHandlingMixin, generics.ListAPIView):
+class TaskView(
+    ConditionalGetMixin, EdgeCacheMixin, ErrorHandlingMixin, generics.ListAPIView
+):
 
     serializer_class = TaskSerializer
+    etag_versions = ("task", "submission", "campaign", "dao", "favorite")
+    surrogate_keys = ("task", "submission", "campaign", "dao")
     permission_classes = [AllowAny]
     pagination_class = TenResultsSetPagination  # Apply pagination
 
@@ -94,7 +101,7 @@ class TaskView(ErrorHandlingMixin, generics.ListAPIView):
 
         user = self.request.user
         if user.is_authenticated and hasattr(user, "favorite_daos"):
-            favorite_dao_ids = list(user.favorite_daos.values_list("id", flat=True))
+            favorite_dao_ids = list(get_favorite_dao_ids(self.request))
             queryset = queryset.annotate(
                 is_from_favorite_dao=Case(
                     When(campaign__dao_id__in=favorite_dao_ids, then=Value(True)),
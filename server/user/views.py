@@ -154,7 +154,8 @@ class ToggleFavoriteDAOView(ErrorHandlingMixin, APIView):
                 {"detail": "DAO not found."}, status=status.HTTP_404_NOT_FOUND
             )
 
-        if dao in user.favorite_daos.all():
+        # The request-scoped favorite set may be cached; decide on the stored row
+        if user.favorite_daos.filter(pk=dao.pk).exists():
             user.favorite_daos.remove(dao)
             action = "unfavorited"
         else:
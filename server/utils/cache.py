@@ -0,0 +1,76 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from django.core.cache import cache
+from django.db import connections
+
+
+def get_or_compute(key, compute, ttl, stale_ttl=300, lock_timeout=30):
+    """
+    Single-flight, stale-while-revalidate read-through cache.
+
+    Values are fresh for `ttl` seconds and kept `stale_ttl` seconds longer. When
+    an entry goes stale, the first caller to take the lock recomputes it while
+    everyone else keeps getting the stale value; when there is no entry at all,
+    callers that lose the lock wait briefly for the winner instead of piling
+    onto the database.
+    """
+    entry = cache.get(key)
+    if entry is not None and entry["fresh_until"] > time.time():
+        return entry["value"]
+
+    lock_key = f"{key}:lock"
+    if cache.add(lock_key, 1, timeout=lock_timeout):
+        try:
+            value = compute()
+            cache.set(
+                key,
+                {"value": value, "fresh_until": time.time() + ttl},
+                timeout=ttl + stale_ttl,
+            )
+            return value
+        finally:
+            cache.delete(lock_key)
+
+    if entry is not None:
+        return entry["value"]
+
+    deadline = time.time() + lock_timeout
+    while time.time() < deadline:
+        time.sleep(0.05)
+        entry = cache.get(key)
+        if entry is not None:
+            return entry["value"]
+    # The lock holder died or is far too slow; don't fail the request over it
+    return compute()
+
+
+def _compute_in_thread(key, compute, ttl, stale_ttl):
+    try:
+        return get_or_compute(key, compute, ttl, stale_ttl)
+    finally:
+        # Each worker thread opened its own database connection
+        connections.close_all()
+
+
+def get_many_or_compute(computes, ttl, stale_ttl=300, max_workers=4):
+    """
+    Batch form of `get_or_compute` for a dict of cache key -> callable.
+
+    Fresh entries are read in a single round trip; the remaining ones are
+    computed concurrently, each still behind its own single-flight lock.
+    """
+    now = time.time()
+    values = {
+        key: entry["value"]
+        for key, entry in cache.get_many(list(computes)).items()
+        if entry["fresh_until"] > now
+    }
+    missing = [key for key in computes if key not in values]
+    if missing:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(missing))) as pool:
+            futures = {
+                key: pool.submit(_compute_in_thread, key, computes[key], ttl, stale_ttl)
+                for key in missing
+            }
+        values.update({key: future.result() for key, future in futures.items()})
+    return values
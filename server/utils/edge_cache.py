@@ -0,0 +1,136 @@
+import logging
+import time
+import requests
+from django.conf import settings
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from kombu.exceptions import OperationalError
+from redis.exceptions import RedisError
+from utils.redis_client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+# url -> time it was last cached, per surrogate key
+SURROGATE_KEY_URLS = "edge_cache:recent_urls:{key}"
+DIRTY_KEYS_KEY = "edge_cache:dirty"
+PURGE_SCHEDULED_KEY = "edge_cache:purge_scheduled"
+# URLs are remembered well past any s-maxage so purges never miss an entry
+SURROGATE_KEY_TTL = 60 * 60 * 24
+# Query strings make the URL space caller-controlled, so only the most recently
+# cached URLs are kept per key; older variants are left to expire at the edge.
+SURROGATE_KEY_MAX_URLS = 200
+
+
+class EdgeCacheMixin:
+    """
+    Lets nginx's api_cache zone micro-cache anonymous JSON responses.
+
+    Successful anonymous GETs get `Cache-Control: public, s-maxage=...` and a
+    `Surrogate-Key` header listing `surrogate_keys`, and their URL is recorded
+    under each key so `purge_surrogate_keys` can refresh exactly those entries.
+    Everything else is marked private. The keys are the data version names
+    from utils.conditional, which are bumped by the same write paths.
+    """
+
+    edge_cache_seconds = 30
+    surrogate_keys = ()
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if request.method not in ("GET", "HEAD") or response.status_code != 200:
+            return response
+
+        # The browsable API shares URLs with the JSON responses, so only the
+        # latter are ever cached at the edge.
+        renderer = getattr(request, "accepted_renderer", None)
+        if (
+            request.user.is_authenticated
+            or "Authorization" in request.headers
+            or getattr(renderer, "format", None) != "json"
+        ):
+            patch_cache_control(response, private=True)
+            return response
+
+        patch_cache_control(
+            response,
+            public=True,
+            max_age=0,
+            s_maxage=self.edge_cache_seconds,
+            stale_while_revalidate=self.edge_cache_seconds,
+        )
+        patch_vary_headers(response, ["Authorization"])
+        if self.surrogate_keys:
+            response["Surrogate-Key"] = " ".join(self.surrogate_keys)
+            register_cached_url(request.get_full_path(), self.surrogate_keys)
+        return response
+
+
+def register_cached_url(url, keys):
+    now = time.time()
+    try:
+        pipe = get_redis_client().pipeline(transaction=False)
+        for key in keys:
+            urls_key = SURROGATE_KEY_URLS.format(key=key)
+            pipe.zadd(urls_key, {url: now})
+            pipe.zremrangebyrank(urls_key, 0, -SURROGATE_KEY_MAX_URLS - 1)
+            pipe.expire(urls_key, SURROGATE_KEY_TTL)
+        pipe.execute()
+    except RedisError as e:
+        logger.warning("Could not register %s under surrogate keys: %s", url, e)
+
+
+def purge_surrogate_keys(keys):
+    """
+    Queues an edge purge of every URL tagged with `keys`. Purges are batched:
+    one Celery task per EDGE_CACHE_PURGE_DELAY_SECONDS handles all of them.
+    Called after commit (see utils.conditional.bump_data_version).
+    """
+    if not settings.EDGE_CACHE_PURGE_URL:
+        return
+    try:
+        client = get_redis_client()
+        client.sadd(DIRTY_KEYS_KEY, *keys)
+        delay = settings.EDGE_CACHE_PURGE_DELAY_SECONDS
+        if client.set(PURGE_SCHEDULED_KEY, 1, nx=True, ex=max(delay * 6, 30)):
+            from celery_tasks.tasks import purge_edge_cache
+
+            try:
+                purge_edge_cache.apply_async(countdown=delay)
+            except OperationalError:
+                client.delete(PURGE_SCHEDULED_KEY)
+                raise
+    except (RedisError, OperationalError) as e:
+        # Entries still expire on their own after edge_cache_seconds
+        logger.warning("Could not queue edge cache purge for %s: %s", keys, e)
+
+
+def flush_edge_purges() -> int:
+    """
+    Refreshes every cached URL tagged with a dirty surrogate key through the
+    local purge endpoint. Returns the number of URLs purged.
+    """
+    client = get_redis_client()
+    client.delete(PURGE_SCHEDULED_KEY)
+
+    keys = client.spop(DIRTY_KEYS_KEY, 1000) or []
+    urls = set()
+    for key in keys:
+        urls_key = SURROGATE_KEY_URLS.format(key=key)
+        pipe = client.pipeline()
+        pipe.zrange(urls_key, 0, -1)
+        pipe.delete(urls_key)
+        members, _ = pipe.execute()
+        urls.update(members)
+
+    purged = 0
+    for url in urls:
+        try:
+            # The purge endpoint bypasses and overwrites the cached entry
+            requests.get(
+                f"{settings.EDGE_CACHE_PURGE_URL}{url}",
+                headers={"Accept": "application/json"},
+                timeout=5,
+            )
+            purged += 1
+        except requests.RequestException as e:
+            logger.warning("Edge cache purge of %s failed: %s", url, e)
+    return purged
@@ -1,4 +1,4 @@
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import CursorPagination, PageNumberPagination
 
 
 class StandardResultsSetPagination(PageNumberPagination):
@@ -17,3 +17,41 @@ class DAOResultsSetPagination(PageNumberPagination):
     page_size = 12
     page_size_query_param = "page_size"  # Allow overriding via query param if needed
     max_page_size = 96  # Optional: Set a reasonable max page size
+
+
+class CreatedAtCursorPagination(CursorPagination):
+    """
+    Keyset pagination on (created_at, id), newest first. Pages are located by
+    seeking on the index instead of OFFSET, and no total COUNT(*) is run.
+    """
+
+    page_size = 10
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    ordering = ("-created_at", "-id")
+
+    def get_ordering(self, request, queryset, view):
+        ordering = tuple(super().get_ordering(request, queryset, view))
+        # A view's ?ordering= replaces the whole tuple; keep rows with equal
+        # timestamps in a stable order by appending the id in the same direction
+        if not any(field.lstrip("-") == "id" for field in ordering):
+            ordering += ("-id" if ordering[0].startswith("-") else "id",)
+        return ordering
+
+
+class OptionalCursorPaginationMixin:
+    """
+    Lets list views opt into cursor pagination with `?pagination=cursor` while
+    keeping their page-number pagination as the default.
+    """
+
+    cursor_pagination_class = CreatedAtCursorPagination
+
+    @property
+    def paginator(self):
+        if not hasattr(self, "_paginator"):
+            if self.request.query_params.get("pagination") == "cursor":
+                self._paginator = self.cursor_pagination_class()
+            else:
+                return super().paginator
+        return self._paginator